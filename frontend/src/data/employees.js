@@ -1,35 +1,69 @@
-import { createResource } from "frappe-ui"
+import router from "@/router"
+import { call } from "frappe-ui"
 import { reactive } from "vue"
 import { employeeResource } from "./employee"
 
+const EMPLOYEE_FIELDS = ["employee_name", "user_id", "image", "status"]
+
 let employeesByID = reactive({})
 let employeesByUserID = reactive({})
 
-export const employees = createResource({
-	url: "hrms.api.get_all_employees",
-	auto: true,
-	transform(data) {
-		return data.map((employee) => {
+// employees and users shown since the last fetch, looked up together in one call
+let queue = { employees: new Set(), user_ids: new Set() }
+let requested = new Set()
+let fetchScheduled = false
+
+function queueLookup(key, value) {
+	if (!value || requested.has(`${key}:${value}`)) return
+
+	requested.add(`${key}:${value}`)
+	queue[key].add(value)
+	if (!fetchScheduled) {
+		fetchScheduled = true
+		setTimeout(fetchQueuedEmployees)
+	}
+}
+
+async function fetchQueuedEmployees() {
+	const params = {
+		fields: EMPLOYEE_FIELDS,
+		employees: [...queue.employees],
+		user_ids: [...queue.user_ids],
+		page_length: 500,
+	}
+	queue = { employees: new Set(), user_ids: new Set() }
+	fetchScheduled = false
+
+	let cursor = null
+	do {
+		let page
+		try {
+			page = await call("hrms.api.get_employee_directory", { ...params, cursor })
+		} catch (error) {
+			if (error && error.exc_type === "AuthenticationError") {
+				router.push({ name: "Login" })
+			}
+			return
+		}
+
+		page.data.forEach((employee) => {
 			employee.isActive = employee.status === "Active"
 			employeesByID[employee.name] = employee
-			employeesByUserID[employee.user_id] = employee
-
-			return employee
+			if (employee.user_id) employeesByUserID[employee.user_id] = employee
 		})
-	},
-	onError(error) {
-		if (error && error.exc_type === "AuthenticationError") {
-			router.push({ name: "Login" })
-		}
-	},
-})
+		cursor = page.next_cursor
+	} while (cursor)
+}
 
 export function getEmployeeInfo(employeeID) {
 	if (!employeeID) employeeID = employeeResource.data.name
+	if (!employeesByID[employeeID]) queueLookup("employees", employeeID)
 
 	return employeesByID[employeeID]
 }
 
 export function getEmployeeInfoByUserID(userID) {
+	if (!employeesByUserID[userID]) queueLookup("user_ids", userID)
+
 	return employeesByUserID[userID]
 }
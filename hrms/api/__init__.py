@@ -1,12 +1,47 @@
+import hashlib
+
 import frappe
 from frappe import _
 from frappe.model import get_permitted_fields
 from frappe.model.workflow import get_workflow_name
 from frappe.query_builder import Order
-from frappe.utils import add_days, date_diff, getdate, strip_html
+from frappe.utils import (
+	add_days,
+	cint,
+	date_diff,
+	get_datetime,
+	get_first_day,
+	get_last_day,
+	getdate,
+	now_datetime,
+	strip_html,
+)
 
 from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
 
+from hrms.hr.doctype.department_approver.department_approver import (
+	get_default_department_approver,
+	get_department_approvers,
+)
+
+HOME_DASHBOARD = "hrms:home_dashboard"
+HOME_DASHBOARD_TTL = 60 * 60
+EMPLOYEE_DIRECTORY = "hrms:employee_directory"
+
+DIRECTORY_FIELDS = [
+	"name",
+	"employee_name",
+	"designation",
+	"department",
+	"company",
+	"reports_to",
+	"user_id",
+	"image",
+	"status",
+	"modified",
+]
+DIRECTORY_SEARCH_FIELDS = ["name", "employee_name", "designation", "department"]
+
 SUPPORTED_FIELD_TYPES = [
 	"Link",
 	"Select",
@@ -61,21 +96,201 @@ def get_current_employee_info() -> dict:
 
 @frappe.whitelist()
 def get_all_employees() -> list[dict]:
-	return frappe.get_all(
+	return [
+		{field: value for field, value in zip(DIRECTORY_FIELDS, row, strict=True) if field != "modified"}
+		for row in get_employee_directory_snapshot()
+	]
+
+
+@frappe.whitelist()
+def get_employee_directory(
+	search: str | None = None,
+	fields: list[str] | str | None = None,
+	cursor: str | None = None,
+	page_length: int = 50,
+	modified_since: str | None = None,
+	company: str | None = None,
+	employees: list[str] | str | None = None,
+	user_ids: list[str] | str | None = None,
+) -> dict:
+	"""
+	Returns a page of the employee directory from a cached snapshot of all employees.
+
+	- `search` matches the ID, name, designation or department (case insensitive)
+	- `fields` projects the rows to the given subset of directory fields (`name` is always included)
+	- `cursor` is the `next_cursor` of the previous page
+	- `modified_since` only returns employees modified after the given timestamp along with the
+	  IDs of employees deleted since then, for incremental syncs
+	- `employees` and `user_ids` only return the given employees and the employees of the given users,
+	  for looking up the employees shown on a screen
+	"""
+	if isinstance(fields, str):
+		fields = frappe.parse_json(fields)
+	if isinstance(employees, str):
+		employees = frappe.parse_json(employees)
+	if isinstance(user_ids, str):
+		user_ids = frappe.parse_json(user_ids)
+
+	fields = ["name", *(field for field in (fields or DIRECTORY_FIELDS) if field in DIRECTORY_FIELDS)]
+	fields = list(dict.fromkeys(fields))
+	indexes = [DIRECTORY_FIELDS.index(field) for field in fields]
+	page_length = min(cint(page_length) or 50, 500)
+
+	name_idx, modified_idx, company_idx, user_idx = (
+		DIRECTORY_FIELDS.index("name"),
+		DIRECTORY_FIELDS.index("modified"),
+		DIRECTORY_FIELDS.index("company"),
+		DIRECTORY_FIELDS.index("user_id"),
+	)
+	lookup = bool(employees or user_ids)
+	employees, user_ids = set(employees or ()), set(user_ids or ())
+	search_indexes = [DIRECTORY_FIELDS.index(field) for field in DIRECTORY_SEARCH_FIELDS]
+	search = (search or "").strip().lower()
+	modified_since = get_datetime(modified_since) if modified_since else None
+
+	rows, next_cursor = [], None
+	# snapshot is sorted by name, so the cursor is the last name of the previous page
+	for row in get_employee_directory_snapshot():
+		if cursor and row[name_idx] <= cursor:
+			continue
+		if company and row[company_idx] != company:
+			continue
+		if lookup and row[name_idx] not in employees and row[user_idx] not in user_ids:
+			continue
+		if modified_since and row[modified_idx] <= modified_since:
+			continue
+		if search and not any(search in (row[idx] or "").lower() for idx in search_indexes):
+			continue
+
+		if len(rows) == page_length:
+			next_cursor = rows[-1]["name"]
+			break
+		rows.append({field: row[idx] for field, idx in zip(fields, indexes, strict=True)})
+
+	response = {"data": rows, "next_cursor": next_cursor, "server_time": now_datetime()}
+	if modified_since:
+		response["deleted"] = frappe.get_all(
+			"Deleted Document",
+			filters={"deleted_doctype": "Employee", "creation": (">", modified_since)},
+			pluck="deleted_name",
+		)
+
+	return response
+
+
+def get_employee_directory_snapshot() -> list[tuple]:
+	"""Returns all employees as compact tuples of `DIRECTORY_FIELDS` sorted by name,
+	cached until an Employee is updated or deleted"""
+
+	def _get_snapshot():
+		employees = frappe.get_all("Employee", fields=DIRECTORY_FIELDS, as_list=True)
+		return sorted((tuple(row) for row in employees), key=lambda row: row[0])
+
+	return frappe.cache().get_value(EMPLOYEE_DIRECTORY, generator=_get_snapshot)
+
+
+def invalidate_employee_directory(doc, method=None):
+	frappe.cache().delete_value(EMPLOYEE_DIRECTORY)
+
+
+# Home Dashboard
+@frappe.whitelist()
+def get_home_dashboard(
+	employee: str | None = None,
+	from_date: str | None = None,
+	to_date: str | None = None,
+	etag: str | None = None,
+) -> dict:
+	"""
+	Returns the data for the PWA home screen in a single call, cached per employee and invalidated
+	when the underlying documents change. Pass the `etag` of the last response (or send it as the
+	If-None-Match header) to skip the payload when nothing has changed.
+	"""
+	if employee:
+		frappe.has_permission("Employee", doc=employee, throw=True)
+	else:
+		employee = frappe.db.get_value("Employee", {"user_id": frappe.session.user, "status": "Active"})
+		if not employee:
+			frappe.throw(_("No active employee found for the current user"), frappe.DoesNotExistError)
+
+	from_date = getdate(from_date or get_first_day(getdate()))
+	to_date = getdate(to_date or get_last_day(getdate()))
+
+	cache_key = f"{HOME_DASHBOARD}:{employee}"
+	field = f"{getdate()}|{from_date}|{to_date}"
+	cached = frappe.cache().get_value(cache_key) or {}
+
+	if not (dashboard := cached.get(field)):
+		data = get_home_dashboard_data(employee, from_date, to_date)
+		dashboard = {
+			"etag": hashlib.md5(frappe.as_json(data).encode(), usedforsecurity=False).hexdigest(),
+			"data": data,
+		}
+		cached[field] = dashboard
+		frappe.cache().set_value(cache_key, cached, expires_in_sec=HOME_DASHBOARD_TTL)
+
+	etag = etag or (frappe.get_request_header("If-None-Match") or "").strip('"')
+	if etag == dashboard["etag"]:
+		return {"etag": etag, "modified": False}
+
+	return {"etag": dashboard["etag"], "modified": True, "data": dashboard["data"]}
+
+
+def get_home_dashboard_data(employee: str, from_date, to_date) -> dict:
+	employee_info = frappe.db.get_value(
 		"Employee",
-		fields=[
+		employee,
+		[
 			"name",
+			"first_name",
 			"employee_name",
 			"designation",
 			"department",
 			"company",
 			"reports_to",
 			"user_id",
-			"image",
-			"status",
 		],
-		limit=999999,
+		as_dict=True,
 	)
+	holiday_list = get_holiday_list_for_employee(employee, raise_exception=False)
+
+	return {
+		"employee": employee_info,
+		"leave_balance": get_leave_balance_map(employee),
+		"holidays": get_holidays(holiday_list),
+		"expense_claim_summary": get_expense_claim_summary(employee, employee_info.company),
+		"employee_advance_balance": get_employee_advance_balance(employee),
+		"unread_notifications_count": frappe.db.count(
+			"PWA Notification", {"to_user": employee_info.user_id, "read": 0}
+		)
+		if employee_info.user_id
+		else 0,
+		"attendance_calendar_events": build_attendance_calendar_events(
+			employee, from_date, to_date, holiday_list
+		),
+	}
+
+
+def invalidate_home_dashboard(doc, method=None):
+	if doc.doctype == "Holiday List":
+		frappe.cache().delete_keys(HOME_DASHBOARD)
+		return
+
+	if doc.doctype == "Employee":
+		employee = doc.name
+	elif doc.doctype == "PWA Notification":
+		employee = frappe.db.get_value("Employee", {"user_id": doc.to_user})
+	else:
+		employee = doc.get("employee")
+
+	if employee:
+		clear_home_dashboard([employee])
+
+
+def clear_home_dashboard(employees: list | set) -> None:
+	"""Clears cached dashboards of the employees, for paths writing their data directly to the db"""
+	for employee in set(employees):
+		frappe.cache().delete_value(f"{HOME_DASHBOARD}:{employee}")
 
 
 # HR Settings
@@ -107,6 +322,9 @@ def mark_all_notifications_as_read() -> None:
 		update_modified=False,
 	)
 
+	if employee := frappe.db.get_value("Employee", {"user_id": frappe.session.user}):
+		frappe.cache().delete_value(f"{HOME_DASHBOARD}:{employee}")
+
 
 @frappe.whitelist()
 def are_push_notifications_enabled() -> bool:
@@ -120,7 +338,13 @@ def are_push_notifications_enabled() -> bool:
 # Attendance
 @frappe.whitelist()
 def get_attendance_calendar_events(employee: str, from_date: str, to_date: str) -> dict[str, str]:
-	holidays = get_holidays_for_calendar(employee, from_date, to_date)
+	return build_attendance_calendar_events(employee, from_date, to_date)
+
+
+def build_attendance_calendar_events(
+	employee: str, from_date: str, to_date: str, holiday_list: str | None = None
+) -> dict[str, str]:
+	holidays = get_holidays_for_calendar(employee, from_date, to_date, holiday_list)
 	attendance = get_attendance_for_calendar(employee, from_date, to_date)
 	events = {}
 
@@ -145,8 +369,10 @@ def get_attendance_for_calendar(employee: str, from_date: str, to_date: str) ->
 	return {d["attendance_date"]: d["status"] for d in attendance}
 
 
-def get_holidays_for_calendar(employee: str, from_date: str, to_date: str) -> list[str]:
-	if holiday_list := get_holiday_list_for_employee(employee, raise_exception=False):
+def get_holidays_for_calendar(
+	employee: str, from_date: str, to_date: str, holiday_list: str | None = None
+) -> list[str]:
+	if holiday_list := holiday_list or get_holiday_list_for_employee(employee, raise_exception=False):
 		return frappe.get_all(
 			"Holiday",
 			filters={"parent": holiday_list, "holiday_date": ["between", [from_date, to_date]]},
@@ -275,11 +501,7 @@ def get_shift_request_approvers(employee: str) -> str | list[str]:
 	if department:
 		department_approvers = get_department_approvers(department, "shift_request_approver")
 		if not shift_request_approver:
-			shift_request_approver = frappe.db.get_value(
-				"Department Approver",
-				{"parent": department, "parentfield": "shift_request_approver", "idx": 1},
-				"approver",
-			)
+			shift_request_approver = get_default_department_approver(department, "shift_request_approver")
 
 	shift_request_approver_name = frappe.db.get_value("User", shift_request_approver, "full_name", cache=True)
 
@@ -392,7 +614,10 @@ def get_leave_balance_map(employee: str) -> dict[str, dict[str, float]]:
 
 @frappe.whitelist()
 def get_holidays_for_employee(employee: str) -> list[dict]:
-	holiday_list = get_holiday_list_for_employee(employee, raise_exception=False)
+	return get_holidays(get_holiday_list_for_employee(employee, raise_exception=False))
+
+
+def get_holidays(holiday_list: str | None) -> list[dict]:
 	if not holiday_list:
 		return []
 
@@ -418,12 +643,8 @@ def get_leave_approval_details(employee: str) -> dict:
 		["leave_approver", "department"],
 	)
 
-	if not leave_approver and department:
-		leave_approver = frappe.db.get_value(
-			"Department Approver",
-			{"parent": department, "parentfield": "leave_approvers", "idx": 1},
-			"approver",
-		)
+	if not leave_approver:
+		leave_approver = get_default_department_approver(department, "leave_approvers")
 
 	leave_approver_name = frappe.db.get_value("User", leave_approver, "full_name", cache=True)
 	department_approvers = get_department_approvers(department, "leave_approvers")
@@ -441,34 +662,6 @@ def get_leave_approval_details(employee: str) -> dict:
 	)
 
 
-def get_department_approvers(department: str, parentfield: str) -> list[str]:
-	if not department:
-		return []
-
-	department_details = frappe.db.get_value("Department", department, ["lft", "rgt"], as_dict=True)
-	departments = frappe.get_all(
-		"Department",
-		filters={
-			"lft": ("<=", department_details.lft),
-			"rgt": (">=", department_details.rgt),
-			"disabled": 0,
-		},
-		pluck="name",
-	)
-
-	Approver = frappe.qb.DocType("Department Approver")
-	User = frappe.qb.DocType("User")
-	department_approvers = (
-		frappe.qb.from_(User)
-		.join(Approver)
-		.on(Approver.approver == User.name)
-		.select(User.name.as_("name"), User.full_name.as_("full_name"))
-		.where((Approver.parent.isin(departments)) & (Approver.parentfield == parentfield))
-	).run(as_dict=True)
-
-	return department_approvers
-
-
 @frappe.whitelist()
 def get_leave_types(employee: str, date: str) -> list:
 	from hrms.hr.doctype.leave_application.leave_application import get_leave_details
@@ -526,7 +719,7 @@ def get_expense_claims(
 
 
 @frappe.whitelist()
-def get_expense_claim_summary(employee: str) -> dict:
+def get_expense_claim_summary(employee: str, company: str | None = None) -> dict:
 	from frappe.query_builder.functions import Sum
 
 	Claim = frappe.qb.DocType("Expense Claim")
@@ -565,7 +758,7 @@ def get_expense_claim_summary(employee: str) -> dict:
 		.where((Claim.docstatus != 2) & (Claim.employee == employee))
 	).run(as_dict=True)[0]
 
-	currency = frappe.db.get_value("Company", summary.company, "default_currency")
+	currency = frappe.db.get_value("Company", summary.company or company, "default_currency", cache=True)
 	summary["currency"] = currency
 
 	return summary
@@ -591,12 +784,8 @@ def get_expense_approval_details(employee: str) -> dict:
 		["expense_approver", "department"],
 	)
 
-	if not expense_approver and department:
-		expense_approver = frappe.db.get_value(
-			"Department Approver",
-			{"parent": department, "parentfield": "expense_approvers", "idx": 1},
-			"approver",
-		)
+	if not expense_approver:
+		expense_approver = get_default_department_approver(department, "expense_approvers")
 
 	expense_approver_name = frappe.db.get_value("User", expense_approver, "full_name", cache=True)
 	department_approvers = get_department_approvers(department, "expense_approvers")
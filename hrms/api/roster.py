@@ -4,6 +4,7 @@ from frappe.utils import add_days, date_diff
 
 from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
 
+from hrms.hr.doctype.employee_checkin.geofence import clear_employee_geofences
 from hrms.hr.doctype.shift_assignment.shift_assignment import ShiftAssignment
 from hrms.hr.doctype.shift_assignment_tool.shift_assignment_tool import create_shift_assignment
 from hrms.hr.doctype.shift_schedule.shift_schedule import get_or_insert_shift_schedule
@@ -72,12 +73,8 @@ def create_shift_schedule_assignment(
 		}
 	).insert()
 
-	if not end_date or date_diff(end_date, start_date) <= 90:
-		return shift_schedule_assignment.create_shifts(start_date, end_date)
-
-	frappe.enqueue(
-		shift_schedule_assignment.create_shifts, timeout=4500, start_date=start_date, end_date=end_date
-	)
+	# schedule blocks are computed upfront and inserted in bulk, so long ranges don't need a background job
+	shift_schedule_assignment.create_shifts(start_date, end_date)
 
 
 @frappe.whitelist()
@@ -189,9 +186,11 @@ def insert_shift(
 			frappe.db.set_value("Shift Assignment", next_shift, "docstatus", 2)
 			frappe.delete_doc("Shift Assignment", next_shift)
 		frappe.db.set_value("Shift Assignment", prev_shift, "end_date", end_date or None)
+		clear_employee_geofences([employee])
 
 	elif next_shift:
 		frappe.db.set_value("Shift Assignment", next_shift, "start_date", start_date)
+		clear_employee_geofences([employee])
 
 	else:
 		create_shift_assignment(employee, company, shift_type, start_date, end_date, status, shift_location)
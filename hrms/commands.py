@@ -0,0 +1,24 @@
+import click
+
+from frappe.commands import get_site, pass_context
+
+
+@click.command("rebuild-attendance-rollup")
+@click.option("--from-date", help="Rebuild months starting from this date (YYYY-MM-DD)")
+@click.option("--to-date", help="Rebuild months up to this date (YYYY-MM-DD)")
+@pass_context
+def rebuild_attendance_rollup(context, from_date=None, to_date=None):
+	"Rebuild the monthly attendance rollup used by the summarized Monthly Attendance Sheet"
+	import frappe
+
+	from hrms.hr.doctype.attendance_rollup.attendance_rollup import rebuild_attendance_rollup
+
+	frappe.init(site=get_site(context))
+	frappe.connect()
+	try:
+		rebuild_attendance_rollup(from_date, to_date, commit=True)
+	finally:
+		frappe.destroy()
+
+
+commands = [rebuild_attendance_rollup]
@@ -3,11 +3,15 @@
 
 import frappe
 from frappe import _
-from frappe.utils import add_days, add_months, comma_sep, getdate, today
+from frappe.query_builder.functions import Coalesce, NullIf
+from frappe.utils import add_days, add_months, comma_sep, get_year_start, getdate
 
-from erpnext.setup.doctype.employee.employee import get_all_employee_emails, get_employee_email
+from erpnext.setup.doctype.employee.employee import get_employee_email
 
-from hrms.hr.utils import get_holidays_for_employee
+from hrms.overrides.employee_master import get_month_day
+
+EMPLOYEE_REMINDER_RECIPIENTS = "hrms:employee_reminder_recipients"
+REMINDER_RECIPIENT_CHUNK_SIZE = 500
 
 
 # -----------------
@@ -45,13 +49,86 @@ def send_advance_holiday_reminders(frequency):
 	else:
 		return
 
-	employees = frappe.db.get_all("Employee", filters={"status": "Active"}, pluck="name")
-	for employee in employees:
-		holidays = get_holidays_for_employee(
-			employee, start_date, end_date, only_non_weekly=True, raise_exception=False
+	employees_by_holiday_list = get_active_employees_by_holiday_list()
+	holidays_by_holiday_list = get_upcoming_holidays(list(employees_by_holiday_list), start_date, end_date)
+
+	sender_email = get_sender_email()
+	for holiday_list, employees in employees_by_holiday_list.items():
+		holidays = holidays_by_holiday_list.get(holiday_list)
+		if not holidays:
+			continue
+
+		recipients = [email for employee in employees if (email := get_employee_email(employee))]
+		send_holiday_list_reminder(recipients, holidays, frequency, sender_email)
+
+
+def get_active_employees_by_holiday_list() -> dict[str, list[dict]]:
+	"""Groups active employees by their effective holiday list, falling back to the company default"""
+	Employee = frappe.qb.DocType("Employee")
+	Company = frappe.qb.DocType("Company")
+	employees = (
+		frappe.qb.from_(Employee)
+		.inner_join(Company)
+		.on(Employee.company == Company.name)
+		.select(
+			Employee.user_id,
+			Employee.personal_email,
+			Employee.company_email,
+			Coalesce(NullIf(Employee.holiday_list, ""), Company.default_holiday_list).as_("holiday_list"),
 		)
+		.where(Employee.status == "Active")
+	).run(as_dict=True)
+
+	employees_by_holiday_list = {}
+	for employee in employees:
+		if employee.holiday_list:
+			employees_by_holiday_list.setdefault(employee.holiday_list, []).append(employee)
+
+	return employees_by_holiday_list
+
+
+def get_upcoming_holidays(holiday_lists: list[str], start_date, end_date) -> dict[str, list[dict]]:
+	"""Returns non-weekly holidays between the dates for all holiday lists in a single query"""
+	if not holiday_lists:
+		return {}
+
+	holidays = frappe.get_all(
+		"Holiday",
+		fields=["parent", "description", "holiday_date"],
+		filters={
+			"parent": ("in", holiday_lists),
+			"holiday_date": ("between", [start_date, end_date]),
+			"weekly_off": False,
+		},
+		order_by="holiday_date",
+	)
+
+	holidays_by_holiday_list = {}
+	for holiday in holidays:
+		holidays_by_holiday_list.setdefault(holiday.pop("parent"), []).append(holiday)
+
+	return holidays_by_holiday_list
+
 
-		send_holidays_reminder_in_advance(employee, holidays)
+def send_holiday_list_reminder(recipients, holidays, frequency, sender_email=None):
+	"""Sends one reminder to all employees sharing a holiday list"""
+	email_header = _("Holidays this Month.") if frequency == "Monthly" else _("Holidays this Week.")
+	send_reminder_in_chunks(
+		dict(
+			sender=sender_email,
+			recipients=recipients,
+			subject=_("Upcoming Holidays Reminder"),
+			template="holiday_reminder",
+			args=dict(
+				reminder_text=_("Hey there! This email is to remind you about the upcoming holidays."),
+				message=_("Below is the list of upcoming holidays for you:"),
+				advance_holiday_reminder=True,
+				holidays=holidays,
+				frequency=frequency[:-2],
+			),
+			header=email_header,
+		)
+	)
 
 
 def send_holidays_reminder_in_advance(employee, holidays):
@@ -94,8 +171,11 @@ def send_birthday_reminders():
 	sender = get_sender_email()
 	employees_born_today = get_employees_who_are_born_today()
 
+	recipients_by_company = get_employee_emails_by_company()
+	personal_emails = []
+
 	for company, birthday_persons in employees_born_today.items():
-		employee_emails = get_all_employee_emails(company)
+		employee_emails = recipients_by_company.get(company, [])
 		birthday_person_emails = [get_employee_email(doc) for doc in birthday_persons]
 		recipients = list(set(employee_emails) - set(birthday_person_emails))
 
@@ -108,7 +188,11 @@ def send_birthday_reminders():
 				person_email = person["user_id"] or person["personal_email"] or person["company_email"]
 				others = [d for d in birthday_persons if d != person]
 				reminder_text, message = get_birthday_reminder_text_and_message(others)
-				send_birthday_reminder(person_email, reminder_text, others, message, sender)
+				personal_emails.append(
+					get_birthday_reminder_email(person_email, reminder_text, others, message, sender)
+				)
+
+	enqueue_reminder_emails(personal_emails)
 
 
 def get_birthday_reminder_text_and_message(birthday_persons):
@@ -128,7 +212,13 @@ def get_birthday_reminder_text_and_message(birthday_persons):
 
 
 def send_birthday_reminder(recipients, reminder_text, birthday_persons, message, sender=None):
-	frappe.sendmail(
+	send_reminder_in_chunks(
+		get_birthday_reminder_email(recipients, reminder_text, birthday_persons, message, sender)
+	)
+
+
+def get_birthday_reminder_email(recipients, reminder_text, birthday_persons, message, sender=None) -> dict:
+	return dict(
 		sender=sender,
 		recipients=recipients,
 		subject=_("Birthday Reminder"),
@@ -154,44 +244,33 @@ def get_employees_having_an_event_today(event_type):
 
 	from collections import defaultdict
 
-	# Set column based on event type
+	# Set columns based on event type
 	if event_type == "birthday":
-		condition_column = "date_of_birth"
+		date_field, month_day_field = "date_of_birth", "birth_month_day"
 	elif event_type == "work_anniversary":
-		condition_column = "date_of_joining"
+		date_field, month_day_field = "date_of_joining", "joining_month_day"
 	else:
 		return
 
-	employees_born_today = frappe.db.multisql(
-		{
-			"mariadb": f"""
-			SELECT `personal_email`, `company`, `company_email`, `user_id`, `employee_name` AS 'name', `image`, `date_of_joining`
-			FROM `tabEmployee`
-			WHERE
-				DAY({condition_column}) = DAY(%(today)s)
-			AND
-				MONTH({condition_column}) = MONTH(%(today)s)
-			AND
-				YEAR({condition_column}) < YEAR(%(today)s)
-			AND
-				`status` = 'Active'
-		""",
-			"postgres": f"""
-			SELECT "personal_email", "company", "company_email", "user_id", "employee_name" AS 'name', "image"
-			FROM "tabEmployee"
-			WHERE
-				DATE_PART('day', {condition_column}) = date_part('day', %(today)s)
-			AND
-				DATE_PART('month', {condition_column}) = date_part('month', %(today)s)
-			AND
-				DATE_PART('year', {condition_column}) < date_part('year', %(today)s)
-			AND
-				"status" = 'Active'
-		""",
-		},
-		dict(today=today(), condition_column=condition_column),
-		as_dict=1,
-	)
+	current_date = getdate()
+	Employee = frappe.qb.DocType("Employee")
+	employees_born_today = (
+		frappe.qb.from_(Employee)
+		.select(
+			Employee.personal_email,
+			Employee.company,
+			Employee.company_email,
+			Employee.user_id,
+			Employee.employee_name.as_("name"),
+			Employee.image,
+			Employee.date_of_joining,
+		)
+		.where(
+			(Employee[month_day_field] == get_month_day(current_date))
+			& (Employee[date_field] < get_year_start(current_date))
+			& (Employee.status == "Active")
+		)
+	).run(as_dict=True)
 
 	grouped_employees = defaultdict(lambda: [])
 
@@ -217,8 +296,11 @@ def send_work_anniversary_reminders():
 	message += "<br>"
 	message += _("Everyone, let’s congratulate them on their work anniversary!")
 
+	recipients_by_company = get_employee_emails_by_company()
+	personal_emails = []
+
 	for company, anniversary_persons in employees_joined_today.items():
-		employee_emails = get_all_employee_emails(company)
+		employee_emails = recipients_by_company.get(company, [])
 		anniversary_person_emails = [get_employee_email(doc) for doc in anniversary_persons]
 		recipients = list(set(employee_emails) - set(anniversary_person_emails))
 
@@ -231,7 +313,11 @@ def send_work_anniversary_reminders():
 				person_email = person["user_id"] or person["personal_email"] or person["company_email"]
 				others = [d for d in anniversary_persons if d != person]
 				reminder_text = get_work_anniversary_reminder_text(others)
-				send_work_anniversary_reminder(person_email, reminder_text, others, message, sender)
+				personal_emails.append(
+					get_work_anniversary_reminder_email(person_email, reminder_text, others, message, sender)
+				)
+
+	enqueue_reminder_emails(personal_emails)
 
 
 def get_work_anniversary_reminder_text(anniversary_persons: list) -> str:
@@ -266,7 +352,19 @@ def send_work_anniversary_reminder(
 	message,
 	sender=None,
 ):
-	frappe.sendmail(
+	send_reminder_in_chunks(
+		get_work_anniversary_reminder_email(recipients, reminder_text, anniversary_persons, message, sender)
+	)
+
+
+def get_work_anniversary_reminder_email(
+	recipients,
+	reminder_text,
+	anniversary_persons,
+	message,
+	sender=None,
+) -> dict:
+	return dict(
 		sender=sender,
 		recipients=recipients,
 		subject=_("Work Anniversary Reminder"),
@@ -282,3 +380,61 @@ def send_work_anniversary_reminder(
 
 def get_sender_email() -> str | None:
 	return frappe.db.get_single_value("HR Settings", "sender_email")
+
+
+def send_reminder_in_chunks(email: dict) -> None:
+	"""Sends the reminder with one Email Queue entry per chunk of recipients.
+	Recipients are not exposed to each other, each one gets a separate copy from the email queue"""
+	email = dict(email)
+	recipients = email.pop("recipients")
+	if isinstance(recipients, str):
+		recipients = [recipients]
+
+	for idx in range(0, len(recipients), REMINDER_RECIPIENT_CHUNK_SIZE):
+		frappe.sendmail(recipients=recipients[idx : idx + REMINDER_RECIPIENT_CHUNK_SIZE], **email)
+
+
+def enqueue_reminder_emails(emails: list[dict]) -> None:
+	"""Queues the personal reminder emails in a single background job instead of one sendmail call each"""
+	if not emails:
+		return
+
+	frappe.enqueue(send_reminder_emails, queue="long", emails=emails)
+
+
+def send_reminder_emails(emails: list[dict]) -> None:
+	"""Merges the recipients of emails with the same template and content and sends each in chunks"""
+	grouped_emails = {}
+	for email in emails:
+		email = dict(email)
+		recipients = email.pop("recipients")
+		grouped_email = grouped_emails.setdefault(frappe.as_json(email), {**email, "recipients": []})
+		grouped_email["recipients"].extend([recipients] if isinstance(recipients, str) else recipients)
+
+	for email in grouped_emails.values():
+		send_reminder_in_chunks(email)
+
+
+def get_employee_emails_by_company() -> dict[str, list[str]]:
+	"""Returns the cached reminder recipients of all active employees, grouped by company"""
+	return frappe.cache().get_value(EMPLOYEE_REMINDER_RECIPIENTS, generator=_get_employee_emails_by_company)
+
+
+def _get_employee_emails_by_company() -> dict[str, list[str]]:
+	employees = frappe.get_all(
+		"Employee",
+		filters={"status": "Active"},
+		fields=["company", "user_id", "company_email", "personal_email"],
+	)
+
+	emails_by_company = {}
+	for employee in employees:
+		email = employee.user_id or employee.company_email or employee.personal_email
+		if email:
+			emails_by_company.setdefault(employee.company, []).append(email)
+
+	return emails_by_company
+
+
+def invalidate_recipients_cache(doc, method=None):
+	frappe.cache().delete_value(EMPLOYEE_REMINDER_RECIPIENTS)
@@ -123,6 +123,23 @@ class TestEmployeeReminders(IntegrationTestCase):
 		email_queue = frappe.db.sql("""select * from `tabEmail Queue`""", as_dict=True)
 		self.assertTrue("Subject: Birthday Reminder" in email_queue[0].message)
 
+	def test_month_day_fields_for_reminders(self):
+		employee = frappe.get_doc(
+			"Employee",
+			make_employee(
+				"test_month_day@example.com",
+				company="_Test Company",
+				date_of_birth="1990-02-28",
+				date_of_joining="2015-12-01",
+			),
+		)
+		self.assertEqual(employee.birth_month_day, 228)
+		self.assertEqual(employee.joining_month_day, 1201)
+
+		employee.date_of_birth = "1990-11-09"
+		employee.save()
+		self.assertEqual(employee.birth_month_day, 1109)
+
 	def test_work_anniversary_reminders(self):
 		from hrms.controllers.employee_reminders import (
 			get_employees_having_an_event_today,
@@ -240,6 +257,47 @@ class TestEmployeeReminders(IntegrationTestCase):
 			{"status": "Active", "holiday_list": self.holiday_list_2.name},
 		)
 
+	def test_advance_holiday_reminders_grouped_by_holiday_list(self):
+		from hrms.controllers.employee_reminders import send_reminders_in_advance_weekly
+
+		setup_hr_settings("Weekly")
+
+		employee = make_employee("test_grouped_holiday_reminder@example.com", company="_Test Company")
+		frappe.db.set_value("Employee", employee, "holiday_list", self.test_employee.holiday_list)
+
+		send_reminders_in_advance_weekly()
+
+		# employees sharing a holiday list get a single rendered email
+		recipients = [self.test_employee.user_id, "test_grouped_holiday_reminder@example.com"]
+		email_queue = frappe.get_all(
+			"Email Queue Recipient", filters={"recipient": ("in", recipients)}, pluck="parent"
+		)
+		self.assertEqual(len(email_queue), 2)
+		self.assertEqual(len(set(email_queue)), 1)
+
+	def test_reminder_emails_grouped_by_content(self):
+		from hrms.controllers.employee_reminders import get_birthday_reminder_email, send_reminder_emails
+
+		persons = [{"name": "Test Person", "image": None}]
+		emails = [
+			get_birthday_reminder_email("test_grouped_1@example.com", "Reminder", persons, "Message"),
+			get_birthday_reminder_email(["test_grouped_2@example.com"], "Reminder", persons, "Message"),
+			get_birthday_reminder_email("test_grouped_3@example.com", "Other Reminder", persons, "Message"),
+		]
+		send_reminder_emails(emails)
+
+		# identical emails are merged into one queued email
+		email_queue = frappe.db.sql("""select * from `tabEmail Queue`""", as_dict=True)
+		self.assertEqual(len(email_queue), 2)
+		recipients = frappe.get_all(
+			"Email Queue Recipient",
+			filters={"recipient": ("like", "test_grouped_%")},
+			fields=["parent", "recipient"],
+		)
+		parents = {d.recipient: d.parent for d in recipients}
+		self.assertEqual(parents["test_grouped_1@example.com"], parents["test_grouped_2@example.com"])
+		self.assertNotEqual(parents["test_grouped_1@example.com"], parents["test_grouped_3@example.com"])
+
 	def test_reminder_not_sent_if_no_holdays(self):
 		setup_hr_settings("Monthly")
 
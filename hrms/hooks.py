@@ -165,6 +165,11 @@ doc_events = {
 			"erpnext.setup.doctype.employee.employee.validate_employee_role",
 			"hrms.overrides.employee_master.update_approver_user_roles",
 		],
+		"on_update": [
+			"hrms.hr.doctype.department_approver.department_approver.invalidate_department_approvers",
+			# roles are saved as Has Role rows of the user
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		],
 	},
 	"Company": {
 		"validate": "hrms.overrides.company.validate_default_accounts",
@@ -174,9 +179,28 @@ doc_events = {
 		],
 		"on_trash": "hrms.overrides.company.handle_linked_docs",
 	},
+	"Department": {
+		"on_update": [
+			"hrms.hr.doctype.department_approver.department_approver.invalidate_department_approvers",
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		],
+		"after_rename": "hrms.hr.doctype.department_approver.department_approver.invalidate_department_approvers",
+		"on_trash": [
+			"hrms.hr.doctype.department_approver.department_approver.invalidate_department_approvers",
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		],
+	},
 	"Holiday List": {
-		"on_update": "hrms.utils.holiday_list.invalidate_cache",
-		"on_trash": "hrms.utils.holiday_list.invalidate_cache",
+		"on_update": [
+			"hrms.utils.holiday_list.invalidate_cache",
+			"hrms.api.invalidate_home_dashboard",
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		],
+		"on_trash": [
+			"hrms.utils.holiday_list.invalidate_cache",
+			"hrms.api.invalidate_home_dashboard",
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		],
 	},
 	"Timesheet": {"validate": "hrms.hr.utils.validate_active_employee"},
 	"Payment Entry": {
@@ -204,16 +228,41 @@ doc_events = {
 	},
 	"Loan": {"validate": "hrms.hr.utils.validate_loan_repay_from_salary"},
 	"Employee": {
-		"validate": "hrms.overrides.employee_master.validate_onboarding_process",
+		"validate": [
+			"hrms.overrides.employee_master.validate_onboarding_process",
+			"hrms.overrides.employee_master.set_month_day_fields",
+		],
 		"on_update": [
 			"hrms.overrides.employee_master.update_approver_role",
 			"hrms.overrides.employee_master.publish_update",
+			"hrms.hr.page.organizational_chart.organizational_chart.invalidate_cache",
+			"hrms.api.invalidate_home_dashboard",
+			"hrms.api.invalidate_employee_directory",
+			"hrms.controllers.employee_reminders.invalidate_recipients_cache",
+			"hrms.hr.doctype.department_approver.department_approver.invalidate_department_approvers",
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
 		],
 		"after_insert": "hrms.overrides.employee_master.update_job_applicant_and_offer",
 		"on_trash": "hrms.overrides.employee_master.update_employee_transfer",
-		"after_delete": "hrms.overrides.employee_master.publish_update",
+		"after_delete": [
+			"hrms.overrides.employee_master.publish_update",
+			"hrms.hr.page.organizational_chart.organizational_chart.invalidate_cache",
+			"hrms.api.invalidate_home_dashboard",
+			"hrms.api.invalidate_employee_directory",
+			"hrms.controllers.employee_reminders.invalidate_recipients_cache",
+			"hrms.hr.doctype.department_approver.department_approver.invalidate_department_approvers",
+			"hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		],
 	},
 	"Project": {"validate": "hrms.controllers.employee_boarding_controller.update_employee_boarding_status"},
+	"User Permission": {
+		"on_update": "hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		"on_trash": "hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+	},
+	"Has Role": {
+		"on_update": "hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+		"on_trash": "hrms.hr.doctype.leave_application.leave_calendar.invalidate_leave_calendar",
+	},
 	"Task": {"on_update": "hrms.controllers.employee_boarding_controller.update_task"},
 }
 
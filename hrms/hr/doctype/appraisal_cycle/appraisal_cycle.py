@@ -7,6 +7,8 @@ from frappe.model.document import Document
 from frappe.query_builder.functions import Count
 from frappe.query_builder.terms import SubQuery
 
+APPRAISAL_CHUNK_SIZE = 100
+
 
 class AppraisalCycle(Document):
 	def onload(self):
@@ -118,8 +120,10 @@ class AppraisalCycle(Document):
 			frappe.enqueue(
 				create_appraisals_for_cycle,
 				queue="long",
-				timeout=600,
+				timeout=3000,
 				appraisal_cycle=self,
+				publish_progress=True,
+				commit=True,
 			)
 			frappe.msgprint(
 				_("Appraisal creation is queued. It may take a few minutes."),
@@ -161,15 +165,32 @@ class AppraisalCycle(Document):
 		self.save()
 
 
-def create_appraisals_for_cycle(appraisal_cycle: AppraisalCycle, publish_progress: bool = False):
+def create_appraisals_for_cycle(
+	appraisal_cycle: AppraisalCycle, publish_progress: bool = False, commit: bool = False
+):
 	"""
 	Creates appraisals for employees in the appraisee list of appraisal cycle,
-	if not already created
+	if not already created. Appraisals are created in chunks, committed after each chunk if `commit` is set
 	"""
-	count = 0
+	existing_appraisals = set(
+		frappe.get_all(
+			"Appraisal",
+			filters={"appraisal_cycle": appraisal_cycle.name, "docstatus": ("!=", 2)},
+			pluck="employee",
+		)
+	)
+	appraisees = [d for d in appraisal_cycle.appraisees if d.employee not in existing_appraisals]
+	if not appraisees:
+		return
 
-	for employee in appraisal_cycle.appraisees:
-		try:
+	rate_goals_manually = 1 if appraisal_cycle.kra_evaluation_method == "Manual Rating" else 0
+	template_rows = get_appraisal_template_rows(
+		{d.appraisal_template for d in appraisees}, rate_goals_manually
+	)
+
+	total = len(appraisees)
+	for idx in range(0, total, APPRAISAL_CHUNK_SIZE):
+		for employee in appraisees[idx : idx + APPRAISAL_CHUNK_SIZE]:
 			appraisal = frappe.get_doc(
 				{
 					"doctype": "Appraisal",
@@ -177,23 +198,51 @@ def create_appraisals_for_cycle(appraisal_cycle: AppraisalCycle, publish_progres
 					"appraisal_template": employee.appraisal_template,
 					"employee": employee.employee,
 					"appraisal_cycle": appraisal_cycle.name,
+					"rate_goals_manually": rate_goals_manually,
+					**{
+						table: [row.copy() for row in rows]
+						for table, rows in template_rows[employee.appraisal_template].items()
+					},
 				}
 			)
 
-			appraisal.rate_goals_manually = (
-				1 if appraisal_cycle.kra_evaluation_method == "Manual Rating" else 0
+			try:
+				appraisal.insert()
+			except frappe.DuplicateEntryError:
+				# appraisal exists for an overlapping period
+				pass
+
+		if commit:
+			frappe.db.commit()  # nosemgrep
+
+		if publish_progress:
+			done = min(idx + APPRAISAL_CHUNK_SIZE, total)
+			frappe.publish_progress(
+				done * 100 / total,
+				title=_("Creating Appraisals") + "...",
+				description=_("{0} of {1}").format(done, total),
 			)
-			appraisal.set_kras_and_rating_criteria()
-			appraisal.insert()
 
-			if publish_progress:
-				count += 1
-				frappe.publish_progress(
-					count * 100 / len(appraisal_cycle.appraisees), title=_("Creating Appraisals") + "..."
-				)
-		except frappe.DuplicateEntryError:
-			# already exists
-			pass
+
+def get_appraisal_template_rows(appraisal_templates: set[str], rate_goals_manually: int) -> dict:
+	"""Returns the KRA and rating criteria rows of each template, loading every template only once"""
+	kra_table = "goals" if rate_goals_manually else "appraisal_kra"
+	template_rows = {}
+
+	for appraisal_template in appraisal_templates:
+		template = frappe.get_doc("Appraisal Template", appraisal_template)
+		template_rows[appraisal_template] = {
+			kra_table: [
+				{"kra": entry.key_result_area, "per_weightage": entry.per_weightage}
+				for entry in template.goals
+			],
+			"self_ratings": [
+				{"criteria": entry.criteria, "per_weightage": entry.per_weightage}
+				for entry in template.rating_criteria
+			],
+		}
+
+	return template_rows
 
 
 def validate_active_appraisal_cycle(appraisal_cycle: str) -> None:
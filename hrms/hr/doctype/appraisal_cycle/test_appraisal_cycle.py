@@ -51,6 +51,10 @@ class TestAppraisalCycle(IntegrationTestCase):
 				appraisal.self_ratings[i].per_weightage, self.template.rating_criteria[i].per_weightage
 			)
 
+		# existing appraisals are skipped on re-run
+		cycle.create_appraisals()
+		self.assertEqual(frappe.db.count("Appraisal", {"appraisal_cycle": cycle.name}), 1)
+
 
 def create_appraisal_cycle(**args):
 	args = frappe._dict(args)
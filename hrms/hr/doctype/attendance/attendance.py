@@ -8,6 +8,7 @@ from frappe.model.document import Document
 from frappe.utils import (
 	add_days,
 	cint,
+	comma_or,
 	cstr,
 	format_date,
 	get_datetime,
@@ -17,12 +18,15 @@ from frappe.utils import (
 )
 
 import hrms
+from hrms.api import clear_home_dashboard
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import update_attendance_rollup
 from hrms.hr.doctype.shift_assignment.shift_assignment import has_overlapping_timings
 from hrms.hr.utils import (
 	get_holiday_dates_for_employee,
 	get_holidays_for_employee,
 	validate_active_employee,
 )
+from hrms.utils.bulk import bulk_insert_docs
 
 
 class DuplicateAttendanceError(frappe.ValidationError):
@@ -49,8 +53,17 @@ class Attendance(Document):
 		self.validate_employee_status()
 		self.check_leave_record()
 
+	def on_submit(self):
+		update_attendance_rollup([self.employee], self.attendance_date, self.attendance_date)
+
+	def on_update_after_submit(self):
+		update_attendance_rollup([self.employee], self.attendance_date, self.attendance_date)
+		clear_home_dashboard([self.employee])
+
 	def on_cancel(self):
 		self.unlink_attendance_from_checkins()
+		update_attendance_rollup([self.employee], self.attendance_date, self.attendance_date)
+		clear_home_dashboard([self.employee])
 
 	def validate_attendance_date(self):
 		date_of_joining = frappe.db.get_value("Employee", self.employee, "date_of_joining")
@@ -246,6 +259,7 @@ class Attendance(Document):
 	def publish_update(self):
 		employee_user = frappe.db.get_value("Employee", self.employee, "user_id", cache=True)
 		hrms.refetch_resource("hrms:attendance_calendar_events", employee_user)
+		clear_home_dashboard([self.employee])
 
 
 @frappe.whitelist()
@@ -397,3 +411,181 @@ def get_unmarked_days(employee, from_date, to_date, exclude_holidays=0):
 		from_date = add_days(from_date, 1)
 
 	return unmarked_days
+
+
+def insert_attendance_in_bulk(records: list[dict]) -> tuple[list[dict], list[dict]]:
+	"""Validates attendance records with grouped queries and inserts the valid ones as submitted documents.
+
+	Runs the checks of the Attendance controller (employee status and joining date, duplicate and overlapping
+	shift attendance, approved leaves) for all records at once instead of a document lifecycle per record.
+	Returns the inserted records (with their names) and the rejected records along with the reason.
+	"""
+	if not records:
+		return [], []
+
+	records = [frappe._dict(d) for d in records]
+	for d in records:
+		d.attendance_date = getdate(d.attendance_date)
+
+	employees = {d.employee for d in records}
+	from_date = min(d.attendance_date for d in records)
+	to_date = max(d.attendance_date for d in records)
+
+	employee_details = {
+		d.name: d
+		for d in frappe.get_all(
+			"Employee",
+			filters={"name": ["in", list(employees)]},
+			fields=["name", "employee_name", "company", "department", "status", "date_of_joining", "user_id"],
+		)
+	}
+	existing_attendance = get_attendance_by_employee_and_date(employees, from_date, to_date)
+	leaves = get_approved_leaves_by_employee(employees, from_date, to_date)
+
+	to_insert, failed = [], []
+	for d in records:
+		employee = employee_details.get(d.employee)
+		key = (d.employee, d.attendance_date)
+
+		if error := get_bulk_attendance_error(d, employee, existing_attendance.get(key, [])):
+			failed.append({**d, "error": error})
+			continue
+
+		set_leave_details(d, leaves.get(d.employee, []))
+		row = {
+			**d,
+			"employee_name": employee.employee_name,
+			"company": d.company or employee.company,
+			"department": employee.department,
+			"half_day_status": d.half_day_status or None,
+		}
+		to_insert.append(row)
+		# records in the same batch are duplicates of each other too
+		existing_attendance.setdefault(key, []).append(frappe._dict(row))
+
+	names = bulk_insert_docs("Attendance", to_insert, docstatus=1)
+	for row, name in zip(to_insert, names, strict=True):
+		row["name"] = name
+
+	if to_insert:
+		update_attendance_rollup({d["employee"] for d in to_insert}, from_date, to_date)
+		# bulk inserted attendance skips the doc events that clear the dashboards
+		clear_home_dashboard({d["employee"] for d in to_insert})
+
+	for user in {employee_details[d["employee"]].user_id for d in to_insert} - {None}:
+		hrms.refetch_resource("hrms:attendance_calendar_events", user)
+
+	return to_insert, failed
+
+
+def get_attendance_by_employee_and_date(employees: set[str], from_date, to_date) -> dict[tuple, list[dict]]:
+	Attendance = frappe.qb.DocType("Attendance")
+	records = (
+		frappe.qb.from_(Attendance)
+		.select(
+			Attendance.name,
+			Attendance.employee,
+			Attendance.attendance_date,
+			Attendance.shift,
+			Attendance.half_day_status,
+			Attendance.modify_half_day_status,
+		)
+		.where(
+			(Attendance.employee.isin(list(employees)))
+			& (Attendance.docstatus < 2)
+			& (Attendance.attendance_date.between(from_date, to_date))
+		)
+	).run(as_dict=True)
+
+	attendance = {}
+	for d in records:
+		attendance.setdefault((d.employee, getdate(d.attendance_date)), []).append(d)
+	return attendance
+
+
+def get_approved_leaves_by_employee(employees: set[str], from_date, to_date) -> dict[str, list[dict]]:
+	LeaveApplication = frappe.qb.DocType("Leave Application")
+	leaves = (
+		frappe.qb.from_(LeaveApplication)
+		.select(
+			LeaveApplication.name,
+			LeaveApplication.employee,
+			LeaveApplication.leave_type,
+			LeaveApplication.from_date,
+			LeaveApplication.to_date,
+			LeaveApplication.half_day_date,
+		)
+		.where(
+			(LeaveApplication.employee.isin(list(employees)))
+			& (LeaveApplication.from_date <= to_date)
+			& (LeaveApplication.to_date >= from_date)
+			& (LeaveApplication.status == "Approved")
+			& (LeaveApplication.docstatus == 1)
+		)
+	).run(as_dict=True)
+
+	leaves_by_employee = {}
+	for d in leaves:
+		leaves_by_employee.setdefault(d.employee, []).append(d)
+	return leaves_by_employee
+
+
+def get_bulk_attendance_error(
+	record: dict, employee: dict | None, same_date_attendance: list[dict]
+) -> str | None:
+	if record.status not in ("Present", "Absent", "On Leave", "Half Day", "Work From Home"):
+		return _("Status must be one of {0}").format(
+			comma_or(["Present", "Absent", "On Leave", "Half Day", "Work From Home"])
+		)
+
+	if not employee:
+		return _("Employee {0} not found").format(record.employee)
+
+	if employee.status == "Inactive":
+		return _("Cannot mark attendance for an Inactive employee {0}").format(record.employee)
+
+	if employee.date_of_joining and record.attendance_date < getdate(employee.date_of_joining):
+		return _("Attendance date {0} can not be less than employee {1}'s joining date: {2}").format(
+			frappe.bold(format_date(record.attendance_date)),
+			frappe.bold(record.employee),
+			frappe.bold(format_date(employee.date_of_joining)),
+		)
+
+	for d in same_date_attendance:
+		is_half_day_to_modify = d.half_day_status and d.modify_half_day_status
+		if not is_half_day_to_modify and (not record.shift or not d.shift or d.shift == record.shift):
+			return _("Attendance for employee {0} is already marked for the date {1}: {2}").format(
+				frappe.bold(record.employee),
+				frappe.bold(format_date(record.attendance_date)),
+				get_link_to_form("Attendance", d.name) if d.name else _("in this batch"),
+			)
+
+		if (
+			record.shift
+			and d.shift
+			and d.shift != record.shift
+			and has_overlapping_timings(record.shift, d.shift)
+		):
+			return _(
+				"Attendance for employee {0} is already marked for an overlapping shift {1}: {2}"
+			).format(
+				frappe.bold(record.employee),
+				frappe.bold(d.shift),
+				get_link_to_form("Attendance", d.name) if d.name else _("in this batch"),
+			)
+
+
+def set_leave_details(record: dict, leaves: list[dict]) -> None:
+	"""Sets leave details on the record the same way as `Attendance.check_leave_record`"""
+	leave = next((d for d in leaves if d.from_date <= record.attendance_date <= d.to_date), None)
+
+	if leave:
+		record.leave_type = leave.leave_type
+		record.leave_application = leave.name
+		record.status = "Half Day" if leave.half_day_date == record.attendance_date else "On Leave"
+	elif record.status in ("On Leave", "Half Day"):
+		record.modify_half_day_status = 0
+		record.half_day_status = "Absent"
+	else:
+		record.leave_type = None
+		record.leave_application = None
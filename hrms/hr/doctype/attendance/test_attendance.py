@@ -23,6 +23,7 @@ from hrms.hr.doctype.attendance.attendance import (
 	DuplicateAttendanceError,
 	OverlappingShiftAttendanceError,
 	get_unmarked_days,
+	insert_attendance_in_bulk,
 	mark_attendance,
 )
 from hrms.tests.test_utils import get_first_sunday
@@ -137,6 +138,46 @@ class TestAttendance(IntegrationTestCase):
 			}
 		).insert()
 
+	def test_insert_attendance_in_bulk(self):
+		from hrms.hr.doctype.shift_type.test_shift_type import setup_shift_type
+
+		employee1 = make_employee("test_bulk_attendance1@example.com", company="_Test Company")
+		employee2 = make_employee("test_bulk_attendance2@example.com", company="_Test Company")
+		date = getdate()
+
+		shift_1 = setup_shift_type(shift_type="Shift 1", start_time="08:00:00", end_time="10:00:00")
+		shift_2 = setup_shift_type(shift_type="Shift 2", start_time="09:30:00", end_time="11:00:00")
+		mark_attendance(employee1, date, "Present", shift=shift_1.name)
+
+		inserted, failed = insert_attendance_in_bulk(
+			[
+				# duplicate
+				{"employee": employee1, "attendance_date": date, "status": "Absent"},
+				# overlapping shift
+				{"employee": employee1, "attendance_date": date, "status": "Present", "shift": shift_2.name},
+				{"employee": employee2, "attendance_date": date, "status": "Present", "shift": shift_1.name},
+				# duplicate within the batch
+				{"employee": employee2, "attendance_date": date, "status": "Absent"},
+			]
+		)
+
+		self.assertEqual(len(inserted), 1)
+		self.assertEqual(len(failed), 3)
+
+		attendance = frappe.db.get_value(
+			"Attendance",
+			inserted[0]["name"],
+			["employee", "status", "shift", "docstatus", "employee_name"],
+			as_dict=True,
+		)
+		self.assertEqual(attendance.employee, employee2)
+		self.assertEqual(attendance.status, "Present")
+		self.assertEqual(attendance.shift, shift_1.name)
+		self.assertEqual(attendance.docstatus, 1)
+		self.assertEqual(
+			attendance.employee_name, frappe.db.get_value("Employee", employee2, "employee_name")
+		)
+
 	def test_mark_absent(self):
 		employee = make_employee("test_mark_absent@example.com")
 		date = nowdate()
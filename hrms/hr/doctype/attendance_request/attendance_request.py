@@ -10,6 +10,7 @@ from frappe.utils import add_days, date_diff, format_date, get_link_to_form, get
 from erpnext.setup.doctype.employee.employee import is_holiday
 
 import hrms
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import update_attendance_rollup
 from hrms.hr.utils import validate_active_employee, validate_dates
 
 
@@ -90,6 +91,9 @@ class AttendanceRequest(Document):
 			if self.should_mark_attendance(attendance_date):
 				self.create_or_update_attendance(attendance_date)
 
+		# existing attendance is updated with db_set, without the lifecycle that updates the rollup
+		update_attendance_rollup([self.employee], self.from_date, self.to_date)
+
 	def create_or_update_attendance(self, date: str):
 		doc = self.get_attendance_doc(date)
 		status = self.get_attendance_status(date)
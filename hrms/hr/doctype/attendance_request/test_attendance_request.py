@@ -2,10 +2,19 @@
 # See license.txt
 
 import frappe
-from frappe.utils import add_days, add_months, get_year_ending, get_year_start, getdate
+from frappe.utils import (
+	add_days,
+	add_months,
+	get_first_day,
+	get_last_day,
+	get_year_ending,
+	get_year_start,
+	getdate,
+)
 
 from hrms.hr.doctype.attendance.attendance import mark_attendance
 from hrms.hr.doctype.attendance_request.attendance_request import OverlappingAttendanceRequestError
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import get_attendance_rollups
 from hrms.hr.doctype.leave_application.test_leave_application import make_allocation_record
 from hrms.payroll.doctype.salary_slip.test_salary_slip import (
 	make_holiday_list,
@@ -108,6 +117,22 @@ class TestAttendanceRequest(HRMSTestSuite):
 		self.assertEqual(prev_attendance.status, "Work From Home")
 		self.assertEqual(prev_attendance.attendance_request, attendance_request.name)
 
+		# and the monthly rollup is recomputed for the overwritten record
+		rollup = get_attendance_rollups([self.employee.name], ["_Test Company"], get_first_day(getdate()))
+		self.assertEqual(rollup[self.employee.name].absent_days, 0)
+		self.assertEqual(
+			rollup[self.employee.name].work_from_home_days,
+			frappe.db.count(
+				"Attendance",
+				{
+					"employee": self.employee.name,
+					"status": "Work From Home",
+					"docstatus": 1,
+					"attendance_date": ("between", [get_first_day(getdate()), get_last_day(getdate())]),
+				},
+			),
+		)
+
 	def test_skip_attendance_on_holiday(self):
 		today = getdate()
 		add_date_to_holiday_list(today, self.holiday_list)
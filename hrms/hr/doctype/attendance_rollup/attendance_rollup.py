@@ -0,0 +1,189 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import json
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder.functions import Max, Min
+from frappe.utils import add_days, add_months, flt, get_first_day, get_last_day, getdate
+
+from hrms.utils.bulk import bulk_insert_docs
+
+STATUS_COUNT_FIELDS = {
+	"Present": "present_days",
+	"Work From Home": "work_from_home_days",
+	"Absent": "absent_days",
+	"Half Day": "half_days",
+	"On Leave": "leave_days",
+}
+SUMMARY_FIELDS = (
+	"present_days",
+	"work_from_home_days",
+	"absent_days",
+	"half_days",
+	"leave_days",
+	"late_entries",
+	"early_exits",
+)
+ATTENDANCE_FIELDS = ("attendance_date", "status", "leave_type", "late_entry", "early_exit")
+REBUILD_CHUNK_SIZE = 500
+
+
+class AttendanceRollup(Document):
+	pass
+
+
+def update_attendance_rollup(employees: list | set, from_date, to_date) -> None:
+	"""Recomputes the rollups of the employees for every month touched by the date range.
+	Called wherever submitted attendance changes, including paths that bypass the document lifecycle.
+	Rollups only hold what the summarized month view of the Monthly Attendance Sheet shows, payroll reads
+	the Attendance table
+	"""
+	employees = list(set(employees))
+	if not employees:
+		return
+
+	from_date, to_date = get_first_day(from_date), get_last_day(to_date)
+	Attendance = frappe.qb.DocType("Attendance")
+	AttendanceRollup = frappe.qb.DocType("Attendance Rollup")
+	Employee = frappe.qb.DocType("Employee")
+
+	# serializes concurrent recomputes for the same employees so their deletes and inserts can't interleave,
+	# rows are locked in a fixed order to avoid deadlocks between overlapping employee sets
+	(
+		frappe.qb.from_(Employee)
+		.select(Employee.name)
+		.where(Employee.name.isin(employees))
+		.orderby(Employee.name)
+		.for_update()
+	).run()
+
+	records = (
+		frappe.qb.from_(Attendance)
+		.select(Attendance.employee, Attendance.company, *(Attendance[field] for field in ATTENDANCE_FIELDS))
+		.where(
+			(Attendance.docstatus == 1)
+			& (Attendance.employee.isin(employees))
+			& (Attendance.attendance_date.between(from_date, to_date))
+		)
+		.orderby(Attendance.attendance_date)
+	).run(as_dict=True)
+
+	(
+		frappe.qb.from_(AttendanceRollup)
+		.delete()
+		.where(
+			(AttendanceRollup.employee.isin(employees))
+			& (AttendanceRollup.period_start.between(from_date, to_date))
+		)
+	).run()
+
+	rollups = {}
+	for d in records:
+		key = (d.employee, d.company, get_first_day(d.attendance_date))
+		if key not in rollups:
+			rollups[key] = {
+				"employee": d.employee,
+				"company": d.company,
+				"period_start": key[2],
+				"leave_details": {},
+				"marked_days": set(),
+			}
+		rollup = rollups[key]
+
+		count_field = STATUS_COUNT_FIELDS[d.status]
+		rollup[count_field] = rollup.get(count_field, 0) + 1
+		rollup["late_entries"] = rollup.get("late_entries", 0) + (d.late_entry or 0)
+		rollup["early_exits"] = rollup.get("early_exits", 0) + (d.early_exit or 0)
+		if d.leave_type:
+			leave_days = 0.5 if d.status == "Half Day" else 1
+			rollup["leave_details"][d.leave_type] = rollup["leave_details"].get(d.leave_type, 0) + leave_days
+
+		rollup["marked_days"].add(getdate(d.attendance_date).day)
+
+	for rollup in rollups.values():
+		rollup["leave_details"] = json.dumps(rollup["leave_details"])
+		rollup["marked_days"] = json.dumps(sorted(rollup["marked_days"]))
+
+	bulk_insert_docs("Attendance Rollup", list(rollups.values()))
+
+
+def get_attendance_rollups(employees: list, companies: list, period_start) -> dict[str, dict]:
+	"""Returns the month's rollups by employee, merged across the companies"""
+	rollups = frappe.get_all(
+		"Attendance Rollup",
+		filters={
+			"employee": ("in", employees),
+			"company": ("in", companies),
+			"period_start": getdate(period_start),
+		},
+		fields=["employee", "leave_details", "marked_days", *SUMMARY_FIELDS],
+	)
+
+	rollup_map = {}
+	for rollup in rollups:
+		merged = rollup_map.setdefault(rollup.employee, frappe._dict(leave_details={}, marked_days=set()))
+		for field in SUMMARY_FIELDS:
+			merged[field] = merged.get(field, 0) + (rollup[field] or 0)
+		for leave_type, leave_days in (frappe.parse_json(rollup.leave_details) or {}).items():
+			merged.leave_details[leave_type] = flt(merged.leave_details.get(leave_type)) + flt(leave_days)
+		merged.marked_days.update(frappe.parse_json(rollup.marked_days) or [])
+
+	return rollup_map
+
+
+def rebuild_attendance_rollup(from_date=None, to_date=None, commit: bool = False) -> None:
+	"""Rebuilds the rollups from submitted attendance, for history or after attendance was changed directly in
+	the database. Run with `bench --site <site> rebuild-attendance-rollup`
+	"""
+	Attendance = frappe.qb.DocType("Attendance")
+	AttendanceRollup = frappe.qb.DocType("Attendance Rollup")
+
+	if not (from_date and to_date):
+		first_date, last_date = (
+			frappe.qb.from_(Attendance)
+			.select(Min(Attendance.attendance_date), Max(Attendance.attendance_date))
+			.where(Attendance.docstatus == 1)
+		).run()[0]
+		if not first_date:
+			return
+
+		from_date, to_date = from_date or first_date, to_date or last_date
+
+	from_date, to_date = get_first_day(from_date), get_last_day(to_date)
+	employees = set(
+		frappe.qb.from_(Attendance)
+		.select(Attendance.employee)
+		.distinct()
+		.where(Attendance.attendance_date.between(from_date, to_date))
+		.run(pluck=True)
+	)
+	# clear stale rollups of employees whose attendance was removed
+	employees.update(
+		frappe.qb.from_(AttendanceRollup)
+		.select(AttendanceRollup.employee)
+		.distinct()
+		.where(AttendanceRollup.period_start.between(from_date, to_date))
+		.run(pluck=True)
+	)
+
+	employees = sorted(employees)
+	# a year at a time to keep the attendance fetched per chunk bounded
+	while from_date <= to_date:
+		period_end = min(add_days(add_months(from_date, 12), -1), to_date)
+		for idx in range(0, len(employees), REBUILD_CHUNK_SIZE):
+			update_attendance_rollup(employees[idx : idx + REBUILD_CHUNK_SIZE], from_date, period_end)
+			if commit:
+				frappe.db.commit()  # nosemgrep
+
+		from_date = add_days(period_end, 1)
+
+
+def on_doctype_update():
+	# one row per employee, company and month
+	frappe.db.add_unique(
+		"Attendance Rollup",
+		["employee", "company", "period_start"],
+		constraint_name="unique_employee_company_period",
+	)
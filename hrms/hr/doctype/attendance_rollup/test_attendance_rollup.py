@@ -0,0 +1,70 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests import IntegrationTestCase
+from frappe.utils import add_days, get_first_day, get_last_day, getdate
+
+from erpnext.setup.doctype.employee.test_employee import make_employee
+
+from hrms.hr.doctype.attendance.attendance import mark_attendance
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import (
+	get_attendance_rollups,
+	rebuild_attendance_rollup,
+	update_attendance_rollup,
+)
+from hrms.utils.bulk import bulk_insert_docs
+
+
+class TestAttendanceRollup(IntegrationTestCase):
+	def setUp(self):
+		frappe.db.delete("Attendance")
+		frappe.db.delete("Attendance Rollup")
+		self.employee = make_employee("test_attendance_rollup@example.com", company="_Test Company")
+		self.month_start = get_first_day(add_days(getdate(), -40))
+
+	def get_rollup(self):
+		return frappe.db.get_value(
+			"Attendance Rollup",
+			{"employee": self.employee, "period_start": self.month_start},
+			["present_days", "absent_days", "half_days", "leave_details"],
+			as_dict=True,
+		)
+
+	def test_rollup_on_attendance_submit_and_cancel(self):
+		mark_attendance(self.employee, self.month_start, "Present", ignore_validate=True)
+		absent = mark_attendance(self.employee, add_days(self.month_start, 1), "Absent", ignore_validate=True)
+		mark_attendance(self.employee, add_days(self.month_start, 2), "Half Day", ignore_validate=True)
+
+		rollup = self.get_rollup()
+		self.assertEqual((rollup.present_days, rollup.absent_days, rollup.half_days), (1, 1, 1))
+
+		frappe.get_doc("Attendance", absent).cancel()
+		self.assertEqual(self.get_rollup().absent_days, 0)
+
+		rollup = get_attendance_rollups([self.employee], ["_Test Company"], self.month_start)[self.employee]
+		self.assertEqual(rollup.marked_days, {self.month_start.day, add_days(self.month_start, 2).day})
+
+	def test_single_rollup_per_month(self):
+		mark_attendance(self.employee, self.month_start, "Present", ignore_validate=True)
+		update_attendance_rollup([self.employee], self.month_start, self.month_start)
+		self.assertEqual(
+			frappe.db.count(
+				"Attendance Rollup", {"employee": self.employee, "period_start": self.month_start}
+			),
+			1,
+		)
+
+		with self.assertRaises(frappe.db.IntegrityError):
+			bulk_insert_docs(
+				"Attendance Rollup",
+				[{"employee": self.employee, "company": "_Test Company", "period_start": self.month_start}],
+			)
+
+	def test_rebuild_attendance_rollup(self):
+		attendance = mark_attendance(self.employee, self.month_start, "Present", ignore_validate=True)
+		frappe.db.delete("Attendance", attendance)
+		self.assertTrue(self.get_rollup())
+
+		rebuild_attendance_rollup(self.month_start, self.month_start)
+		self.assertIsNone(self.get_rollup())
@@ -7,6 +7,8 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import get_link_to_form
 
+DEPARTMENT_APPROVERS = "hrms:department_approvers"
+
 
 class DepartmentApprover(Document):
 	pass
@@ -92,3 +94,77 @@ def get_approvers(doctype, txt, searchfield, start, page_len, filters):
 		frappe.throw(error_msg, title=_("{0} Missing").format(_(field_name)))
 
 	return set(tuple(approver) for approver in approvers)
+
+
+def get_department_approvers(department: str | None, parentfield: str) -> list[frappe._dict]:
+	"""Approvers of the type set on the department and its enabled ancestors, nearest department first"""
+	if not department:
+		return []
+
+	approvers = get_department_approver_map(parentfield).get(department, {}).get("approvers", [])
+	# copies, as the map is shared by the request
+	return [frappe._dict(approver) for approver in approvers]
+
+
+def get_default_department_approver(department: str | None, parentfield: str) -> str | None:
+	"""First approver of the type set on the department itself, used when the employee has none"""
+	if not department:
+		return None
+
+	return get_department_approver_map(parentfield).get(department, {}).get("default_approver")
+
+
+def get_department_approver_map(parentfield: str) -> dict[str, dict]:
+	"""Returns the default and inherited approvers of the type for every department, computed for the whole
+	department tree at once and cached until a department, employee or user changes"""
+	approver_map = frappe.cache().hget(DEPARTMENT_APPROVERS, parentfield)
+	if approver_map is None:
+		approver_map = build_department_approver_map(parentfield)
+		frappe.cache().hset(DEPARTMENT_APPROVERS, parentfield, approver_map)
+
+	return approver_map
+
+
+def build_department_approver_map(parentfield: str) -> dict[str, dict]:
+	departments = frappe.get_all("Department", fields=["name", "parent_department", "disabled"])
+
+	Approver = frappe.qb.DocType("Department Approver")
+	User = frappe.qb.DocType("User")
+	approvers = (
+		frappe.qb.from_(Approver)
+		.join(User)
+		.on(Approver.approver == User.name)
+		.select(Approver.parent, User.name, User.full_name)
+		.where(Approver.parentfield == parentfield)
+		.orderby(Approver.idx)
+	).run(as_dict=True)
+
+	department_approvers = {}
+	for d in approvers:
+		department_approvers.setdefault(d.pop("parent"), []).append(d)
+
+	parents = {d.name: d.parent_department for d in departments}
+	disabled = {d.name for d in departments if d.disabled}
+
+	approver_map = {}
+	for department in parents:
+		inherited, visited = {}, set()
+		current = department
+		while current and current not in visited:
+			visited.add(current)
+			if current not in disabled:
+				for approver in department_approvers.get(current, []):
+					inherited.setdefault(approver.name, approver)
+			current = parents.get(current)
+
+		own_approvers = department_approvers.get(department)
+		approver_map[department] = {
+			"default_approver": own_approvers[0].name if own_approvers else None,
+			"approvers": list(inherited.values()),
+		}
+
+	return approver_map
+
+
+def invalidate_department_approvers(doc, method=None):
+	frappe.cache().delete_value(DEPARTMENT_APPROVERS)
@@ -12,6 +12,7 @@ import erpnext
 from erpnext.accounts.doctype.journal_entry.journal_entry import get_default_bank_cash_account
 
 import hrms
+from hrms.api import clear_home_dashboard
 from hrms.hr.utils import validate_active_employee
 
 
@@ -61,6 +62,7 @@ class EmployeeAdvance(Document):
 	def publish_update(self):
 		employee_user = frappe.db.get_value("Employee", self.employee, "user_id", cache=True)
 		hrms.refetch_resource("hrms:employee_advance_balance", employee_user)
+		clear_home_dashboard([self.employee])
 
 	def validate_advance_account_type(self):
 		account_type = frappe.db.get_value("Account", self.advance_account, "account_type")
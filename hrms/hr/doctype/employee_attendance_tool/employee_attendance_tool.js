@@ -8,6 +8,11 @@ frappe.ui.form.on("Employee Attendance Tool", {
 
 	onload(frm) {
 		frm.set_value("date", frappe.datetime.get_today());
+		hrms.handle_realtime_bulk_action_notification(
+			frm,
+			"completed_employee_attendance_marking",
+			"Attendance",
+		);
 	},
 
 	date: function (frm) {
@@ -6,8 +6,15 @@ import datetime
 import json
 
 import frappe
+from frappe import _
 from frappe.model.document import Document
-from frappe.utils import getdate
+from frappe.utils import create_batch, get_link_to_form, getdate
+
+from hrms.api import clear_home_dashboard
+from hrms.hr.doctype.attendance.attendance import insert_attendance_in_bulk
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import update_attendance_rollup
+
+ATTENDANCE_CHUNK_SIZE = 500
 
 
 class EmployeeAttendanceTool(Document):
@@ -80,45 +87,37 @@ def get_employees(
 
 
 def _get_unmarked_attendance(employee_list: list[dict], attendance_list: list[dict]) -> list[dict]:
-	marked_employees = [entry.employee for entry in attendance_list]
-	unmarked_attendance = []
-
-	for entry in employee_list:
-		if entry.employee not in marked_employees:
-			unmarked_attendance.append(entry)
-
-	return unmarked_attendance
+	marked_employees = {entry.employee for entry in attendance_list}
+	return [entry for entry in employee_list if entry.employee not in marked_employees]
 
 
 def _get_unmarked_attendance_with_shift(unmarked_attendance, shift, date):
-	# Fetch employees based on Shift Assignment
-	shift_assigned_employees = frappe.get_list(
-		"Shift Assignment",
-		filters={
-			"shift_type": shift,
-			"start_date": ["<=", frappe.utils.getdate(date)],
-		},
-		fields=["employee"],
-	)
-	# Fetch employees based on default shifts
-	default_shift_employees = frappe.get_list(
-		"Employee",
-		filters={
-			"default_shift": shift,
-		},
-		fields=["employee"],
-	)
-
-	all_employees_with_shift = shift_assigned_employees + default_shift_employees
-	distinct_employees_with_shift = {emp["employee"] for emp in all_employees_with_shift}
-
-	# Filter unmarked attendance based on assigned employees
-	shiftwise_unmarked_attendance = []
-	for emp in unmarked_attendance:
-		if emp["employee"] in distinct_employees_with_shift:
-			shiftwise_unmarked_attendance.append(emp)
+	if not unmarked_attendance:
+		return []
+
+	ShiftAssignment = frappe.qb.DocType("Shift Assignment")
+	Employee = frappe.qb.DocType("Employee")
+	employees = [emp["employee"] for emp in unmarked_attendance]
+
+	# employees with the shift assigned or set as their default shift
+	shift_assigned_employees = (
+		frappe.qb.from_(ShiftAssignment)
+		.select(ShiftAssignment.employee)
+		.distinct()
+		.where(
+			(ShiftAssignment.shift_type == shift)
+			& (ShiftAssignment.start_date <= getdate(date))
+			& (ShiftAssignment.employee.isin(employees))
+		)
+	).run(pluck=True)
+	default_shift_employees = (
+		frappe.qb.from_(Employee)
+		.select(Employee.name)
+		.where((Employee.default_shift == shift) & (Employee.name.isin(employees)))
+	).run(pluck=True)
+	employees_with_shift = {*shift_assigned_employees, *default_shift_employees}
 
-	return shiftwise_unmarked_attendance
+	return [emp for emp in unmarked_attendance if emp["employee"] in employees_with_shift]
 
 
 @frappe.whitelist()
@@ -137,33 +136,106 @@ def mark_employee_attendance(
 ) -> None:
 	if isinstance(employee_list, str):
 		employee_list = json.loads(employee_list)
+	if isinstance(half_day_employee_list, str):
+		half_day_employee_list = json.loads(half_day_employee_list)
+
+	args = frappe._dict(
+		status=status,
+		date=date,
+		leave_type=leave_type,
+		company=company,
+		late_entry=late_entry,
+		early_exit=early_exit,
+		shift=shift,
+		mark_half_day=mark_half_day,
+		half_day_status=half_day_status,
+	)
 
-	for employee in employee_list:
-		leave_type = None
-		if status == "On Leave" and leave_type:
-			leave_type = leave_type
-
-		attendance = frappe.get_doc(
-			dict(
-				doctype="Attendance",
-				employee=employee,
-				attendance_date=getdate(date),
-				status=status,
-				leave_type=leave_type,
-				late_entry=late_entry,
-				early_exit=early_exit,
-				shift=shift,
+	if len(employee_list) <= ATTENDANCE_CHUNK_SIZE:
+		return _mark_employee_attendance(employee_list, half_day_employee_list, args)
+
+	frappe.enqueue(
+		_mark_employee_attendance,
+		timeout=3000,
+		employee_list=employee_list,
+		half_day_employee_list=half_day_employee_list,
+		args=args,
+		publish_progress=True,
+	)
+	frappe.msgprint(
+		_("Marking of attendance has been queued. It may take a few minutes."),
+		alert=True,
+		indicator="blue",
+	)
+
+
+def _mark_employee_attendance(
+	employee_list: list, half_day_employee_list: list | None, args: dict, publish_progress: bool = False
+) -> None:
+	records = [
+		{
+			"employee": employee,
+			"attendance_date": getdate(args.date),
+			"status": args.status,
+			"leave_type": args.leave_type if args.status == "On Leave" else None,
+			"late_entry": args.late_entry,
+			"early_exit": args.early_exit,
+			"shift": args.shift,
+		}
+		for employee in employee_list
+	]
+
+	success, failed, count = [], [], 0
+	for batch in create_batch(records, ATTENDANCE_CHUNK_SIZE):
+		inserted, failed_records = insert_attendance_in_bulk(batch)
+		success.extend(
+			{"doc": get_link_to_form("Attendance", d["name"]), "employee": d["employee"]} for d in inserted
+		)
+		failed.extend(failed_records)
+		count += len(batch)
+
+		if publish_progress:
+			# commit per chunk to avoid losing progress
+			frappe.db.commit()  # nosemgrep
+			frappe.publish_progress(count * 100 / len(records), title=_("Marking Attendance..."))
+
+	if failed and not publish_progress:
+		frappe.throw(
+			"<br>".join(d["error"] for d in failed),
+			title=_("Attendance could not be marked"),
+		)
+
+	if args.mark_half_day and half_day_employee_list:
+		update_half_day_attendance(half_day_employee_list, args)
+
+	if publish_progress:
+		for d in failed:
+			frappe.log_error(
+				f"Employee Attendance Tool - attendance failed for employee {d['employee']}: {d['error']}",
+				reference_doctype="Attendance",
 			)
+
+		frappe.publish_realtime(
+			"completed_employee_attendance_marking",
+			message={"success": success, "failure": [d["employee"] for d in failed]},
+			doctype="Employee Attendance Tool",
+			after_commit=True,
+		)
+
+
+def update_half_day_attendance(half_day_employee_list: list, args: dict) -> None:
+	Attendance = frappe.qb.DocType("Attendance")
+	(
+		frappe.qb.update(Attendance)
+		.set(Attendance.half_day_status, args.half_day_status)
+		.set(Attendance.shift, args.shift)
+		.set(Attendance.late_entry, args.late_entry)
+		.set(Attendance.early_exit, args.early_exit)
+		.set(Attendance.modify_half_day_status, 0)
+		.where(
+			(Attendance.employee.isin(half_day_employee_list))
+			& (Attendance.attendance_date == getdate(args.date))
 		)
-		attendance.insert()
-		attendance.submit()
-	if mark_half_day:
-		if isinstance(half_day_employee_list, str):
-			half_day_employee_list = json.loads(half_day_employee_list)
-		Attendance = frappe.qb.DocType("Attendance")
-		for employee in half_day_employee_list:
-			frappe.qb.update(Attendance).where(
-				(Attendance.employee == employee) & (Attendance.attendance_date == date)
-			).set(Attendance.half_day_status, half_day_status).set(Attendance.shift, shift).set(
-				Attendance.late_entry, late_entry
-			).set(Attendance.early_exit, early_exit).set(Attendance.modify_half_day_status, 0).run()
+	).run()
+	update_attendance_rollup(half_day_employee_list, args.date, args.date)
+	clear_home_dashboard(half_day_employee_list)
@@ -7,18 +7,30 @@ from datetime import datetime, timedelta
 import frappe
 from frappe import _
 from frappe.model.document import Document
-from frappe.utils import cint, get_datetime
+from frappe.query_builder.functions import Min
+from frappe.utils import add_days, cint, get_datetime, get_link_to_form, getdate
 
-from hrms.hr.doctype.shift_assignment.shift_assignment import get_actual_start_end_datetime_of_shift
-from hrms.hr.utils import (
-	get_distance_between_coordinates,
-	set_geolocation_from_coordinates,
-	validate_active_employee,
+from hrms.hr.doctype.employee_checkin.geofence import (
+	CheckinRadiusExceededError,
+	validate_checkin_location,
 )
-
-
-class CheckinRadiusExceededError(frappe.ValidationError):
-	pass
+from hrms.hr.doctype.shift_assignment.shift_assignment import (
+	get_actual_start_end_datetime_of_shift,
+	get_employee_shift_map,
+)
+from hrms.hr.utils import set_geolocation_from_coordinates, validate_active_employee
+
+SHIFT_FIELDS = (
+	"shift",
+	"shift_start",
+	"shift_end",
+	"shift_actual_start",
+	"shift_actual_end",
+	"offshift",
+	"overtime_type",
+)
+CHECKIN_FIELDS = ["name", "employee", "time", "log_type", "skip_auto_attendance", "attendance", *SHIFT_FIELDS]
+RELINK_EMPLOYEE_CHUNK_SIZE = 500
 
 
 class EmployeeCheckin(Document):
@@ -100,34 +112,7 @@ class EmployeeCheckin(Document):
 		if not (self.latitude or self.longitude):
 			frappe.throw(_("Latitude and longitude values are required for checking in."))
 
-		assignment_locations = frappe.get_all(
-			"Shift Assignment",
-			filters={
-				"employee": self.employee,
-				"shift_type": self.shift,
-				"start_date": ["<=", self.time],
-				"shift_location": ["is", "set"],
-				"docstatus": 1,
-				"status": "Active",
-			},
-			or_filters=[["end_date", ">=", self.time], ["end_date", "is", "not set"]],
-			pluck="shift_location",
-		)
-		if not assignment_locations:
-			return
-
-		checkin_radius, latitude, longitude = frappe.db.get_value(
-			"Shift Location", assignment_locations[0], ["checkin_radius", "latitude", "longitude"]
-		)
-		if checkin_radius <= 0:
-			return
-
-		distance = get_distance_between_coordinates(latitude, longitude, self.latitude, self.longitude)
-		if distance > checkin_radius:
-			frappe.throw(
-				_("You must be within {0} meters of your shift location to check in.").format(checkin_radius),
-				exc=CheckinRadiusExceededError,
-			)
+		validate_checkin_location(self.employee, self.shift, self.time, self.latitude, self.longitude)
 
 
 @frappe.whitelist()
@@ -187,14 +172,157 @@ def add_log_based_on_employee_field(
 
 
 @frappe.whitelist()
-def bulk_fetch_shift(checkins: list[str] | str) -> None:
+def bulk_fetch_shift(checkins: list[str] | str) -> dict:
 	if isinstance(checkins, str):
 		checkins = frappe.json.loads(checkins)
-	for d in checkins:
-		doc = frappe.get_doc("Employee Checkin", d)
-		doc.fetch_shift()
-		doc.flags.ignore_validate = True
-		doc.save()
+
+	frappe.has_permission("Employee Checkin", "write", throw=True)
+	summary = relink_checkins(
+		frappe.get_list("Employee Checkin", filters={"name": ("in", checkins)}, fields=CHECKIN_FIELDS)
+	)
+
+	if summary["skipped"]:
+		frappe.msgprint(
+			_("Shift was not fetched for these check-ins as their shift requires a Log Type: {0}").format(
+				", ".join(get_link_to_form("Employee Checkin", name) for name in summary["skipped"])
+			),
+			title=_("Check-ins Skipped"),
+			indicator="orange",
+		)
+
+	return summary
+
+
+def relink_checkins(checkins: list[dict]) -> dict:
+	"""Resolves shifts of the check-ins like `EmployeeCheckin.fetch_shift` does, with the employees'
+	assignments loaded once, and writes the changed check-ins with set-based updates"""
+	summary = {"updated": 0, "skipped": []}
+	if not checkins:
+		return summary
+
+	timestamps = [get_datetime(d.time) for d in checkins]
+	shift_map = get_employee_shift_map(
+		list({d.employee for d in checkins}), min(timestamps).date(), max(timestamps).date()
+	)
+
+	updates = {}
+	for checkin, timestamp in zip(checkins, timestamps, strict=True):
+		values = {field: checkin[field] for field in SHIFT_FIELDS}
+		shift_actual_timings = get_actual_start_end_datetime_of_shift(
+			checkin.employee, timestamp, True, shift_map
+		)
+
+		if not shift_actual_timings:
+			values.update(shift=None, offshift=1)
+		elif (
+			shift_actual_timings.shift_type.determine_check_in_and_check_out
+			== "Strictly based on Log Type in Employee Checkin"
+			and not checkin.log_type
+			and not checkin.skip_auto_attendance
+		):
+			# log type is required for check-ins falling in the shift
+			summary["skipped"].append(checkin.name)
+			continue
+		elif not checkin.attendance:
+			values.update(
+				offshift=0,
+				shift=shift_actual_timings.shift_type.name,
+				shift_actual_start=shift_actual_timings.actual_start,
+				shift_actual_end=shift_actual_timings.actual_end,
+				shift_start=shift_actual_timings.start_datetime,
+				shift_end=shift_actual_timings.end_datetime,
+				overtime_type=shift_actual_timings.overtime_type or None,
+			)
+
+		if any(checkin[field] != value for field, value in values.items()):
+			updates[checkin.name] = values
+
+	frappe.db.bulk_update("Employee Checkin", updates, chunk_size=500)
+	summary["updated"] = len(updates)
+
+	return summary
+
+
+def relink_checkins_for_shift_type(shift_type: str, from_date, to_date, commit: bool = False) -> dict:
+	"""Re-resolves shifts of check-ins without attendance between the dates, for employees linked to the shift
+	type through check-ins, assignments or their default shift. Run after the shift's timings change"""
+	from_date, to_date = getdate(from_date), getdate(to_date)
+	from_time, to_time = get_datetime(from_date), get_datetime(add_days(to_date, 1))
+	Assignment = frappe.qb.DocType("Shift Assignment")
+
+	employees = set(
+		frappe.get_all(
+			"Employee Checkin",
+			filters={
+				"shift": shift_type,
+				"time": (">=", from_time),
+				"attendance": ("is", "not set"),
+			},
+			pluck="employee",
+			distinct=True,
+		)
+	)
+	employees.update(
+		frappe.qb.from_(Assignment)
+		.select(Assignment.employee)
+		.distinct()
+		.where(
+			(Assignment.shift_type == shift_type)
+			& (Assignment.docstatus == 1)
+			& (Assignment.start_date <= to_date)
+			& (Assignment.end_date.isnull() | (Assignment.end_date >= from_date))
+		)
+		.run(pluck=True)
+	)
+	employees.update(frappe.get_all("Employee", filters={"default_shift": shift_type}, pluck="name"))
+
+	summary = {"updated": 0, "skipped": []}
+	employees = sorted(employees)
+	for idx in range(0, len(employees), RELINK_EMPLOYEE_CHUNK_SIZE):
+		checkins = frappe.get_all(
+			"Employee Checkin",
+			filters=[
+				["employee", "in", employees[idx : idx + RELINK_EMPLOYEE_CHUNK_SIZE]],
+				["time", ">=", from_time],
+				["time", "<", to_time],
+				["attendance", "is", "not set"],
+			],
+			fields=CHECKIN_FIELDS,
+		)
+		result = relink_checkins(checkins)
+		summary["updated"] += result["updated"]
+		summary["skipped"].extend(result["skipped"])
+
+		if commit:
+			frappe.db.commit()  # nosemgrep
+
+	return summary
+
+
+def enqueue_relink_checkins_for_shift_type(shift_type: str) -> None:
+	"""Re-links check-ins not marked in attendance yet, from the oldest one of the shift until today"""
+	Checkin = frappe.qb.DocType("Employee Checkin")
+	oldest_checkin = (
+		frappe.qb.from_(Checkin)
+		.select(Min(Checkin.time))
+		.where((Checkin.shift == shift_type) & (Checkin.attendance.isnull()))
+	).run()[0][0]
+	process_attendance_after = frappe.db.get_value("Shift Type", shift_type, "process_attendance_after")
+
+	from_dates = [getdate(d) for d in (oldest_checkin, process_attendance_after) if d]
+	if not from_dates:
+		return
+
+	frappe.enqueue(
+		relink_checkins_for_shift_type,
+		queue="long",
+		timeout=3000,
+		shift_type=shift_type,
+		from_date=min(from_dates),
+		to_date=getdate(),
+		commit=True,
+		enqueue_after_commit=True,
+	)
 
 
 def mark_attendance_and_link_log(
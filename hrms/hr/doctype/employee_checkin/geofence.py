@@ -0,0 +1,189 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+from frappe.query_builder import Order
+from frappe.utils import add_days, get_datetime, getdate, today
+
+from hrms.hr.doctype.shift_assignment.shift_assignment import (
+	get_actual_start_end_datetime_of_shift,
+	get_employee_shift_map,
+)
+from hrms.hr.utils import get_distance_between_coordinates
+
+SHIFT_GEOFENCE = "hrms:shift_geofence"
+SHIFT_GEOFENCE_TTL = 24 * 60 * 60
+# assignments that ended before this many days ago are not cached, older punches are checked against the db
+GEOFENCE_HISTORY_DAYS = 31
+
+
+class CheckinRadiusExceededError(frappe.ValidationError):
+	pass
+
+
+def get_employee_geofences(employees: list | set, for_date=None) -> dict[str, list]:
+	"""Returns the active shift assignments with a shift location of each employee, along with the location's
+	radius and coordinates. Served from the cache for dates within the cached window, missing employees are
+	loaded together with one query"""
+	for_date = getdate(for_date or today())
+	cached_from = add_days(getdate(today()), -GEOFENCE_HISTORY_DAYS)
+	if for_date < cached_from:
+		return load_geofences(employees, for_date)
+
+	geofences, missing = {}, []
+	for employee in set(employees):
+		cached = frappe.cache().get_value(get_cache_key(employee))
+		if cached is None or for_date < cached["from_date"]:
+			missing.append(employee)
+		else:
+			geofences[employee] = cached["geofences"]
+
+	if missing:
+		loaded = load_geofences(missing, cached_from)
+		for employee in missing:
+			geofences[employee] = loaded.get(employee, [])
+			frappe.cache().set_value(
+				get_cache_key(employee),
+				{"from_date": cached_from, "geofences": geofences[employee]},
+				expires_in_sec=SHIFT_GEOFENCE_TTL,
+			)
+
+	return geofences
+
+
+def load_geofences(employees: list | set, from_date) -> dict[str, list]:
+	Assignment = frappe.qb.DocType("Shift Assignment")
+	ShiftLocation = frappe.qb.DocType("Shift Location")
+
+	assignments = (
+		frappe.qb.from_(Assignment)
+		.inner_join(ShiftLocation)
+		.on(Assignment.shift_location == ShiftLocation.name)
+		.select(
+			Assignment.employee,
+			Assignment.shift_type,
+			Assignment.start_date,
+			Assignment.end_date,
+			Assignment.shift_location,
+			ShiftLocation.checkin_radius,
+			ShiftLocation.latitude,
+			ShiftLocation.longitude,
+		)
+		.where(
+			(Assignment.employee.isin(list(employees)))
+			& (Assignment.docstatus == 1)
+			& (Assignment.status == "Active")
+			& (Assignment.end_date.isnull() | (Assignment.end_date >= from_date))
+		)
+		# latest assignment wins, as in the list view
+		.orderby(Assignment.creation, order=Order.desc)
+	).run(as_dict=True)
+
+	geofences = {}
+	for d in assignments:
+		geofences.setdefault(d.pop("employee"), []).append(d)
+
+	return geofences
+
+
+def get_geofence(geofences: list, shift: str, time) -> dict | None:
+	"""Shift location of the employee's assignment of the shift active at the time"""
+	time = get_datetime(time)
+	return next(
+		(
+			d
+			for d in geofences
+			if d.shift_type == shift
+			and get_datetime(d.start_date) <= time
+			and (not d.end_date or get_datetime(d.end_date) >= time)
+		),
+		None,
+	)
+
+
+def get_distance_from_geofence(geofence: dict | None, latitude, longitude) -> float | None:
+	"""Distance in meters from the shift location, None if the punch does not need to be within a radius"""
+	if not geofence or geofence.checkin_radius <= 0:
+		return None
+
+	return get_distance_between_coordinates(geofence.latitude, geofence.longitude, latitude, longitude)
+
+
+def validate_checkin_location(employee: str, shift: str, time, latitude, longitude) -> None:
+	"""Raises `CheckinRadiusExceededError` if the punch is farther from the shift location than its radius"""
+	geofences = get_employee_geofences([employee], get_datetime(time)).get(employee, [])
+	geofence = get_geofence(geofences, shift, time)
+
+	distance = get_distance_from_geofence(geofence, latitude, longitude)
+	if distance is not None and distance > geofence.checkin_radius:
+		frappe.throw(
+			_("You must be within {0} meters of your shift location to check in.").format(
+				geofence.checkin_radius
+			),
+			exc=CheckinRadiusExceededError,
+		)
+
+
+@frappe.whitelist()
+def validate_checkin_locations(punches: str | list) -> list[dict]:
+	"""Validates a batch of punches, e.g. ones synced together by the mobile app, against the shift locations.
+	Each punch needs `employee`, `time`, `latitude` and `longitude`; the shift is resolved from the
+	assignments if the punch has none. Returns the result of each punch in the same order, with the distance
+	from the shift location if the punch has to be within its radius"""
+	punches = [frappe._dict(punch) for punch in frappe.parse_json(punches)]
+	frappe.has_permission("Employee Checkin", "create", throw=True)
+	if not punches:
+		return []
+
+	employees = {punch.employee for punch in punches}
+	for employee in employees:
+		frappe.has_permission("Employee", "read", employee, throw=True)
+
+	for punch in punches:
+		punch.time = get_datetime(punch.time)
+
+	dates = [getdate(punch.time) for punch in punches]
+	shift_map = None
+	if any(not punch.shift for punch in punches):
+		shift_map = get_employee_shift_map(list(employees), min(dates), max(dates))
+
+	tracking = frappe.db.get_single_value("HR Settings", "allow_geolocation_tracking")
+	geofences = get_employee_geofences(employees, min(dates)) if tracking else {}
+	results = []
+	for punch in punches:
+		shift = punch.shift
+		if not shift:
+			timings = get_actual_start_end_datetime_of_shift(punch.employee, punch.time, True, shift_map)
+			shift = timings.shift_type.name if timings else None
+
+		result = frappe._dict(employee=punch.employee, time=punch.time, shift=shift, valid=True)
+		if tracking and not (punch.latitude or punch.longitude):
+			result.valid = False
+			result.message = _("Latitude and longitude values are required for checking in.")
+		elif geofence := get_geofence(geofences.get(punch.employee, []), shift, punch.time):
+			distance = get_distance_from_geofence(geofence, punch.latitude, punch.longitude)
+			result.update(
+				shift_location=geofence.shift_location,
+				checkin_radius=geofence.checkin_radius,
+				distance=distance,
+				valid=distance is None or distance <= geofence.checkin_radius,
+			)
+		results.append(result)
+
+	return results
+
+
+def get_cache_key(employee: str) -> str:
+	return f"{SHIFT_GEOFENCE}:{employee}"
+
+
+def clear_employee_geofences(employees: list | set) -> None:
+	"""Clears cached geofences of the employees, for paths writing shift assignments directly to the db"""
+	for employee in set(employees):
+		frappe.cache().delete_value(get_cache_key(employee))
+
+
+def clear_all_geofences() -> None:
+	"""Clears the cached geofences of everyone, they hold a copy of the shift locations' coordinates and radius"""
+	frappe.cache().delete_keys(SHIFT_GEOFENCE)
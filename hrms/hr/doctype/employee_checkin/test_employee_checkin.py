@@ -24,6 +24,7 @@ from hrms.hr.doctype.employee_checkin.employee_checkin import (
 	bulk_fetch_shift,
 	calculate_working_hours,
 	mark_attendance_and_link_log,
+	relink_checkins_for_shift_type,
 )
 from hrms.hr.doctype.leave_type.test_leave_type import create_leave_type
 from hrms.hr.doctype.shift_type.test_shift_type import make_shift_assignment, setup_shift_type
@@ -551,6 +552,38 @@ class TestEmployeeCheckin(IntegrationTestCase):
 		# not allowed as distance (15004m) is not within checkin radius
 		self.assertRaises(CheckinRadiusExceededError, log.insert)
 
+	@change_settings("HR Settings", {"allow_geolocation_tracking": 1})
+	def test_validate_checkin_locations(self):
+		from hrms.hr.doctype.employee_checkin.geofence import validate_checkin_locations
+
+		employee = make_employee("test_shift@example.com", company="_Test Company")
+		# 8 - 12
+		shift = setup_shift_type()
+		date = getdate()
+		location = make_shift_location("Loc A", 24, 72)
+		assignment = make_shift_assignment(shift.name, employee, date, shift_location=location.name)
+
+		def punch(time, latitude=None, longitude=None):
+			time = datetime.combine(date, get_time(time))
+			return {"employee": employee, "time": time, "latitude": latitude, "longitude": longitude}
+
+		# 150m away with the shift resolved from the assignment, 1506m away and without coordinates
+		punches = [punch("10:00:00", 24.001, 72.001), punch("10:30:00", 24.01, 72.01), punch("10:45:00")]
+		results = validate_checkin_locations(punches)
+		self.assertEqual([d.valid for d in results], [True, False, False])
+		self.assertEqual(results[0].shift, shift.name)
+		self.assertEqual(results[1].checkin_radius, 500)
+
+		# cached geofences are cleared on location and assignment changes
+		location.checkin_radius = 2000
+		location.save()
+		self.assertEqual([d.valid for d in validate_checkin_locations(punches[:2])], [True, True])
+
+		assignment.cancel()
+		results = validate_checkin_locations(punches[:2])
+		self.assertEqual([d.valid for d in results], [True, True])
+		self.assertIsNone(results[1].shift_location)
+
 	def test_bulk_fetch_shift(self):
 		emp1 = make_employee("emp1@example.com", company="_Test Company")
 		emp2 = make_employee("emp2@example.com", company="_Test Company")
@@ -613,6 +646,45 @@ class TestEmployeeCheckin(IntegrationTestCase):
 		log2.reload()
 		self.assertEqual(log2.shift_actual_start, datetime.combine(date, get_time("06:00:00")))
 
+		# check-ins without a log type are skipped and reported when the shift needs one
+		shift.determine_check_in_and_check_out = "Strictly based on Log Type in Employee Checkin"
+		shift.save()
+		log1.db_set("log_type", None)
+		self.assertEqual(bulk_fetch_shift([log1.name, log2.name])["skipped"], [log1.name])
+
+	def test_relink_checkins_for_shift_type(self):
+		emp1 = make_employee("relinkemp1@example.com", company="_Test Company")
+		emp2 = make_employee("relinkemp2@example.com", company="_Test Company")
+
+		# 8 - 12
+		shift = setup_shift_type(shift_type="Test Relink Shift")
+		date = getdate()
+		make_shift_assignment(shift.name, emp1, date)
+		make_shift_assignment(shift.name, emp2, date)
+
+		# outside the shift's 7:00 - 13:00 window
+		log1 = make_checkin(emp1, datetime.combine(date, get_time("06:30:00")))
+		self.assertEqual(log1.offshift, 1)
+		log2 = make_checkin(emp1, datetime.combine(date, get_time("08:00:00")))
+		log3 = make_checkin(emp2, datetime.combine(date, get_time("08:00:00")))
+		mark_attendance_and_link_log([log3], "Present", date)
+
+		shift.begin_check_in_before_shift_start_time = 120
+		shift.save()
+		summary = relink_checkins_for_shift_type(shift.name, date, date)
+		self.assertEqual(summary, {"updated": 2, "skipped": []})
+
+		# now within the shift's 6:00 - 13:00 window
+		log1.reload()
+		self.assertEqual(log1.offshift, 0)
+		self.assertEqual(log1.shift, shift.name)
+		self.assertEqual(log1.shift_actual_start, datetime.combine(date, get_time("06:00:00")))
+		log2.reload()
+		self.assertEqual(log2.shift_actual_start, datetime.combine(date, get_time("06:00:00")))
+		# check-ins with attendance are left as is
+		log3.reload()
+		self.assertEqual(log3.shift_actual_start, datetime.combine(date, get_time("07:00:00")))
+
 	def test_if_logs_are_marked_invalid(self):
 		# time window is 7 to 13
 		shift = setup_shift_type()
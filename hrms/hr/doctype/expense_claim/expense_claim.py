@@ -23,8 +23,12 @@ from erpnext.accounts.utils import (
 from erpnext.controllers.accounts_controller import AccountsController
 
 import hrms
+from hrms.api import clear_home_dashboard
 from hrms.hr.utils import set_employee_name, share_doc_with_approver, validate_active_employee
-from hrms.mixins.pwa_notifications import PWANotificationsMixin
+from hrms.mixins.pwa_notifications import PWANotificationsMixin, insert_pwa_notifications
+
+EXPENSE_CLAIM_BULK_ACTIONS = ("Approve", "Reject", "Submit")
+EXPENSE_CLAIM_CHUNK_SIZE = 100
 
 
 class InvalidExpenseApproverError(frappe.ValidationError):
@@ -66,30 +70,7 @@ class ExpenseClaim(AccountsController, PWANotificationsMixin):
 			self.project = frappe.db.get_value("Task", self.task, "project")
 
 	def set_status(self, update=False):
-		status = {"0": "Draft", "1": "Submitted", "2": "Cancelled"}[cstr(self.docstatus or 0)]
-
-		precision = self.precision("grand_total")
-
-		if self.docstatus == 1:
-			if self.approval_status == "Approved":
-				if (
-					# set as paid
-					self.is_paid
-					or (
-						flt(self.total_sanctioned_amount) > 0
-						and (
-							# grand total is reimbursed
-							(flt(self.grand_total, precision) == flt(self.total_amount_reimbursed, precision))
-							# grand total (to be paid) is 0 since linked advances already cover the claimed amount
-							or (flt(self.grand_total, precision) == 0)
-						)
-					)
-				):
-					status = "Paid"
-				elif flt(self.total_sanctioned_amount) > 0:
-					status = "Unpaid"
-			elif self.approval_status == "Rejected":
-				status = "Rejected"
+		status = get_expense_claim_status(self, self.precision("grand_total"))
 
 		if update:
 			self.db_set("status", status)
@@ -137,6 +118,7 @@ class ExpenseClaim(AccountsController, PWANotificationsMixin):
 		employee_user = frappe.db.get_value("Employee", self.employee, "user_id", cache=True)
 		hrms.refetch_resource("hrms:my_claims", employee_user)
 		hrms.refetch_resource("hrms:team_claims")
+		clear_home_dashboard([self.employee])
 
 	def on_submit(self):
 		if self.approval_status == "Draft":
@@ -551,6 +533,33 @@ class ExpenseClaim(AccountsController, PWANotificationsMixin):
 				update_reference_in_payment_entry(pe_ref, payment_entry, skip_ref_details_update_for_pe=True)
 
 
+def get_expense_claim_status(claim, precision: int) -> str:
+	status = {"0": "Draft", "1": "Submitted", "2": "Cancelled"}[cstr(claim.docstatus or 0)]
+
+	if claim.docstatus == 1:
+		if claim.approval_status == "Approved":
+			if (
+				# set as paid
+				claim.is_paid
+				or (
+					flt(claim.total_sanctioned_amount) > 0
+					and (
+						# grand total is reimbursed
+						(flt(claim.grand_total, precision) == flt(claim.total_amount_reimbursed, precision))
+						# grand total (to be paid) is 0 since linked advances already cover the claimed amount
+						or (flt(claim.grand_total, precision) == 0)
+					)
+				)
+			):
+				status = "Paid"
+			elif flt(claim.total_sanctioned_amount) > 0:
+				status = "Unpaid"
+		elif claim.approval_status == "Rejected":
+			status = "Rejected"
+
+	return status
+
+
 def update_reimbursed_amount(doc):
 	total_amount_reimbursed = get_total_reimbursed_amount(doc)
 
@@ -850,13 +859,121 @@ def update_payment_for_expense_claim(doc, method=None):
 
 	payment_table, doctype_field = doctype_field_map[doc.doctype]
 
-	for d in doc.get(payment_table):
-		if d.get(doctype_field) == "Expense Claim" and d.reference_name:
-			expense_claim = frappe.get_doc("Expense Claim", d.reference_name)
-			update_reimbursed_amount(expense_claim)
+	references = [
+		d for d in doc.get(payment_table) if d.get(doctype_field) == "Expense Claim" and d.reference_name
+	]
+	if not references:
+		return
+
+	expense_claims = update_reimbursed_amounts({d.reference_name for d in references})
+
+	if doc.doctype == "Payment Entry":
+		# updates outstanding amount back in Payment Entry references
+		outstanding_amounts = {
+			name: get_outstanding_amount_for_claim(claim) for name, claim in expense_claims.items()
+		}
+		frappe.db.bulk_update(
+			"Payment Entry Reference",
+			{d.name: {"outstanding_amount": outstanding_amounts[d.reference_name]} for d in references},
+		)
+
+
+def update_reimbursed_amounts(expense_claims: set[str]) -> dict[str, dict]:
+	"""Recomputes reimbursed amount and status of the claims with grouped queries and writes them in bulk.
+	Batched version of `update_reimbursed_amount` for payments settling many claims at once"""
+	claims = {
+		d.name: d
+		for d in frappe.get_all(
+			"Expense Claim",
+			filters={"name": ("in", list(expense_claims))},
+			fields=[
+				"name",
+				"employee",
+				"docstatus",
+				"approval_status",
+				"is_paid",
+				"grand_total",
+				"total_sanctioned_amount",
+				"total_taxes_and_charges",
+				"total_advance_amount",
+			],
+		)
+	}
+	reimbursed_amounts = get_total_reimbursed_amounts([name for name, d in claims.items() if not d.is_paid])
+	precision = frappe.get_precision("Expense Claim", "grand_total")
+
+	updates = {}
+	for name, claim in claims.items():
+		# No need to check for cancelled state here as it will anyways update status as cancelled
+		claim.total_amount_reimbursed = (
+			claim.grand_total if claim.is_paid else reimbursed_amounts.get(name, 0)
+		)
+		claim.status = get_expense_claim_status(claim, precision)
+		updates[name] = {"total_amount_reimbursed": claim.total_amount_reimbursed, "status": claim.status}
+
+	frappe.db.bulk_update("Expense Claim", updates)
+	clear_home_dashboard({d.employee for d in claims.values()})
+	publish_expense_claim_updates(claims.values())
+
+	return claims
+
 
-			if doc.doctype == "Payment Entry":
-				update_outstanding_amount_in_payment_entry(expense_claim, d.name)
+def get_total_reimbursed_amounts(expense_claims: list[str]) -> dict[str, float]:
+	"""Returns the amount reimbursed via Journal and Payment Entries for each claim, in two grouped queries"""
+	if not expense_claims:
+		return {}
+
+	JournalEntryAccount = frappe.qb.DocType("Journal Entry Account")
+	PaymentEntryReference = frappe.qb.DocType("Payment Entry Reference")
+
+	amount_via_jv = (
+		frappe.qb.from_(JournalEntryAccount)
+		.select(
+			JournalEntryAccount.reference_name,
+			Sum(
+				JournalEntryAccount.debit_in_account_currency - JournalEntryAccount.credit_in_account_currency
+			),
+		)
+		.where(
+			(JournalEntryAccount.reference_name.isin(expense_claims)) & (JournalEntryAccount.docstatus == 1)
+		)
+		.groupby(JournalEntryAccount.reference_name)
+	).run()
+
+	amount_via_payment_entry = (
+		frappe.qb.from_(PaymentEntryReference)
+		.select(PaymentEntryReference.reference_name, Sum(PaymentEntryReference.allocated_amount))
+		.where(
+			(PaymentEntryReference.reference_name.isin(expense_claims))
+			& (PaymentEntryReference.docstatus == 1)
+		)
+		.groupby(PaymentEntryReference.reference_name)
+	).run()
+
+	reimbursed_amounts = {}
+	for name, amount in (*amount_via_jv, *amount_via_payment_entry):
+		reimbursed_amounts[name] = reimbursed_amounts.get(name, 0) + flt(amount)
+
+	return reimbursed_amounts
+
+
+def publish_expense_claim_updates(claims) -> None:
+	"""Realtime updates otherwise sent by `set_status(update=True)` for each claim"""
+	employees = {claim.employee for claim in claims}
+	employee_users = frappe.get_all(
+		"Employee", filters={"name": ("in", list(employees))}, pluck="user_id", distinct=True
+	)
+	for user in employee_users:
+		if user:
+			hrms.refetch_resource("hrms:my_claims", user)
+	hrms.refetch_resource("hrms:team_claims")
+
+	for claim in claims:
+		frappe.publish_realtime(
+			"list_update",
+			{"doctype": "Expense Claim", "name": claim.name, "user": frappe.session.user},
+			after_commit=True,
+		)
 
 
 def update_outstanding_amount_in_payment_entry(expense_claim: dict, pe_reference: str):
@@ -900,3 +1017,103 @@ def get_allocation_amount(paid_amount=None, claimed_amount=None, return_amount=N
 		return flt(paid_amount) - (flt(claimed_amount) + flt(return_amount))
 	else:
 		frappe.throw(_("Invalid parameters provided. Please pass the required arguments."))
+
+
+@frappe.whitelist()
+def bulk_update_expense_claims(expense_claims: str | list, action: str) -> dict | None:
+	"""Approves, rejects or submits Expense Claims in bulk. Large lists are processed in a background job.
+	Returns the updated and failed claims, with the error of each failure, when processed inline"""
+	expense_claims = list(dict.fromkeys(frappe.parse_json(expense_claims) or []))
+	if action not in EXPENSE_CLAIM_BULK_ACTIONS:
+		frappe.throw(_("Action must be one of {0}").format(", ".join(EXPENSE_CLAIM_BULK_ACTIONS)))
+	if not expense_claims:
+		frappe.throw(_("Please select Expense Claims"), title=_("No Expense Claims Selected"))
+
+	if len(expense_claims) <= 30:
+		return _bulk_update_expense_claims(expense_claims, action)
+
+	frappe.enqueue(
+		_bulk_update_expense_claims,
+		queue="long",
+		timeout=3000,
+		expense_claims=expense_claims,
+		action=action,
+		commit=True,
+	)
+	frappe.msgprint(
+		_("Updating {0} Expense Claims has been queued. It may take a few minutes.").format(
+			len(expense_claims)
+		),
+		alert=True,
+		indicator="blue",
+	)
+
+
+def _bulk_update_expense_claims(expense_claims: list, action: str, commit: bool = False) -> dict:
+	success, failure = [], []
+	notifications = []
+	accounts = {}
+	savepoint = "before_expense_claim_update"
+
+	for idx, name in enumerate(expense_claims, start=1):
+		try:
+			frappe.db.savepoint(savepoint)
+			expense_claim = frappe.get_doc("Expense Claim", name)
+			set_missing_accounts(expense_claim, accounts)
+			expense_claim.flags.pwa_notifications = []
+
+			if action == "Submit":
+				expense_claim.submit()
+			else:
+				expense_claim.approval_status = "Approved" if action == "Approve" else "Rejected"
+				expense_claim.save()
+		except Exception as e:
+			frappe.db.rollback(save_point=savepoint)
+			frappe.clear_last_message()
+			frappe.log_error(
+				f"Bulk {action} failed for Expense Claim {name}.", reference_doctype="Expense Claim"
+			)
+			failure.append({"doc": name, "error": str(e)})
+		else:
+			notifications.extend(expense_claim.flags.pwa_notifications)
+			success.append({"doc": name, "employee": expense_claim.employee})
+
+		if idx % EXPENSE_CLAIM_CHUNK_SIZE == 0 or idx == len(expense_claims):
+			insert_pwa_notifications(notifications)
+			notifications = []
+
+			if commit:
+				frappe.db.commit()  # nosemgrep
+
+			frappe.publish_progress(idx * 100 / len(expense_claims), title=_("Updating Expense Claims..."))
+
+	result = {"success": success, "failure": failure}
+	frappe.publish_realtime(
+		"completed_bulk_expense_claim_update",
+		message=result,
+		doctype="Expense Claim",
+		user=frappe.session.user,
+		after_commit=True,
+	)
+	return result
+
+
+def set_missing_accounts(expense_claim, accounts: dict) -> None:
+	"""Sets missing expense accounts and cost centers, sharing lookups across claims of a bulk action"""
+	for expense in expense_claim.expenses:
+		if expense.default_account and expense.cost_center:
+			continue
+
+		key = (expense.expense_type, expense_claim.company)
+		if key not in accounts:
+			accounts[key] = get_expense_claim_account_and_cost_center(*key)
+
+		expense.default_account = expense.default_account or accounts[key]["account"]
+		expense.cost_center = expense.cost_center or accounts[key]["cost_center"]
+
+
+def on_doctype_update():
+	# bank reconciliation matching for paid claims
+	frappe.db.add_index(
+		"Expense Claim", ["is_paid", "clearance_date", "total_amount_reimbursed", "posting_date"]
+	)
@@ -1,3 +1,70 @@
 frappe.listview_settings["Expense Claim"] = {
 	add_fields: ["company"],
+	onload: function (listview) {
+		if (!frappe.boot.user.can_write.includes("Expense Claim")) return;
+
+		[
+			["Approve", __("Approve")],
+			["Reject", __("Reject")],
+			["Submit", __("Submit")],
+		].forEach(([action, label]) => {
+			listview.page.add_action_item(label, () => {
+				const expense_claims = listview.get_checked_items().map((claim) => claim.name);
+				if (!expense_claims.length) {
+					frappe.throw(__("Please select Expense Claims"));
+					return;
+				}
+
+				frappe.confirm(
+					__("{0} {1} Expense Claim(s)?", [label, expense_claims.length]),
+					() => {
+						frappe.call({
+							method: "hrms.hr.doctype.expense_claim.expense_claim.bulk_update_expense_claims",
+							freeze: true,
+							args: {
+								expense_claims,
+								action,
+							},
+							callback: () => listview.refresh(),
+						});
+					},
+				);
+			});
+		});
+
+		frappe.realtime.off("completed_bulk_expense_claim_update");
+		frappe.realtime.on("completed_bulk_expense_claim_update", (message) => {
+			listview.refresh();
+			if (!message.failure.length) {
+				frappe.show_alert({
+					message: __("{0} Expense Claim(s) updated", [message.success.length]),
+					indicator: "green",
+				});
+				return;
+			}
+
+			let failures = `<table class="table table-bordered"><tr>
+				<th>${__("Expense Claim")}</th><th>${__("Error")}</th>
+			</tr>`;
+			for (const d of message.failure) {
+				const doc = frappe.utils.escape_html(d.doc);
+				failures += `<tr>
+					<td>${frappe.utils.get_form_link("Expense Claim", d.doc, true, doc)}</td>
+					<td>${frappe.utils.escape_html(d.error)}</td>
+				</tr>`;
+			}
+			failures += "</table>";
+
+			frappe.msgprint({
+				title: message.success.length ? __("Partial Success") : __("Failure"),
+				message:
+					__("{0} Expense Claim(s) updated, {1} failed:", [
+						message.success.length,
+						message.failure.length,
+					]) + failures,
+				indicator: message.success.length ? "orange" : "red",
+				wide: true,
+			});
+		});
+	},
 };
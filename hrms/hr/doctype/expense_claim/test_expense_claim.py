@@ -12,10 +12,12 @@ from erpnext.setup.utils import get_exchange_rate
 
 from hrms.hr.doctype.expense_claim.expense_claim import (
 	MismatchError,
+	bulk_update_expense_claims,
 	get_outstanding_amount_for_claim,
 	make_bank_entry,
 	make_expense_claim_for_delivery_trip,
 )
+from hrms.hr.utils import get_ec_matches_for_bank_transactions
 from hrms.tests.utils import HRMSTestSuite
 
 company_name = "_Test Company 3"
@@ -117,6 +119,60 @@ class TestExpenseClaim(HRMSTestSuite):
 		expense_claim.load_from_db()
 		self.assertEqual(expense_claim.status, "Unpaid")
 
+	def test_payment_entry_against_multiple_claims(self):
+		from hrms.overrides.employee_payment_entry import get_payment_entry_for_employee
+
+		payable_account = get_payable_account(company_name)
+		employee = make_employee("test_multi_claim_payment@expenseclaim.com", company_name)
+		claims = [
+			make_expense_claim(
+				payable_account, 300, 200, company_name, "Travel Expenses - _TC3", employee=employee
+			).name
+			for _ in range(3)
+		]
+
+		# pays the first two claims in full and the last one partially
+		pe = get_payment_entry_for_employee("Expense Claim", claims[0])
+		pe.reference_no = "1"
+		pe.reference_date = nowdate()
+		pe.source_exchange_rate = 1
+		for claim, amount in zip(claims[1:], (200, 50), strict=True):
+			pe.append(
+				"references",
+				{
+					"reference_doctype": "Expense Claim",
+					"reference_name": claim,
+					"total_amount": 200,
+					"outstanding_amount": 200,
+					"allocated_amount": amount,
+				},
+			)
+		pe.paid_amount = pe.received_amount = 450
+		pe.insert()
+		pe.submit()
+
+		def get_claims():
+			return {
+				d.name: (d.status, d.total_amount_reimbursed)
+				for d in frappe.get_all(
+					"Expense Claim",
+					{"name": ("in", claims)},
+					["name", "status", "total_amount_reimbursed"],
+				)
+			}
+
+		self.assertEqual(
+			get_claims(), {claims[0]: ("Paid", 200), claims[1]: ("Paid", 200), claims[2]: ("Unpaid", 50)}
+		)
+		pe.reload()
+		self.assertEqual(
+			{d.reference_name: d.outstanding_amount for d in pe.references},
+			{claims[0]: 0, claims[1]: 0, claims[2]: 150},
+		)
+
+		pe.cancel()
+		self.assertEqual(get_claims(), {claim: ("Unpaid", 0) for claim in claims})
+
 	def test_expense_claim_status_as_payment_allocation_using_pr(self):
 		# Allocation via Payment Reconciliation Tool for mutiple employees using journal entry
 		payable_account = get_payable_account(company_name)
@@ -411,6 +467,40 @@ class TestExpenseClaim(HRMSTestSuite):
 		)
 		self.assertEqual(len(gl_entry), 0)
 
+	def test_bulk_update_expense_claims(self):
+		payable_account = get_payable_account(company_name)
+		claims = [
+			make_expense_claim(
+				payable_account,
+				300,
+				200,
+				company_name,
+				"Travel Expenses - _TC3",
+				do_not_submit=True,
+				approval_status="Draft",
+			)
+			for _ in range(2)
+		]
+		names = [claim.name for claim in claims]
+
+		# claims pending approval can't be submitted, each failure is reported with its error
+		result = bulk_update_expense_claims(names, "Submit")
+		self.assertEqual(result["success"], [])
+		self.assertEqual([d["doc"] for d in result["failure"]], names)
+		self.assertIn("Approval Status", result["failure"][0]["error"])
+
+		bulk_update_expense_claims(names, "Approve")
+		self.assertEqual(
+			set(frappe.get_all("Expense Claim", {"name": ("in", names)}, pluck="approval_status")),
+			{"Approved"},
+		)
+
+		bulk_update_expense_claims(names, "Submit")
+		self.assertEqual(
+			set(frappe.get_all("Expense Claim", {"name": ("in", names)}, pluck="docstatus")),
+			{1},
+		)
+
 	def test_expense_approver_perms(self):
 		user = "test_approver_perm_emp@example.com"
 		make_employee(user, "_Test Company")
@@ -925,6 +1015,60 @@ class TestExpenseClaim(HRMSTestSuite):
 		expense_claim.reload()
 		self.assertEqual(expense_claim.status, "Unpaid")
 
+	def test_ec_matches_for_bank_transactions(self):
+		bank_account = frappe.db.get_value("Account", {"account_type": "Cash", "company": company_name})
+		mode_of_payment = frappe.get_doc("Mode of Payment", "Cash")
+		if not any(d.company == company_name for d in mode_of_payment.accounts):
+			mode_of_payment.append("accounts", {"company": company_name, "default_account": bank_account})
+			mode_of_payment.save()
+
+		employee = make_employee("test_ec_matches@example.com", company=company_name)
+		claims = [
+			make_expense_claim(
+				get_payable_account(company_name),
+				amount,
+				amount,
+				company_name,
+				"Travel Expenses - _TC3",
+				args={"is_paid": 1, "mode_of_payment": "Cash"},
+				employee=employee,
+			).name
+			for amount in (200, 500)
+		]
+		transactions = [make_bank_transaction(200, employee), make_bank_transaction(300)]
+
+		def get_matches(exact_match):
+			matches = get_ec_matches_for_bank_transactions(
+				bank_account, company_name, transactions, exact_match, today(), today()
+			)
+			return {
+				transaction: [(d.name, d.rank) for d in rows if d.name in claims]
+				for transaction, rows in matches.items()
+			}
+
+		self.assertEqual(get_matches(1), {transactions[0]: [(claims[0], 2)], transactions[1]: []})
+		# otherwise claims reimbursing more than the withdrawal match, ranked higher for the same party
+		self.assertEqual(
+			get_matches(0), {transactions[0]: [(claims[1], 2)], transactions[1]: [(claims[1], 1)]}
+		)
+
+
+def make_bank_transaction(amount, employee=None):
+	transaction = frappe.get_doc(
+		{
+			"doctype": "Bank Transaction",
+			"date": today(),
+			"withdrawal": amount,
+			"unallocated_amount": amount,
+			"party_type": "Employee" if employee else None,
+			"party": employee,
+			"docstatus": 1,
+		}
+	)
+	# only the amounts and party are matched, skip the bank account setup
+	transaction.db_insert()
+	return transaction.name
+
 
 def get_payable_account(company):
 	return frappe.get_cached_value("Company", company, "default_payable_account")
@@ -225,34 +225,38 @@ def send_interview_reminder():
 		hours=remind_before.hour, minutes=remind_before.minute, seconds=remind_before.second
 	)
 
-	interviews = frappe.get_all(
-		"Interview",
-		filters=[
-			["scheduled_on", "between", [datetime.datetime.now(), reminder_date_time]],
-			["status", "=", "Pending"],
-			["reminded", "=", 0],
-			["docstatus", "!=", 2],
-		],
+	Interview = frappe.qb.DocType("Interview")
+	interviews = get_interviews_for_reminder(
+		Interview.scheduled_on.between(datetime.datetime.now(), reminder_date_time)
+		& (Interview.status == "Pending")
+		& (Interview.reminded == 0)
+		& (Interview.docstatus != 2)
 	)
+	if not interviews:
+		return
 
 	interview_template = frappe.get_doc("Email Template", reminder_settings.interview_reminder_template)
+	# compiled once and rendered for each interview
+	message_template = frappe.get_jenv().from_string(interview_template.response)
 
-	for d in interviews:
-		doc = frappe.get_doc("Interview", d.name)
-		context = doc.as_dict()
-		message = frappe.render_template(interview_template.response, context)
-		recipients = get_recipients(doc.name)
+	for interview in interviews:
+		recipients = [d.interviewer for d in interview.interview_details]
+		recipients.append(interview.applicant_email)
 
 		frappe.sendmail(
 			sender=reminder_settings.hiring_sender_email,
 			recipients=recipients,
 			subject=interview_template.subject,
-			message=message,
-			reference_doctype=doc.doctype,
-			reference_name=doc.name,
+			message=message_template.render(interview),
+			reference_doctype="Interview",
+			reference_name=interview.name,
 		)
 
-		doc.db_set("reminded", 1)
+	(
+		frappe.qb.update(Interview)
+		.set(Interview.reminded, 1)
+		.where(Interview.name.isin([d.name for d in interviews]))
+	).run()
 
 
 def send_daily_feedback_reminder():
@@ -270,40 +274,84 @@ def send_daily_feedback_reminder():
 	if not cint(reminder_settings.send_interview_feedback_reminder):
 		return
 
-	interview_feedback_template = frappe.get_doc(
-		"Email Template", reminder_settings.feedback_reminder_notification_template
+	Interview = frappe.qb.DocType("Interview")
+	interviews = get_interviews_for_reminder(
+		(Interview.status == "Under Review")
+		& (Interview.docstatus != 2)
+		& (Interview.scheduled_on <= getdate())
+		& (Interview.to_time <= nowtime())
 	)
+	if not interviews:
+		return
 
-	interviews = frappe.get_all(
-		"Interview",
-		filters={
-			"status": "Under Review",
-			"docstatus": ["!=", 2],
-			"scheduled_on": ["<=", getdate()],
-			"to_time": ["<=", nowtime()],
-		},
-		pluck="name",
+	interview_feedback_template = frappe.get_doc(
+		"Email Template", reminder_settings.feedback_reminder_notification_template
 	)
+	message_template = frappe.get_jenv().from_string(interview_feedback_template.response)
+	feedback_given = get_submitted_feedback_interviewers([d.name for d in interviews])
 
 	for interview in interviews:
-		recipients = get_recipients(interview, for_feedback=1)
-
-		doc = frappe.get_doc("Interview", interview)
-		context = doc.as_dict()
-
-		message = frappe.render_template(interview_feedback_template.response, context)
+		recipients = [
+			d.interviewer
+			for d in interview.interview_details
+			if d.interviewer not in feedback_given.get(interview.name, ())
+		]
 
 		if len(recipients):
 			frappe.sendmail(
 				sender=reminder_settings.hiring_sender_email,
 				recipients=recipients,
 				subject=interview_feedback_template.subject,
-				message=message,
+				message=message_template.render(interview),
 				reference_doctype="Interview",
-				reference_name=interview,
+				reference_name=interview.name,
 			)
 
 
+def get_interviews_for_reminder(conditions) -> list[dict]:
+	"""Returns interviews matching `conditions` with their interviewers and applicant email.
+	Each row holds the interview fields and full `interview_details` rows, so it can be used as the
+	template context in place of `doc.as_dict()`"""
+	Interview = frappe.qb.DocType("Interview")
+	JobApplicant = frappe.qb.DocType("Job Applicant")
+
+	interviews = (
+		frappe.qb.from_(Interview)
+		.left_join(JobApplicant)
+		.on(JobApplicant.name == Interview.job_applicant)
+		.select(Interview.star, JobApplicant.email_id.as_("applicant_email"))
+		.where(conditions)
+		.orderby(Interview.name)
+	).run(as_dict=True)
+	if not interviews:
+		return []
+
+	interviews = {d.name: frappe._dict(d, doctype="Interview", interview_details=[]) for d in interviews}
+	for detail in frappe.get_all(
+		"Interview Detail",
+		filters={"parent": ("in", list(interviews)), "parenttype": "Interview"},
+		fields=["*"],
+		order_by="idx",
+	):
+		interviews[detail.parent].interview_details.append(frappe._dict(detail, doctype="Interview Detail"))
+
+	return list(interviews.values())
+
+
+def get_submitted_feedback_interviewers(interviews: list[str]) -> dict[str, set]:
+	feedback = frappe.get_all(
+		"Interview Feedback",
+		filters={"interview": ("in", interviews), "docstatus": 1},
+		fields=["interview", "interviewer"],
+	)
+
+	interviewers = {}
+	for row in feedback:
+		interviewers.setdefault(row.interview, set()).add(row.interviewer)
+
+	return interviewers
+
+
 @frappe.whitelist()
 def get_expected_skill_set(interview_round):
 	return frappe.get_all(
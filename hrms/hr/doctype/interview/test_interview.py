@@ -65,7 +65,7 @@ class TestInterview(IntegrationTestCase):
 		job_applicant = create_job_applicant()
 		scheduled_on = datetime.datetime.now() + datetime.timedelta(minutes=10)
 
-		create_interview_and_dependencies(job_applicant.name, scheduled_on=scheduled_on)
+		interview = create_interview_and_dependencies(job_applicant.name, scheduled_on=scheduled_on)
 
 		frappe.db.delete("Email Queue")
 
@@ -79,6 +79,24 @@ class TestInterview(IntegrationTestCase):
 
 		time.sleep(1)
 		self.assertTrue(get_email_by_subject("Subject: Interview Reminder"))
+		self.assertEqual(frappe.db.get_value("Interview", interview.name, "reminded"), 1)
+
+		# template context holds the interview and its full child rows, as with `doc.as_dict()`
+		from hrms.hr.doctype.interview.interview import get_interviews_for_reminder
+
+		Interview = frappe.qb.DocType("Interview")
+		context = get_interviews_for_reminder(Interview.name == interview.name)[0]
+		self.assertEqual(context.applicant_email, job_applicant.email_id)
+		self.assertEqual(context.job_applicant, interview.job_applicant)
+		self.assertEqual(
+			[(d.idx, d.interviewer) for d in context.interview_details],
+			[(d.idx, d.interviewer) for d in interview.interview_details],
+		)
+
+		# reminded interviews are skipped on the next run
+		frappe.db.delete("Email Queue")
+		send_interview_reminder()
+		self.assertFalse(get_email_by_subject("Subject: Interview Reminder"))
 
 	def test_notification_for_feedback_submission(self):
 		from hrms.hr.doctype.interview.interview import send_daily_feedback_reminder
@@ -10,7 +10,6 @@ from frappe.query_builder.functions import Max, Min, Sum
 from frappe.utils import (
 	add_days,
 	cint,
-	cstr,
 	date_diff,
 	flt,
 	formatdate,
@@ -24,7 +23,14 @@ from erpnext.buying.doctype.supplier_scorecard.supplier_scorecard import dateran
 from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
 
 import hrms
-from hrms.api import get_current_employee_info
+from hrms.api import clear_home_dashboard, get_current_employee_info
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import update_attendance_rollup
+from hrms.hr.doctype.department_approver.department_approver import get_default_department_approver
+from hrms.hr.doctype.leave_application.leave_calendar import (
+	get_leave_calendar_events,
+	invalidate_leave_calendar,
+)
+from hrms.hr.doctype.leave_application.leave_validation_context import LeaveValidationContext
 from hrms.hr.doctype.leave_block_list.leave_block_list import get_applicable_block_dates
 from hrms.hr.doctype.leave_ledger_entry.leave_ledger_entry import create_leave_ledger_entry
 from hrms.hr.utils import (
@@ -75,6 +81,8 @@ class LeaveApplication(Document, PWANotificationsMixin):
 	def validate(self):
 		validate_active_employee(self.employee)
 		set_employee_name(self)
+		# reload for every validation, other applications or allocations may have changed since
+		self._leave_context = None
 		self.validate_dates()
 		self.validate_balance_leaves()
 		self.validate_leave_overlap()
@@ -84,7 +92,7 @@ class LeaveApplication(Document, PWANotificationsMixin):
 		self.validate_salary_processed_days()
 		self.validate_attendance()
 		self.set_half_day_date()
-		if frappe.db.get_value("Leave Type", self.leave_type, "is_optional_leave"):
+		if self.get_leave_context().leave_type_details.is_optional_leave:
 			self.validate_optional_leave()
 		self.validate_applicable_after()
 
@@ -132,10 +140,26 @@ class LeaveApplication(Document, PWANotificationsMixin):
 		employee_user = frappe.db.get_value("Employee", self.employee, "user_id", cache=True)
 		hrms.refetch_resource("hrms:my_leaves", employee_user)
 		hrms.refetch_resource("hrms:team_leaves")
+		clear_home_dashboard([self.employee])
+		invalidate_leave_calendar(self)
+
+	def get_leave_context(self) -> LeaveValidationContext:
+		"""Allocations, holidays, other applications and attendance of the employee around the application
+		dates, loaded once and shared by the validations"""
+		context = getattr(self, "_leave_context", None)
+		if not context or context.key != (
+			self.employee,
+			self.leave_type,
+			getdate(self.from_date),
+			getdate(self.to_date),
+		):
+			self._leave_context = context = LeaveValidationContext(self)
+
+		return context
 
 	def validate_applicable_after(self):
 		if self.leave_type:
-			leave_type = frappe.get_doc("Leave Type", self.leave_type)
+			leave_type = self.get_leave_context().leave_type_details
 			if leave_type.applicable_after > 0:
 				date_of_joining = frappe.db.get_value("Employee", self.employee, "date_of_joining")
 				leave_days = get_approved_leaves_for_period(
@@ -144,7 +168,7 @@ class LeaveApplication(Document, PWANotificationsMixin):
 				number_of_days = date_diff(getdate(self.from_date), date_of_joining)
 				if number_of_days >= 0:
 					holidays = 0
-					if not frappe.db.get_value("Leave Type", self.leave_type, "include_holiday"):
+					if not leave_type.include_holiday:
 						holidays = get_holidays(self.employee, date_of_joining, self.from_date)
 					number_of_days = number_of_days - leave_days - holidays
 					if number_of_days < leave_type.applicable_after:
@@ -190,12 +214,12 @@ class LeaveApplication(Document, PWANotificationsMixin):
 		):
 			frappe.throw(_("Half Day Date should be between From Date and To Date"))
 
-		if not is_lwp(self.leave_type):
+		if not self.get_leave_context().leave_type_details.is_lwp:
 			self.validate_dates_across_allocation()
 			self.validate_back_dated_application()
 
 	def validate_dates_across_allocation(self):
-		if frappe.db.get_value("Leave Type", self.leave_type, "allow_negative"):
+		if self.get_leave_context().leave_type_details.allow_negative:
 			return
 
 		alloc_on_from_date, alloc_on_to_date = self.get_allocation_based_on_application_dates()
@@ -210,41 +234,17 @@ class LeaveApplication(Document, PWANotificationsMixin):
 
 	def get_allocation_based_on_application_dates(self) -> tuple[dict, dict]:
 		"""Returns allocation name, from and to dates for application dates"""
-
-		def _get_leave_allocation_record(date):
-			LeaveAllocation = frappe.qb.DocType("Leave Allocation")
-			allocation = (
-				frappe.qb.from_(LeaveAllocation)
-				.select(LeaveAllocation.name, LeaveAllocation.from_date, LeaveAllocation.to_date)
-				.where(
-					(LeaveAllocation.employee == self.employee)
-					& (LeaveAllocation.leave_type == self.leave_type)
-					& (LeaveAllocation.docstatus == 1)
-					& ((date >= LeaveAllocation.from_date) & (date <= LeaveAllocation.to_date))
-				)
-			).run(as_dict=True)
-
-			return allocation and allocation[0]
-
-		allocation_based_on_from_date = _get_leave_allocation_record(self.from_date)
-		allocation_based_on_to_date = _get_leave_allocation_record(self.to_date)
-
-		return allocation_based_on_from_date, allocation_based_on_to_date
+		context = self.get_leave_context()
+		return context.get_allocation_on(self.from_date), context.get_allocation_on(self.to_date)
 
 	def validate_back_dated_application(self):
-		future_allocation = frappe.db.sql(
-			"""select name, from_date from `tabLeave Allocation`
-			where employee=%s and leave_type=%s and docstatus=1 and from_date > %s
-			and carry_forward=1""",
-			(self.employee, self.leave_type, self.to_date),
-			as_dict=1,
-		)
+		future_allocation = self.get_leave_context().get_future_carry_forward_allocation(self.to_date)
 
 		if future_allocation:
 			frappe.throw(
 				_(
 					"Leave cannot be applied/cancelled before {0}, as leave balance has already been carry-forwarded in the future leave allocation record {1}"
-				).format(formatdate(future_allocation[0].from_date), future_allocation[0].name)
+				).format(formatdate(future_allocation.from_date), future_allocation.name)
 			)
 
 	def update_attendance(self):
@@ -280,6 +280,9 @@ class LeaveApplication(Document, PWANotificationsMixin):
 
 			self.create_or_update_attendance(attendance_name, date)
 
+		# existing attendance is updated with db_set
+		update_attendance_rollup([self.employee], self.from_date, self.to_date)
+
 	def create_or_update_attendance(self, attendance_name, date):
 		status = (
 			"Half Day" if self.half_day_date and getdate(date) == getdate(self.half_day_date) else "On Leave"
@@ -326,8 +329,10 @@ class LeaveApplication(Document, PWANotificationsMixin):
 			for name in attendance:
 				frappe.db.set_value("Attendance", name, "docstatus", 2)
 
+			update_attendance_rollup([self.employee], self.from_date, self.to_date)
+
 	def validate_salary_processed_days(self):
-		if not frappe.db.get_value("Leave Type", self.leave_type, "is_lwp"):
+		if not self.get_leave_context().leave_type_details.is_lwp:
 			return
 
 		last_processed_pay_slip = frappe.db.sql(
@@ -374,13 +379,9 @@ class LeaveApplication(Document, PWANotificationsMixin):
 		precision = cint(frappe.db.get_single_value("System Settings", "float_precision")) or 2
 
 		if self.from_date and self.to_date:
-			self.total_leave_days = get_number_of_leave_days(
-				self.employee,
-				self.leave_type,
-				self.from_date,
-				self.to_date,
-				self.half_day,
-				self.half_day_date,
+			context = self.get_leave_context()
+			self.total_leave_days = context.get_number_of_leave_days(
+				self.from_date, self.to_date, self.half_day, self.half_day_date
 			)
 
 			if self.total_leave_days <= 0:
@@ -390,7 +391,7 @@ class LeaveApplication(Document, PWANotificationsMixin):
 					)
 				)
 
-			if not is_lwp(self.leave_type):
+			if not context.leave_type_details.is_lwp:
 				leave_balance = get_leave_balance_on(
 					self.employee,
 					self.leave_type,
@@ -410,7 +411,7 @@ class LeaveApplication(Document, PWANotificationsMixin):
 	def show_insufficient_balance_message(self, leave_balance_for_consumption: float) -> None:
 		alloc_on_from_date, alloc_on_to_date = self.get_allocation_based_on_application_dates()
 
-		if frappe.db.get_value("Leave Type", self.leave_type, "allow_negative"):
+		if self.get_leave_context().leave_type_details.allow_negative:
 			if leave_balance_for_consumption != self.leave_balance:
 				msg = _("Warning: Insufficient leave balance for Leave Type {0} in this allocation.").format(
 					frappe.bold(self.leave_type)
@@ -437,22 +438,7 @@ class LeaveApplication(Document, PWANotificationsMixin):
 			# hack! if name is null, it could cause problems with !=
 			self.name = "New Leave Application"
 
-		for d in frappe.db.sql(
-			"""
-			select
-				name, leave_type, posting_date, from_date, to_date, total_leave_days, half_day_date
-			from `tabLeave Application`
-			where employee = %(employee)s and docstatus < 2 and status in ('Open', 'Approved')
-			and to_date >= %(from_date)s and from_date <= %(to_date)s
-			and name != %(name)s""",
-			{
-				"employee": self.employee,
-				"from_date": self.from_date,
-				"to_date": self.to_date,
-				"name": self.name,
-			},
-			as_dict=1,
-		):
+		for d in self.get_leave_context().get_overlapping_applications():
 			if (
 				cint(self.half_day) == 1
 				and getdate(self.half_day_date) == getdate(d.half_day_date)
@@ -476,21 +462,10 @@ class LeaveApplication(Document, PWANotificationsMixin):
 		frappe.throw(msg, OverlapError)
 
 	def get_total_leaves_on_half_day(self):
-		leave_count_on_half_day_date = frappe.db.sql(
-			"""select count(name) from `tabLeave Application`
-			where employee = %(employee)s
-			and docstatus < 2
-			and status in ('Open', 'Approved')
-			and half_day = 1
-			and half_day_date = %(half_day_date)s
-			and name != %(name)s""",
-			{"employee": self.employee, "half_day_date": self.half_day_date, "name": self.name},
-		)[0][0]
-
-		return leave_count_on_half_day_date * 0.5
+		return self.get_leave_context().get_total_leaves_on_half_day(self.half_day_date)
 
 	def validate_max_days(self):
-		max_days = frappe.db.get_value("Leave Type", self.leave_type, "max_continuous_days_allowed")
+		max_days = self.get_leave_context().leave_type_details.max_continuous_days_allowed
 		if not max_days:
 			return
 
@@ -510,75 +485,10 @@ class LeaveApplication(Document, PWANotificationsMixin):
 			frappe.throw(msg, title=_("Maximum Consecutive Leaves Exceeded"))
 
 	def get_consecutive_leave_details(self) -> dict:
-		leave_applications = set()
-
-		def _get_first_from_date(reference_date):
-			"""gets `from_date` of first leave application from previous consecutive leave applications"""
-			prev_date = add_days(reference_date, -1)
-			application = frappe.db.get_value(
-				"Leave Application",
-				{
-					"employee": self.employee,
-					"leave_type": self.leave_type,
-					"to_date": prev_date,
-					"docstatus": ["!=", 2],
-					"status": ["in", ["Open", "Approved"]],
-				},
-				["name", "from_date"],
-				as_dict=True,
-			)
-			if application:
-				leave_applications.add(application.name)
-				return _get_first_from_date(application.from_date)
-			return reference_date
-
-		def _get_last_to_date(reference_date):
-			"""gets `to_date` of last leave application from following consecutive leave applications"""
-			next_date = add_days(reference_date, 1)
-			application = frappe.db.get_value(
-				"Leave Application",
-				{
-					"employee": self.employee,
-					"leave_type": self.leave_type,
-					"from_date": next_date,
-					"docstatus": ["!=", 2],
-					"status": ["in", ["Open", "Approved"]],
-				},
-				["name", "to_date"],
-				as_dict=True,
-			)
-			if application:
-				leave_applications.add(application.name)
-				return _get_last_to_date(application.to_date)
-			return reference_date
-
-		first_from_date = _get_first_from_date(self.from_date)
-		last_to_date = _get_last_to_date(self.to_date)
-
-		total_consecutive_leaves = get_number_of_leave_days(
-			self.employee, self.leave_type, first_from_date, last_to_date
-		)
-
-		return frappe._dict(
-			{
-				"total_consecutive_leaves": total_consecutive_leaves,
-				"leave_applications": leave_applications,
-			}
-		)
+		return self.get_leave_context().get_consecutive_leave_details()
 
 	def validate_attendance(self):
-		attendance_dates = frappe.get_all(
-			"Attendance",
-			filters=[
-				["employee", "=", self.employee],
-				["attendance_date", "between", [self.from_date, self.to_date]],
-				["status", "in", ["Present", "Work From Home"]],
-				["docstatus", "=", 1],
-				["half_day_status", "!=", "Absent"],
-			],
-			fields=["name", "attendance_date"],
-			order_by="attendance_date",
-		)
+		attendance_dates = self.get_leave_context().attendance
 		if attendance_dates:
 			frappe.throw(
 				_("Attendance for employee {0} is already marked for the following dates: {1}").format(
@@ -1178,8 +1088,12 @@ def get_leaves_for_period(
 	from_date: datetime.date,
 	to_date: datetime.date,
 	skip_expired_leaves: bool = True,
+	leave_entries: list[dict] | None = None,
 ) -> float:
-	leave_entries = get_leave_entries(employee, leave_type, from_date, to_date)
+	"""Returns leaves consumed in the period as a negative number.
+	Callers processing many employees can pass the period's ledger entries fetched in a grouped query"""
+	if leave_entries is None:
+		leave_entries = get_leave_entries(employee, leave_type, from_date, to_date)
 	leave_days = 0
 
 	for leave_entry in leave_entries:
@@ -1280,117 +1194,7 @@ def get_events(start, end, filters=None):
 		# taking relevant fields from the list [doctype, fieldname, condition, value, hidden]
 		filters[idx] = filter[1:-1]
 
-	events = []
-
-	employee = frappe.db.get_value(
-		"Employee", filters={"user_id": frappe.session.user}, fieldname=["name", "company"], as_dict=True
-	)
-
-	if employee:
-		employee, company = employee.name, employee.company
-	else:
-		employee = ""
-		company = frappe.db.get_single_value("Global Defaults", "default_company")
-
-	# show department leaves for employee
-	if "Employee" in frappe.get_roles():
-		add_department_leaves(events, start, end, employee, company)
-
-	add_leaves(events, start, end, filters)
-	add_block_dates(events, start, end, employee, company)
-	add_holidays(events, start, end, employee, company)
-
-	return events
-
-
-def add_department_leaves(events, start, end, employee, company):
-	if department := frappe.db.get_value("Employee", employee, "department"):
-		department_employees = frappe.get_list(
-			"Employee", filters={"department": department, "company": company}, pluck="name"
-		)
-		filters = [["employee", "in", department_employees]]
-		add_leaves(events, start, end, filters=filters)
-
-
-def add_leaves(events, start, end, filters=None):
-	if not filters:
-		filters = []
-	filters.extend(
-		[
-			["from_date", "<=", getdate(end)],
-			["to_date", ">=", getdate(start)],
-			["status", "in", ["Approved", "Open"]],
-			["docstatus", "<", 2],
-		]
-	)
-
-	fields = [
-		"name",
-		"from_date",
-		"to_date",
-		"color",
-		"docstatus",
-		"employee_name",
-		"leave_type",
-		"(1) as allDay",
-		"'Leave Application' as doctype",
-	]
-
-	show_leaves_of_all_members = frappe.db.get_single_value(
-		"HR Settings", "show_leaves_of_all_department_members_in_calendar"
-	)
-	if cint(show_leaves_of_all_members):
-		leave_applications = frappe.get_all("Leave Application", filters=filters, fields=fields)
-	else:
-		leave_applications = frappe.get_list("Leave Application", filters=filters, fields=fields)
-
-	for d in leave_applications:
-		d["title"] = f"{d['employee_name']} ({d['leave_type']})"
-		del d["employee_name"]
-		del d["leave_type"]
-		if d not in events:
-			events.append(d)
-
-
-def add_block_dates(events, start, end, employee, company):
-	cnt = 0
-	block_dates = get_applicable_block_dates(start, end, employee, company, all_lists=True)
-
-	for block_date in block_dates:
-		events.append(
-			{
-				"doctype": "Leave Block List Date",
-				"from_date": block_date.block_date,
-				"to_date": block_date.block_date,
-				"title": _("Leave Blocked") + ": " + block_date.reason,
-				"name": "_" + str(cnt),
-				"allDay": 1,
-			}
-		)
-		cnt += 1
-
-
-def add_holidays(events, start, end, employee, company):
-	applicable_holiday_list = get_holiday_list_for_employee(employee, company)
-	if not applicable_holiday_list:
-		return
-
-	for holiday in frappe.db.sql(
-		"""select name, holiday_date, description
-		from `tabHoliday` where parent=%s and holiday_date between %s and %s""",
-		(applicable_holiday_list, start, end),
-		as_dict=True,
-	):
-		events.append(
-			{
-				"doctype": "Holiday",
-				"from_date": holiday.holiday_date,
-				"to_date": holiday.holiday_date,
-				"title": _("Holiday") + ": " + cstr(holiday.description),
-				"name": holiday.name,
-				"allDay": 1,
-			}
-		)
+	return get_leave_calendar_events(start, end, filters)
 
 
 @frappe.whitelist()
@@ -1451,14 +1255,12 @@ def get_approved_leaves_for_period(employee, leave_type, from_date, to_date):
 
 @frappe.whitelist()
 def get_leave_approver(employee):
-	leave_approver, department = frappe.db.get_value("Employee", employee, ["leave_approver", "department"])
+	leave_approver, department = frappe.get_cached_value(
+		"Employee", employee, ["leave_approver", "department"]
+	)
 
-	if not leave_approver and department:
-		leave_approver = frappe.db.get_value(
-			"Department Approver",
-			{"parent": department, "parentfield": "leave_approvers", "idx": 1},
-			"approver",
-		)
+	if not leave_approver:
+		leave_approver = get_default_department_approver(department, "leave_approvers")
 
 	return leave_approver
 
@@ -0,0 +1,209 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+import hashlib
+
+import frappe
+from frappe import _
+from frappe.utils import add_months, cint, cstr, get_first_day, get_last_day, getdate
+
+from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
+
+from hrms.hr.doctype.leave_block_list.leave_block_list import get_applicable_block_dates
+
+LEAVE_CALENDAR = "hrms:leave_calendar"
+LEAVE_CALENDAR_TTL = 6 * 60 * 60
+LEAVE_EVENT_FIELDS = [
+	"name",
+	"from_date",
+	"to_date",
+	"color",
+	"docstatus",
+	"employee_name",
+	"leave_type",
+	"(1) as allDay",
+	"'Leave Application' as doctype",
+]
+
+
+def get_leave_calendar_events(start, end, filters: list | None = None) -> list[dict]:
+	"""Returns leave, block date and holiday events of the window for the current user.
+
+	Events are assembled a month at a time and cached per viewer scope: the user (leaves and department
+	employees are permission filtered), their department, company and holiday list and the calendar filters.
+	Months missing from the cache are built together with a fixed number of queries.
+	"""
+	start, end = getdate(start), getdate(end)
+	scope = get_calendar_scope(filters or [])
+
+	months, missing_months = {}, []
+	for month_start in get_months(start, end):
+		month_events = frappe.cache().get_value(get_cache_key(month_start, scope.key))
+		if month_events is None:
+			missing_months.append(month_start)
+		else:
+			months[month_start] = month_events
+
+	if missing_months:
+		months.update(build_month_events(scope, missing_months[0], get_last_day(missing_months[-1])))
+		for month_start in missing_months:
+			frappe.cache().set_value(
+				get_cache_key(month_start, scope.key),
+				months.setdefault(month_start, []),
+				expires_in_sec=LEAVE_CALENDAR_TTL,
+			)
+
+	events = {}
+	for month_start in sorted(months):
+		for event in months[month_start]:
+			if event["from_date"] <= end and event["to_date"] >= start:
+				events.setdefault((event["doctype"], event["name"]), event)
+
+	events = [frappe._dict(event) for event in events.values()]
+	for idx, event in enumerate(d for d in events if d.doctype == "Leave Block List Date"):
+		event.name = f"_{idx}"
+
+	return events
+
+
+@frappe.whitelist()
+def get_leave_calendar(start: str, end: str, filters: str | None = None, etag: str | None = None) -> dict:
+	"""Calendar events of the window with an etag. Pass the `etag` of the last response to only receive the
+	events when something changed since"""
+	events = get_leave_calendar_events(start, end, frappe.parse_json(filters) if filters else None)
+	new_etag = hashlib.md5(frappe.as_json(events).encode(), usedforsecurity=False).hexdigest()
+
+	if etag == new_etag:
+		return {"etag": etag, "modified": False}
+
+	return {"etag": new_etag, "modified": True, "events": events}
+
+
+def get_calendar_scope(filters: list) -> frappe._dict:
+	employee = frappe.db.get_value(
+		"Employee",
+		filters={"user_id": frappe.session.user},
+		fieldname=["name", "company", "department"],
+		as_dict=True,
+	)
+
+	if employee:
+		scope = frappe._dict(employee=employee.name, company=employee.company)
+		# show department leaves for employee
+		if "Employee" in frappe.get_roles():
+			scope.department = employee.department
+	else:
+		scope = frappe._dict(
+			employee="", company=frappe.db.get_single_value("Global Defaults", "default_company")
+		)
+
+	scope.holiday_list = get_holiday_list_for_employee(scope.employee, scope.company)
+	scope.show_all_leaves = cint(
+		frappe.db.get_single_value("HR Settings", "show_leaves_of_all_department_members_in_calendar")
+	)
+	scope.filters = filters
+	scope.key = hashlib.md5(
+		frappe.as_json([frappe.session.user, scope]).encode(), usedforsecurity=False
+	).hexdigest()
+
+	return scope
+
+
+def build_month_events(scope: frappe._dict, start, end) -> dict[str, list]:
+	"""Builds the events between the dates and groups them by the months they fall in"""
+	events = []
+	if scope.department:
+		department_employees = frappe.get_list(
+			"Employee", filters={"department": scope.department, "company": scope.company}, pluck="name"
+		)
+		events.extend(get_leave_events(scope, start, end, [["employee", "in", department_employees]]))
+
+	events.extend(get_leave_events(scope, start, end, scope.filters))
+
+	for block_date in get_applicable_block_dates(start, end, scope.employee, scope.company, all_lists=True):
+		events.append(
+			{
+				"doctype": "Leave Block List Date",
+				"from_date": block_date.block_date,
+				"to_date": block_date.block_date,
+				"title": _("Leave Blocked") + ": " + block_date.reason,
+				"name": f"{block_date.block_date}:{block_date.reason}",
+				"allDay": 1,
+			}
+		)
+
+	if scope.holiday_list:
+		Holiday = frappe.qb.DocType("Holiday")
+		holidays = (
+			frappe.qb.from_(Holiday)
+			.select(Holiday.name, Holiday.holiday_date, Holiday.description)
+			.where((Holiday.parent == scope.holiday_list) & (Holiday.holiday_date.between(start, end)))
+		).run(as_dict=True)
+
+		for holiday in holidays:
+			events.append(
+				{
+					"doctype": "Holiday",
+					"from_date": holiday.holiday_date,
+					"to_date": holiday.holiday_date,
+					"title": _("Holiday") + ": " + cstr(holiday.description),
+					"name": holiday.name,
+					"allDay": 1,
+				}
+			)
+
+	months = {}
+	for month_start in get_months(start, end):
+		month_end = get_last_day(month_start)
+		months[month_start] = [
+			event for event in events if event["from_date"] <= month_end and event["to_date"] >= month_start
+		]
+
+	return months
+
+
+def get_leave_events(scope: frappe._dict, start, end, filters: list) -> list[dict]:
+	filters = [
+		*filters,
+		["from_date", "<=", end],
+		["to_date", ">=", start],
+		["status", "in", ["Approved", "Open"]],
+		["docstatus", "<", 2],
+	]
+	get_leaves = frappe.get_all if scope.show_all_leaves else frappe.get_list
+	leave_applications = get_leaves("Leave Application", filters=filters, fields=LEAVE_EVENT_FIELDS)
+
+	for d in leave_applications:
+		d["title"] = f"{d.pop('employee_name')} ({d.pop('leave_type')})"
+
+	return leave_applications
+
+
+def get_months(start, end) -> list:
+	months = []
+	month_start = get_first_day(start)
+	while month_start <= end:
+		months.append(month_start)
+		month_start = add_months(month_start, 1)
+
+	return months
+
+
+def get_cache_key(month_start, scope_key: str) -> str:
+	return f"{LEAVE_CALENDAR}:{month_start}:{scope_key}"
+
+
+def invalidate_leave_calendar(doc, method=None):
+	"""Leave applications only invalidate the months they span. Anything else the events or the permissions
+	of the viewers depend on clears the whole calendar"""
+	if doc.doctype != "Leave Application":
+		frappe.cache().delete_keys(LEAVE_CALENDAR)
+		return
+
+	months = set()
+	for d in (doc, doc.get_doc_before_save()):
+		if d and d.from_date and d.to_date:
+			months.update(get_months(getdate(d.from_date), getdate(d.to_date)))
+
+	for month_start in months:
+		frappe.cache().delete_keys(f"{LEAVE_CALENDAR}:{month_start}:")
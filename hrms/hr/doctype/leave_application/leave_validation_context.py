@@ -0,0 +1,201 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+import frappe
+from frappe.utils import add_days, cint, date_diff, flt, getdate
+
+from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
+
+from hrms.utils.holiday_list import get_holiday_dates_between
+
+LEAVE_TYPE_FIELDS = [
+	"is_lwp",
+	"allow_negative",
+	"include_holiday",
+	"is_optional_leave",
+	"applicable_after",
+	"max_continuous_days_allowed",
+]
+# days loaded around the application dates, consecutive leaves beyond it are loaded when reached
+WINDOW_PADDING_DAYS = 31
+
+
+class LeaveValidationContext:
+	"""Everything validating a leave application looks up for the employee, loaded in one pass: leave type
+	settings, allocations, holidays, other open / approved applications and attendance around the dates.
+	Day counts, overlaps and consecutive leave spans are answered from memory"""
+
+	def __init__(self, doc):
+		self.name = doc.name
+		self.employee = doc.employee
+		self.leave_type = doc.leave_type
+		self.from_date = getdate(doc.from_date)
+		self.to_date = getdate(doc.to_date)
+		self.key = (self.employee, self.leave_type, self.from_date, self.to_date)
+
+		self.leave_type_details = frappe._dict(
+			frappe.get_cached_value("Leave Type", self.leave_type, LEAVE_TYPE_FIELDS, as_dict=True) or {}
+		)
+		self.holiday_list = None
+		if not self.leave_type_details.include_holiday:
+			self.holiday_list = get_holiday_list_for_employee(self.employee, raise_exception=False)
+
+		self.allocations = frappe.get_all(
+			"Leave Allocation",
+			filters={"employee": self.employee, "leave_type": self.leave_type, "docstatus": 1},
+			fields=["name", "from_date", "to_date", "carry_forward"],
+			order_by="from_date",
+		)
+		self.attendance = frappe.get_all(
+			"Attendance",
+			filters=[
+				["employee", "=", self.employee],
+				["attendance_date", "between", [self.from_date, self.to_date]],
+				["status", "in", ["Present", "Work From Home"]],
+				["docstatus", "=", 1],
+				["half_day_status", "!=", "Absent"],
+			],
+			fields=["name", "attendance_date"],
+			order_by="attendance_date",
+		)
+
+		self.applications = {}
+		self.holidays = set()
+		self.loaded_from = self.loaded_to = None
+		self.load(add_days(self.from_date, -WINDOW_PADDING_DAYS), add_days(self.to_date, WINDOW_PADDING_DAYS))
+
+	def load(self, from_date, to_date) -> None:
+		"""Loads other applications and holidays for the part of the window not loaded yet"""
+		if self.loaded_from is None:
+			missing = [(from_date, to_date)]
+		else:
+			missing = []
+			if from_date < self.loaded_from:
+				missing.append((from_date, add_days(self.loaded_from, -1)))
+			if to_date > self.loaded_to:
+				missing.append((add_days(self.loaded_to, 1), to_date))
+
+		for start, end in missing:
+			for d in frappe.get_all(
+				"Leave Application",
+				filters=[
+					["employee", "=", self.employee],
+					["docstatus", "<", 2],
+					["status", "in", ["Open", "Approved"]],
+					["to_date", ">=", start],
+					["from_date", "<=", end],
+				],
+				fields=[
+					"name",
+					"leave_type",
+					"posting_date",
+					"from_date",
+					"to_date",
+					"total_leave_days",
+					"half_day",
+					"half_day_date",
+				],
+			):
+				if d.name != self.name:
+					self.applications[d.name] = d
+
+			if self.holiday_list:
+				holidays = get_holiday_dates_between(self.holiday_list, start, end)
+				self.holidays.update(getdate(holiday) for holiday in holidays)
+
+		self.loaded_from = min(from_date, self.loaded_from or from_date)
+		self.loaded_to = max(to_date, self.loaded_to or to_date)
+
+	def ensure_loaded(self, from_date, to_date) -> None:
+		from_date, to_date = getdate(from_date), getdate(to_date)
+		if from_date < self.loaded_from or to_date > self.loaded_to:
+			self.load(
+				min(from_date, add_days(self.loaded_from, -WINDOW_PADDING_DAYS)),
+				max(to_date, add_days(self.loaded_to, WINDOW_PADDING_DAYS)),
+			)
+
+	def get_number_of_leave_days(self, from_date, to_date, half_day=None, half_day_date=None) -> float:
+		"""Same as `get_number_of_leave_days`, with holidays counted from memory"""
+		from_date, to_date = getdate(from_date), getdate(to_date)
+		if cint(half_day) == 1:
+			if from_date == to_date:
+				number_of_days = 0.5
+			elif half_day_date and from_date <= getdate(half_day_date) <= to_date:
+				number_of_days = date_diff(to_date, from_date) + 0.5
+			else:
+				number_of_days = date_diff(to_date, from_date) + 1
+		else:
+			number_of_days = date_diff(to_date, from_date) + 1
+
+		if not self.leave_type_details.include_holiday:
+			if not self.holiday_list:
+				# raises the missing holiday list error
+				get_holiday_list_for_employee(self.employee)
+
+			self.ensure_loaded(from_date, to_date)
+			number_of_days = flt(number_of_days) - len(
+				[holiday for holiday in self.holidays if from_date <= holiday <= to_date]
+			)
+
+		return number_of_days
+
+	def get_allocation_on(self, date) -> dict | None:
+		date = getdate(date)
+		return next((d for d in self.allocations if d.from_date <= date <= d.to_date), None)
+
+	def get_future_carry_forward_allocation(self, date) -> dict | None:
+		date = getdate(date)
+		return next((d for d in self.allocations if d.carry_forward and d.from_date > date), None)
+
+	def get_overlapping_applications(self) -> list[dict]:
+		return sorted(
+			(
+				d
+				for d in self.applications.values()
+				if d.to_date >= self.from_date and d.from_date <= self.to_date
+			),
+			key=lambda d: d.from_date,
+		)
+
+	def get_total_leaves_on_half_day(self, half_day_date) -> float:
+		half_day_date = getdate(half_day_date)
+		self.ensure_loaded(half_day_date, half_day_date)
+		return 0.5 * len(
+			[
+				d
+				for d in self.applications.values()
+				if cint(d.half_day) and d.half_day_date and getdate(d.half_day_date) == half_day_date
+			]
+		)
+
+	def get_consecutive_leave_details(self) -> frappe._dict:
+		"""Follows applications of the leave type ending the day before / starting the day after the
+		application in both directions and counts the leave days of the whole span"""
+		leave_applications = set()
+
+		first_from_date = self.from_date
+		while application := self.get_application_of_leave_type(to_date=add_days(first_from_date, -1)):
+			leave_applications.add(application.name)
+			first_from_date = application.from_date
+
+		last_to_date = self.to_date
+		while application := self.get_application_of_leave_type(from_date=add_days(last_to_date, 1)):
+			leave_applications.add(application.name)
+			last_to_date = application.to_date
+
+		return frappe._dict(
+			{
+				"total_consecutive_leaves": self.get_number_of_leave_days(first_from_date, last_to_date),
+				"leave_applications": leave_applications,
+			}
+		)
+
+	def get_application_of_leave_type(self, from_date=None, to_date=None) -> dict | None:
+		date = getdate(from_date or to_date)
+		self.ensure_loaded(date, date)
+
+		for d in self.applications.values():
+			if d.leave_type != self.leave_type:
+				continue
+			if (from_date and d.from_date == date) or (to_date and d.to_date == date):
+				return d
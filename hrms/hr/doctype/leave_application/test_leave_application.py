@@ -18,6 +18,7 @@ from erpnext.setup.doctype.employee.test_employee import make_employee
 from erpnext.setup.doctype.holiday_list.test_holiday_list import set_holiday_list
 
 from hrms.hr.doctype.attendance.attendance import mark_attendance
+from hrms.hr.doctype.department_approver.department_approver import DEPARTMENT_APPROVERS
 from hrms.hr.doctype.leave_allocation.test_leave_allocation import create_leave_allocation
 from hrms.hr.doctype.leave_application.leave_application import (
 	InsufficientLeaveBalanceError,
@@ -26,10 +27,18 @@ from hrms.hr.doctype.leave_application.leave_application import (
 	NotAnOptionalHoliday,
 	OverlapError,
 	get_leave_allocation_records,
+	get_leave_approver,
 	get_leave_balance_on,
 	get_leave_details,
 	get_new_and_cf_leaves_taken,
+	get_number_of_leave_days,
 )
+from hrms.hr.doctype.leave_application.leave_calendar import (
+	LEAVE_CALENDAR,
+	get_leave_calendar,
+	get_leave_calendar_events,
+)
+from hrms.hr.doctype.leave_application.leave_validation_context import LeaveValidationContext
 from hrms.hr.doctype.leave_ledger_entry.leave_ledger_entry import expire_allocation
 from hrms.hr.doctype.leave_policy_assignment.leave_policy_assignment import (
 	create_assignment_for_multiple_employees,
@@ -454,6 +463,97 @@ class TestLeaveApplication(HRMSTestSuite):
 		application = self.get_application(self.leave_applications[0])
 		self.assertTrue(application.insert())
 
+	def test_leave_calendar_events(self):
+		frappe.cache().delete_keys(LEAVE_CALENDAR)
+		employee = get_employee()
+		filters = [["employee", "=", employee.name]]
+		make_allocation_record()
+
+		application = self.get_application(self.leave_applications[0])
+		application.insert()
+
+		def get_leave_events():
+			return {
+				d.name: d
+				for d in get_leave_calendar_events("2013-01-01", "2013-02-28", filters)
+				if d.doctype == "Leave Application"
+			}
+
+		events = get_leave_events()
+		self.assertEqual(list(events), [application.name])
+		self.assertEqual(events[application.name].title, f"{employee.employee_name} (_Test Leave Type)")
+
+		calendar = get_leave_calendar("2013-01-01", "2013-02-28", frappe.as_json(filters))
+		self.assertTrue(calendar["modified"])
+		unchanged = get_leave_calendar("2013-01-01", "2013-02-28", frappe.as_json(filters), calendar["etag"])
+		self.assertFalse(unchanged["modified"])
+
+		# cached months are invalidated on change
+		application.to_date = "2013-01-03"
+		application.save()
+		self.assertEqual(get_leave_events()[application.name].to_date, getdate("2013-01-03"))
+		updated = get_leave_calendar("2013-01-01", "2013-02-28", frappe.as_json(filters), calendar["etag"])
+		self.assertTrue(updated["modified"])
+
+		# permission changes clear the calendar of every viewer
+		self.assertTrue(frappe.cache().get_keys(LEAVE_CALENDAR))
+		frappe.get_doc(
+			{
+				"doctype": "User Permission",
+				"user": "test@example.com",
+				"allow": "Employee",
+				"for_value": employee.name,
+			}
+		).insert().delete()
+		self.assertFalse(frappe.cache().get_keys(LEAVE_CALENDAR))
+
+		application.delete()
+		self.assertEqual(get_leave_events(), {})
+
+	def test_cached_department_approvers(self):
+		from hrms.api import get_leave_approval_details
+
+		frappe.cache().delete_value(DEPARTMENT_APPROVERS)
+		parent = frappe.get_doc(
+			{
+				"doctype": "Department",
+				"department_name": "_Test Approvers Parent",
+				"company": "_Test Company",
+				"is_group": 1,
+				"leave_approvers": [{"approver": "test@example.com"}],
+			}
+		).insert()
+		child = frappe.get_doc(
+			{
+				"doctype": "Department",
+				"department_name": "_Test Approvers Child",
+				"company": "_Test Company",
+				"parent_department": parent.name,
+				"leave_approvers": [{"approver": "test1@example.com"}],
+			}
+		).insert()
+		employee = make_employee(
+			"test_department_approvers@example.com", "_Test Company", department=child.name
+		)
+
+		def get_department_approvers():
+			return [d.name for d in get_leave_approval_details(employee)["department_approvers"]]
+
+		# nearest department first, defaults to the first approver of the employee's department
+		self.assertEqual(get_department_approvers(), ["test1@example.com", "test@example.com"])
+		self.assertEqual(get_leave_approver(employee), "test1@example.com")
+
+		# department changes invalidate the cached tree
+		parent.append("leave_approvers", {"approver": "test2@example.com"})
+		parent.save()
+		self.assertEqual(
+			get_department_approvers(), ["test1@example.com", "test@example.com", "test2@example.com"]
+		)
+
+		parent.disabled = 1
+		parent.save()
+		self.assertEqual(get_department_approvers(), ["test1@example.com"])
+
 	def test_overlap(self):
 		self._clear_roles()
 		self._clear_applications()
@@ -803,6 +903,70 @@ class TestLeaveApplication(HRMSTestSuite):
 		# 11 consecutive leaves
 		self.assertRaises(frappe.ValidationError, leave_application.insert)
 
+	def test_leave_validation_context(self):
+		employee = get_employee()
+		holiday_list = make_holiday_list("_Test Leave Context Holidays", "2013-01-01", "2013-12-31")
+		frappe.db.set_value("Employee", employee.name, "holiday_list", holiday_list)
+		frappe.delete_doc_if_exists("Leave Type", "Test Leave Context Type", force=1)
+		leave_type = frappe.get_doc(
+			dict(leave_type_name="Test Leave Context Type", doctype="Leave Type", include_holiday=0)
+		).insert()
+		make_allocation_record(
+			employee=employee.name,
+			leave_type=leave_type.name,
+			from_date="2013-01-01",
+			to_date="2013-12-31",
+			leaves=365,
+		)
+
+		# consecutive applications reaching beyond the window loaded around the application
+		applications = set()
+		for from_date, to_date in [
+			("2013-01-01", "2013-01-31"),
+			("2013-02-01", "2013-02-28"),
+			("2013-03-01", "2013-03-19"),
+		]:
+			application = frappe.get_doc(
+				dict(
+					doctype="Leave Application",
+					employee=employee.name,
+					leave_type=leave_type.name,
+					from_date=from_date,
+					to_date=to_date,
+					company="_Test Company",
+					status="Approved",
+				)
+			).insert()
+			applications.add(application.name)
+
+		application = frappe.get_doc(
+			dict(
+				doctype="Leave Application",
+				employee=employee.name,
+				leave_type=leave_type.name,
+				from_date="2013-03-20",
+				to_date="2013-03-22",
+				half_day=1,
+				half_day_date="2013-03-21",
+				company="_Test Company",
+			)
+		)
+		context = LeaveValidationContext(application)
+
+		self.assertEqual(
+			context.get_number_of_leave_days("2013-03-20", "2013-03-22", 1, "2013-03-21"),
+			get_number_of_leave_days(
+				employee.name, leave_type.name, "2013-03-20", "2013-03-22", 1, "2013-03-21"
+			),
+		)
+		details = context.get_consecutive_leave_details()
+		self.assertEqual(details.leave_applications, applications)
+		self.assertEqual(
+			details.total_consecutive_leaves,
+			get_number_of_leave_days(employee.name, leave_type.name, "2013-01-01", "2013-03-22"),
+		)
+		self.assertEqual(context.get_overlapping_applications(), [])
+
 	def test_leave_balance_near_allocaton_expiry(self):
 		employee = get_employee()
 		leave_type = create_leave_type(
@@ -16,6 +16,9 @@ from hrms.hr.utils import set_employee_name, validate_active_employee
 from hrms.payroll.doctype.salary_structure_assignment.salary_structure_assignment import (
 	get_assigned_salary_structure,
 )
+from hrms.utils.bulk import bulk_insert_docs
+
+LEAVE_ENCASHMENT_CHUNK_SIZE = 500
 
 
 class LeaveEncashment(AccountsController):
@@ -314,18 +317,197 @@ class LeaveEncashment(AccountsController):
 		return gl_entry
 
 
-def create_leave_encashment(leave_allocation):
-	"""Creates leave encashment for the given allocations"""
-	for allocation in leave_allocation:
-		if not get_assigned_salary_structure(allocation.employee, allocation.to_date):
-			continue
-		leave_encashment = frappe.get_doc(
-			dict(
-				doctype="Leave Encashment",
-				leave_period=allocation.leave_period,
-				employee=allocation.employee,
-				leave_type=allocation.leave_type,
-				encashment_date=allocation.to_date,
+def create_leave_encashment(leave_allocation: list[dict], commit: bool = False) -> dict:
+	"""Creates draft leave encashments for the given (expiring) allocations.
+
+	Salary structures, encashment rates, employee details and leave ledger entries are resolved with grouped
+	queries for all allocations, encashment amounts are computed in memory the same way as the document does
+	and the drafts are inserted in bulk, a chunk at a time. Returns a summary of the run.
+	"""
+	summary = {"created": [], "skipped": {}}
+	allocations = [frappe._dict(d) for d in leave_allocation]
+	if not allocations:
+		return summary
+
+	employees = {d.employee for d in allocations}
+	employee_details = {
+		d.name: d
+		for d in frappe.get_all(
+			"Employee",
+			filters={"name": ("in", list(employees))},
+			fields=["name", "employee_name", "department", "company", "status"],
+		)
+	}
+	leave_types = {
+		d.name: d
+		for d in frappe.get_all(
+			"Leave Type",
+			filters={"name": ("in", list({d.leave_type for d in allocations}))},
+			fields=["name", "allow_encashment", "non_encashable_leaves", "max_encashable_leaves"],
+		)
+	}
+	assignments = get_salary_structure_assignments(employees, max(getdate(d.to_date) for d in allocations))
+	leave_entries = get_leave_ledger_entries(allocations)
+	already_encashed = set(
+		frappe.get_all(
+			"Leave Encashment",
+			filters={"leave_allocation": ("in", [d.name for d in allocations]), "docstatus": ("<", 2)},
+			pluck="leave_allocation",
+		)
+	)
+
+	def skip(allocation, reason):
+		summary["skipped"].setdefault(reason, []).append(allocation.name)
+
+	encashments = []
+	for allocation in allocations:
+		employee = employee_details.get(allocation.employee)
+		to_date = getdate(allocation.to_date)
+		assignment = next(
+			(d for d in assignments.get(allocation.employee, []) if d.from_date <= to_date), None
+		)
+
+		if allocation.name in already_encashed:
+			skip(allocation, "Already Encashed")
+		elif not assignment:
+			skip(allocation, "No Salary Structure")
+		elif not employee or employee.status == "Inactive":
+			skip(allocation, "Inactive Employee")
+		elif not leave_types[allocation.leave_type].allow_encashment:
+			skip(allocation, "Not Encashable")
+		else:
+			encashments.append(
+				get_leave_encashment_for_allocation(
+					allocation,
+					employee,
+					leave_types[allocation.leave_type],
+					assignment,
+					leave_entries.get((allocation.employee, allocation.leave_type), []),
+				)
 			)
+
+	for idx in range(0, len(encashments), LEAVE_ENCASHMENT_CHUNK_SIZE):
+		summary["created"].extend(
+			bulk_insert_docs("Leave Encashment", encashments[idx : idx + LEAVE_ENCASHMENT_CHUNK_SIZE])
+		)
+		if commit:
+			frappe.db.commit()  # nosemgrep
+
+	return summary
+
+
+def get_leave_encashment_for_allocation(allocation, employee, leave_type, assignment, leave_entries) -> dict:
+	"""Computes a draft encashment like `LeaveEncashment.get_leave_details_for_encashment` does"""
+	encashment_date = getdate(allocation.to_date)
+	# same overlap as `get_leave_entries` for the allocation's period; copies since entries are modified
+	period_entries = [
+		frappe._dict(d)
+		for d in leave_entries
+		if (allocation.from_date <= d.from_date <= encashment_date)
+		or (allocation.from_date <= d.to_date <= encashment_date)
+		or (d.from_date < allocation.from_date and d.to_date > encashment_date)
+	]
+	leave_balance = (
+		flt(allocation.total_leaves_allocated)
+		- flt(allocation.carry_forwarded_leaves_count)
+		+ get_leaves_for_period(
+			allocation.employee,
+			allocation.leave_type,
+			allocation.from_date,
+			encashment_date,
+			leave_entries=period_entries,
+		)
+	)
+
+	encashable_days = leave_balance
+	if leave_type.non_encashable_leaves:
+		encashable_days = max(leave_balance - leave_type.non_encashable_leaves, 0)
+	if leave_type.max_encashable_leaves:
+		encashable_days = min(encashable_days, leave_type.max_encashable_leaves)
+
+	per_day_encashment = flt(assignment.leave_encashment_amount_per_day)
+	return {
+		"leave_period": allocation.leave_period,
+		"employee": allocation.employee,
+		"employee_name": employee.employee_name,
+		"department": employee.department,
+		"company": employee.company,
+		"currency": assignment.currency,
+		"leave_type": allocation.leave_type,
+		"leave_allocation": allocation.name,
+		"leave_balance": leave_balance,
+		"actual_encashable_days": encashable_days,
+		"encashment_days": encashable_days,
+		"encashment_amount": encashable_days * per_day_encashment if per_day_encashment > 0 else 0,
+		"encashment_date": encashment_date,
+		"posting_date": getdate(),
+		"status": "Draft",
+	}
+
+
+def get_salary_structure_assignments(employees: set, on_date) -> dict[str, list]:
+	"""Returns submitted assignments (latest first) by employee, along with the structure's encashment rate"""
+	Assignment = frappe.qb.DocType("Salary Structure Assignment")
+	SalaryStructure = frappe.qb.DocType("Salary Structure")
+
+	assignments = (
+		frappe.qb.from_(Assignment)
+		.inner_join(SalaryStructure)
+		.on(Assignment.salary_structure == SalaryStructure.name)
+		.select(
+			Assignment.employee,
+			Assignment.from_date,
+			Assignment.currency,
+			Assignment.salary_structure,
+			SalaryStructure.leave_encashment_amount_per_day,
+		)
+		.where(
+			(Assignment.employee.isin(list(employees)))
+			& (Assignment.docstatus == 1)
+			& (Assignment.from_date <= on_date)
 		)
-		leave_encashment.insert(ignore_permissions=True)
+		.orderby(Assignment.from_date, order=frappe.qb.desc)
+	).run(as_dict=True)
+
+	assignments_by_employee = {}
+	for d in assignments:
+		assignments_by_employee.setdefault(d.employee, []).append(d)
+
+	return assignments_by_employee
+
+
+def get_leave_ledger_entries(allocations: list[dict]) -> dict[tuple, list]:
+	"""Returns the consumed / expired ledger entries of all allocation periods by (employee, leave type)"""
+	LeaveLedgerEntry = frappe.qb.DocType("Leave Ledger Entry")
+	from_date = min(getdate(d.from_date) for d in allocations)
+	to_date = max(getdate(d.to_date) for d in allocations)
+
+	entries = (
+		frappe.qb.from_(LeaveLedgerEntry)
+		.select(
+			LeaveLedgerEntry.employee,
+			LeaveLedgerEntry.leave_type,
+			LeaveLedgerEntry.from_date,
+			LeaveLedgerEntry.to_date,
+			LeaveLedgerEntry.leaves,
+			LeaveLedgerEntry.transaction_name,
+			LeaveLedgerEntry.transaction_type,
+			LeaveLedgerEntry.holiday_list,
+			LeaveLedgerEntry.is_carry_forward,
+			LeaveLedgerEntry.is_expired,
+		)
+		.where(
+			(LeaveLedgerEntry.employee.isin(list({d.employee for d in allocations})))
+			& (LeaveLedgerEntry.leave_type.isin(list({d.leave_type for d in allocations})))
+			& (LeaveLedgerEntry.docstatus == 1)
+			& ((LeaveLedgerEntry.leaves < 0) | (LeaveLedgerEntry.is_expired == 1))
+			& (LeaveLedgerEntry.from_date <= to_date)
+			& (LeaveLedgerEntry.to_date >= from_date)
+		)
+	).run(as_dict=True)
+
+	entries_by_employee = {}
+	for d in entries:
+		entries_by_employee.setdefault((d.employee, d.leave_type), []).append(d)
+
+	return entries_by_employee
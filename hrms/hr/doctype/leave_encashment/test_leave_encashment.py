@@ -10,6 +10,9 @@ from erpnext.setup.doctype.holiday_list.test_holiday_list import set_holiday_lis
 
 from hrms.hr.doctype.expense_claim.test_expense_claim import get_payable_account
 from hrms.hr.doctype.leave_allocation.leave_allocation import get_unused_leaves
+from hrms.hr.doctype.leave_encashment.leave_encashment import (
+	create_leave_encashment as create_encashments_for_allocations,
+)
 from hrms.hr.doctype.leave_ledger_entry.leave_ledger_entry import process_expired_allocation
 from hrms.hr.doctype.leave_period.test_leave_period import create_leave_period
 from hrms.hr.doctype.leave_policy.test_leave_policy import create_leave_policy
@@ -162,6 +165,59 @@ class TestLeaveEncashment(IntegrationTestCase):
 		)
 		self.assertEqual(additional_salary_amount, leave_encashment.encashment_amount)
 
+	@set_holiday_list("_Test Leave Encashment", "_Test Company")
+	def test_bulk_leave_encashment_for_expired_allocations(self):
+		frappe.db.set_value(
+			"Leave Type",
+			self.leave_type,
+			{
+				"max_encashable_leaves": 6,
+				"non_encashable_leaves": 0,
+			},
+		)
+		first_sunday = get_first_sunday(self.holiday_list, for_date=self.leave_period.from_date)
+		make_leave_application(
+			self.employee,
+			add_days(first_sunday, 1),
+			add_days(first_sunday, 3),
+			"_Test Leave Type Encashment",
+		)
+
+		allocations = frappe.get_all(
+			"Leave Allocation",
+			filters={"employee": self.employee, "leave_type": self.leave_type, "docstatus": 1},
+			fields=[
+				"name",
+				"employee",
+				"leave_period",
+				"leave_type",
+				"from_date",
+				"to_date",
+				"total_leaves_allocated",
+				"new_leaves_allocated",
+				"carry_forwarded_leaves_count",
+			],
+		)
+		summary = create_encashments_for_allocations(allocations)
+		self.assertEqual(len(summary["created"]), 1)
+
+		leave_encashment = frappe.get_doc("Leave Encashment", summary["created"][0])
+		self.assertEqual(leave_encashment.docstatus, 0)
+		self.assertEqual(leave_encashment.leave_allocation, allocations[0].name)
+		self.assertEqual(leave_encashment.leave_balance, 7)
+		# leave balance = 7, but encashment limit = 6 so encashable days = 6
+		self.assertEqual(leave_encashment.encashment_days, 6)
+		self.assertEqual(leave_encashment.encashment_amount, 300)
+
+		# matches the amounts computed by the document itself
+		leave_encashment.save()
+		self.assertEqual(leave_encashment.encashment_amount, 300)
+
+		# existing encashments are not duplicated
+		summary = create_encashments_for_allocations(allocations)
+		self.assertEqual(summary["created"], [])
+		self.assertEqual(summary["skipped"], {"Already Encashed": [allocations[0].name]})
+
 	@set_holiday_list("_Test Leave Encashment", "_Test Company")
 	def test_max_encashable_leaves_and_non_encashable_leaves_setting(self):
 		frappe.db.set_value(
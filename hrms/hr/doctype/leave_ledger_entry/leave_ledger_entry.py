@@ -6,6 +6,8 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import DATE_FORMAT, flt, formatdate, get_link_to_form, getdate, today
 
+from hrms.api import clear_home_dashboard
+
 
 class InvalidLeaveLedgerEntry(frappe.ValidationError):
 	pass
@@ -82,6 +84,8 @@ def create_leave_ledger_entry(ref_doc, args, submit=True):
 	else:
 		delete_ledger_entry(ledger)
 
+	clear_home_dashboard([ref_doc.employee])
+
 
 def delete_ledger_entry(ledger):
 	"""Delete ledger entry on cancel of leave application/allocation/encashment"""
@@ -16,6 +16,9 @@ from hrms.payroll.doctype.payroll_entry.payroll_entry import get_start_end_dates
 from hrms.payroll.doctype.salary_structure_assignment.salary_structure_assignment import (
 	get_assigned_salary_structure,
 )
+from hrms.utils.bulk import bulk_insert_docs
+
+OVERTIME_SLIP_CHUNK_SIZE = 500
 
 
 class OvertimeSlip(Document):
@@ -200,7 +203,10 @@ class OvertimeSlip(Document):
 
 		unique_overtime_types = {detail.overtime_type for detail in self.overtime_details}
 
-		self.overtime_types = self._bulk_load_overtime_types(unique_overtime_types)
+		# preloaded for all slips when submitted together from the payroll entry
+		self.overtime_types = self.flags.overtime_types or self._bulk_load_overtime_types(
+			unique_overtime_types
+		)
 		holiday_date_map = self.get_holiday_map()
 		overtime_components = {}
 
@@ -227,56 +233,7 @@ class OvertimeSlip(Document):
 		return overtime_components
 
 	def _bulk_load_overtime_types(self, overtime_type_names):
-		"""
-		Load all overtime type details in bulk
-		"""
-		if not overtime_type_names:
-			return {}
-
-		# Get all overtime types details
-		overtime_types_data = frappe.get_all(
-			"Overtime Type",
-			filters={"name": ["in", list(overtime_type_names)]},
-			fields=[
-				"name",
-				"standard_multiplier",
-				"weekend_multiplier",
-				"public_holiday_multiplier",
-				"applicable_for_weekend",
-				"applicable_for_public_holiday",
-				"overtime_salary_component",
-				"overtime_calculation_method",
-				"hourly_rate",
-			],
-		)
-
-		overtime_types = {}
-		salary_component_based_types = []
-
-		for ot_data in overtime_types_data:
-			overtime_types[ot_data.name] = ot_data
-			if ot_data.overtime_calculation_method == "Salary Component Based":
-				salary_component_based_types.append(ot_data.name)
-
-		# Bulk load salary components for salary component based types
-		if salary_component_based_types:
-			salary_components_data = frappe.get_all(
-				"Overtime Salary Component",
-				filters={"parent": ["in", salary_component_based_types]},
-				fields=["parent", "salary_component"],
-			)
-
-			# Group by parent
-			components_by_parent = {}
-			for comp_data in salary_components_data:
-				if comp_data.parent not in components_by_parent:
-					components_by_parent[comp_data.parent] = []
-				components_by_parent[comp_data.parent].append(comp_data.salary_component)
-
-			for ot_type in salary_component_based_types:  # Add components to overtime types
-				overtime_types[ot_type]["components"] = components_by_parent.get(ot_type, [])
-
-		return overtime_types
+		return get_overtime_types(overtime_type_names)
 
 	def _get_applicable_hourly_rate(self, overtime_type, standard_working_hours=0):
 		overtime_details = self.overtime_types[overtime_type]
@@ -293,23 +250,48 @@ class OvertimeSlip(Document):
 
 	def _calculate_component_based_hourly_rate(self, overtime_type, standard_working_hours):
 		components = self.overtime_types[overtime_type]["components"] or []
+		if not components:
+			return 0.0
 
-		if not hasattr(self, "_cached_salary_slip"):
-			salary_structure = get_assigned_salary_structure(self.employee, self.start_date)
-			self._cached_salary_slip = self._make_salary_slip(salary_structure)
+		daily_amounts = self._get_daily_component_amounts()
+		applicable_daily_amount = sum(daily_amounts.get(component, 0) for component in components)
 
-		if not components or not hasattr(self, "_cached_salary_slip"):
-			return 0.0
+		return applicable_daily_amount / standard_working_hours
+
+	def _get_daily_component_amounts(self) -> dict[str, float]:
+		"""Earnings per payment day of each salary component, from a salary slip of the assigned structure.
+		Slips submitted together from a payroll entry share them by structure, base and variable"""
+		if hasattr(self, "_daily_component_amounts"):
+			return self._daily_component_amounts
+
+		if "salary_structure_assignment" in self.flags:
+			assignment = self.flags.salary_structure_assignment
+		else:
+			assignment = get_salary_structure_assignments([self.employee], self.start_date).get(self.employee)
+
+		shared_amounts = self.flags.daily_component_amounts
+		if shared_amounts is None:
+			shared_amounts = {}
 
-		component_amount = sum(
-			data.amount
-			for data in self._cached_salary_slip.earnings
-			if data.salary_component in components and not data.get("additional_salary", None)
+		key = (
+			(assignment.salary_structure, flt(assignment.base), flt(assignment.variable), self.start_date)
+			if assignment
+			else (None, self.employee)
 		)
-		payment_days = max(self._cached_salary_slip.payment_days, 1)
-		applicable_daily_amount = component_amount / payment_days
+		if key not in shared_amounts:
+			salary_slip = self._make_salary_slip(assignment.salary_structure if assignment else None)
+			payment_days = max(salary_slip.payment_days, 1)
+
+			amounts = {}
+			for data in salary_slip.earnings:
+				if not data.get("additional_salary"):
+					amounts[data.salary_component] = (
+						amounts.get(data.salary_component, 0) + data.amount / payment_days
+					)
+			shared_amounts[key] = amounts
 
-		return applicable_daily_amount / standard_working_hours
+		self._daily_component_amounts = shared_amounts[key]
+		return self._daily_component_amounts
 
 	def _make_salary_slip(self, salary_structure):
 		from hrms.payroll.doctype.salary_structure.salary_structure import make_salary_slip
@@ -443,18 +425,61 @@ def filter_employees_for_overtime_slip_creation(start_date, end_date, employees,
 	return eligible_employees
 
 
-def create_overtime_slips_for_employees(employees, args):
+def create_overtime_slips_for_employees(employees, args, commit=False):
+	"""Builds draft overtime slips for all employees from their overtime attendance in memory
+	and inserts them in chunks, instead of saving one slip document per employee"""
 	count = 0
 	errors = []
+	args = frappe._dict(args)
+	start_date, end_date = getdate(args.start_date), getdate(args.end_date)
+
+	overtime_records = get_overtime_attendance_by_employee(employees, start_date, end_date)
+	overtime_types = get_maximum_overtime_hours(
+		{record.overtime_type for records in overtime_records.values() for record in records}
+	)
+	employee_details = {
+		d.name: d
+		for d in frappe.get_all(
+			"Employee",
+			filters={"name": ("in", employees)},
+			fields=["name", "employee_name", "department"],
+		)
+	}
+
+	slips = []
 	for emp in employees:
-		args.update({"doctype": "Overtime Slip", "employee": emp})
 		try:
-			frappe.get_doc(args).get_emp_and_overtime_details()
-			count += 1
+			overtime_details = get_overtime_details_for_attendance(
+				overtime_records.get(emp), overtime_types, emp, start_date, end_date
+			)
 		except Exception as e:
 			frappe.clear_last_message()
 			errors.append(_("Employee {0} : {1}").format(emp, str(e)))
 			frappe.log_error(frappe.get_traceback(), _("Overtime Slip Creation Error for {0}").format(emp))
+			continue
+
+		slips.append(
+			{
+				"employee": emp,
+				"employee_name": employee_details[emp].employee_name,
+				"department": employee_details[emp].department,
+				"company": args.company,
+				"posting_date": args.posting_date,
+				"start_date": start_date,
+				"end_date": end_date,
+				"payroll_entry": args.payroll_entry,
+				"overtime_details": overtime_details,
+				"total_overtime_duration": sum(flt(d["overtime_duration"]) for d in overtime_details),
+			}
+		)
+
+	for idx in range(0, len(slips), OVERTIME_SLIP_CHUNK_SIZE):
+		chunk = slips[idx : idx + OVERTIME_SLIP_CHUNK_SIZE]
+		bulk_insert_docs("Overtime Slip", chunk)
+		count += len(chunk)
+
+		if commit:
+			frappe.db.commit()  # nosemgrep
 
 	if count:
 		frappe.msgprint(
@@ -475,12 +500,184 @@ def create_overtime_slips_for_employees(employees, args):
 	frappe.publish_realtime("completed_overtime_slip_creation", user=frappe.session.user)
 
 
+def get_overtime_attendance_by_employee(employees, start_date, end_date) -> dict[str, list[dict]]:
+	attendance = frappe.get_all(
+		"Attendance",
+		fields=[
+			"name",
+			"employee",
+			"attendance_date",
+			"overtime_type",
+			"actual_overtime_duration",
+			"standard_working_hours",
+		],
+		filters={
+			"employee": ("in", employees),
+			"docstatus": 1,
+			"attendance_date": ("between", [start_date, end_date]),
+			"status": "Present",
+			"overtime_type": ["!=", ""],
+		},
+		order_by="attendance_date",
+	)
+
+	records = {}
+	for record in attendance:
+		records.setdefault(record.employee, []).append(record)
+
+	return records
+
+
+def get_maximum_overtime_hours(overtime_types) -> dict[str, float]:
+	if not overtime_types:
+		return {}
+
+	return dict(
+		frappe.get_all(
+			"Overtime Type",
+			filters={"name": ("in", list(overtime_types))},
+			fields=["name", "maximum_overtime_hours_allowed"],
+			as_list=True,
+		)
+	)
+
+
+def get_overtime_details_for_attendance(records, overtime_types, employee, start_date, end_date):
+	"""Returns overtime detail rows for the attendance, same as `create_overtime_details_row_for_attendance`"""
+	if not records:
+		frappe.throw(
+			_("No attendance records found for employee {0} between {1} and {2}").format(
+				employee, start_date, end_date
+			)
+		)
+
+	overtime_details = []
+	dates = set()
+	for record in records:
+		if record.attendance_date in dates:
+			frappe.throw(_("Date {0} is repeated in Overtime Details").format(record.attendance_date))
+		dates.add(record.attendance_date)
+
+		maximum_overtime_hours_allowed = flt(overtime_types.get(record.overtime_type))
+		overtime_duration = flt(record.actual_overtime_duration)
+		if maximum_overtime_hours_allowed > 0:
+			overtime_duration = min(overtime_duration, maximum_overtime_hours_allowed)
+
+		if overtime_duration > 0:
+			overtime_details.append(
+				{
+					"reference_document": record.name,
+					"date": record.attendance_date,
+					"overtime_type": record.overtime_type,
+					"overtime_duration": overtime_duration,
+					"maximum_overtime_hours_allowed": maximum_overtime_hours_allowed,
+					"standard_working_hours": record.standard_working_hours,
+				}
+			)
+
+	return overtime_details
+
+
+def get_overtime_types(overtime_type_names) -> dict[str, dict]:
+	"""
+	Load all overtime type details in bulk
+	"""
+	if not overtime_type_names:
+		return {}
+
+	# Get all overtime types details
+	overtime_types_data = frappe.get_all(
+		"Overtime Type",
+		filters={"name": ["in", list(overtime_type_names)]},
+		fields=[
+			"name",
+			"standard_multiplier",
+			"weekend_multiplier",
+			"public_holiday_multiplier",
+			"applicable_for_weekend",
+			"applicable_for_public_holiday",
+			"overtime_salary_component",
+			"overtime_calculation_method",
+			"hourly_rate",
+		],
+	)
+
+	overtime_types = {}
+	salary_component_based_types = []
+
+	for ot_data in overtime_types_data:
+		overtime_types[ot_data.name] = ot_data
+		if ot_data.overtime_calculation_method == "Salary Component Based":
+			salary_component_based_types.append(ot_data.name)
+
+	# Bulk load salary components for salary component based types
+	if salary_component_based_types:
+		salary_components_data = frappe.get_all(
+			"Overtime Salary Component",
+			filters={"parent": ["in", salary_component_based_types]},
+			fields=["parent", "salary_component"],
+		)
+
+		# Group by parent
+		components_by_parent = {}
+		for comp_data in salary_components_data:
+			if comp_data.parent not in components_by_parent:
+				components_by_parent[comp_data.parent] = []
+			components_by_parent[comp_data.parent].append(comp_data.salary_component)
+
+		for ot_type in salary_component_based_types:  # Add components to overtime types
+			overtime_types[ot_type]["components"] = components_by_parent.get(ot_type, [])
+
+	return overtime_types
+
+
+def get_salary_structure_assignments(employees, on_date) -> dict[str, dict]:
+	"""Salary structure, base and variable of the assignment of each employee on the date, the assignment
+	`get_assigned_salary_structure` picks"""
+	assignments = frappe.get_all(
+		"Salary Structure Assignment",
+		filters={"employee": ("in", list(employees)), "docstatus": 1, "from_date": ("<=", on_date)},
+		fields=["employee", "salary_structure", "base", "variable"],
+		order_by="from_date desc",
+	)
+
+	latest_assignments = {}
+	for d in assignments:
+		latest_assignments.setdefault(d.pop("employee"), d)
+
+	return latest_assignments
+
+
 def submit_overtime_slips_for_employees(overtime_slips, payroll_entry):
 	count = 0
 	errors = []
+
+	# slips of a payroll entry share the period, load the hourly rate basis for all of them at once
+	slips = frappe.get_all(
+		"Overtime Slip", filters={"name": ("in", overtime_slips)}, fields=["employee", "start_date"]
+	)
+	assignments = {}
+	for start_date in {d.start_date for d in slips}:
+		assignments[start_date] = get_salary_structure_assignments(
+			[d.employee for d in slips if d.start_date == start_date], start_date
+		)
+	# salary slips built for the hourly rate, shared by employees with the same structure and pay
+	daily_component_amounts = {}
+	overtime_types = get_overtime_types(
+		frappe.get_all(
+			"Overtime Details",
+			filters={"parent": ("in", overtime_slips), "parenttype": "Overtime Slip"},
+			pluck="overtime_type",
+			distinct=True,
+		)
+	)
+
 	for overtime_slip in overtime_slips:
 		try:
 			doc = frappe.get_doc("Overtime Slip", overtime_slip)
+			doc.flags.overtime_types = overtime_types
+			doc.flags.salary_structure_assignment = assignments.get(doc.start_date, {}).get(doc.employee)
+			doc.flags.daily_component_amounts = daily_component_amounts
 			doc.submitted_via_payroll_entry = 1
 			doc.submit()
 			count += 1
@@ -1,6 +1,8 @@
 # Copyright (c) 2024, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 
+from unittest.mock import patch
+
 import frappe
 from frappe.tests import IntegrationTestCase
 from frappe.utils import add_days, flt, get_first_day, getdate, nowdate, today
@@ -72,6 +74,28 @@ class TestOvertimeSlip(IntegrationTestCase):
 		)
 		self.assertEqual(flt(expected_overtime_amount, 2), actual_overtime_amount)
 
+		# payroll entries load the hourly rate basis for all slips together
+		from hrms.hr.doctype.overtime_slip.overtime_slip import get_salary_structure_assignments
+
+		assignment = get_salary_structure_assignments([employee], overtime_slip.start_date)[employee]
+		self.assertEqual(assignment.salary_structure, salary_structure.name)
+
+		# slips with the same structure and pay share the salary slip built for the hourly rate
+		overtime_slip.reload()
+		overtime_slip.flags.salary_structure_assignment = assignment
+		overtime_slip.flags.daily_component_amounts = daily_component_amounts = {}
+		overtime_slip.get_overtime_component_amounts()
+		self.assertEqual(len(daily_component_amounts), 1)
+
+		other_slip = frappe.copy_doc(overtime_slip)
+		other_slip.flags.salary_structure_assignment = assignment
+		other_slip.flags.daily_component_amounts = daily_component_amounts
+		with patch.object(other_slip, "_make_salary_slip") as make_salary_slip_mock:
+			self.assertEqual(
+				other_slip.get_overtime_component_amounts(), overtime_slip.get_overtime_component_amounts()
+			)
+			make_salary_slip_mock.assert_not_called()
+
 	def test_overtime_calculation_for_fixed_hourly_rate(self):
 		employee = make_employee("test_overtime_slip_fixed@example.com")
 		make_salary_structure("Test Overtime Salary Slip", "Monthly", employee=employee, company=TEST_COMPANY)
@@ -126,6 +150,16 @@ class TestOvertimeSlip(IntegrationTestCase):
 		)
 
 		payroll_entry.create_overtime_slips()
+
+		draft_slip = frappe.get_doc(
+			"Overtime Slip", {"employee": employee, "payroll_entry": payroll_entry.name}
+		)
+		self.assertTrue(draft_slip.overtime_details)
+		self.assertEqual(
+			draft_slip.total_overtime_duration,
+			sum(d.overtime_duration for d in draft_slip.overtime_details),
+		)
+
 		payroll_entry.submit_overtime_slips()
 
 		overtime_slip = frappe.db.exists(
@@ -4,11 +4,13 @@ import frappe
 from frappe.model.document import Document
 
 import hrms
+from hrms.api import invalidate_home_dashboard
 
 
 class PWANotification(Document):
 	def on_update(self):
 		hrms.refetch_resource("hrms:notifications", self.to_user)
+		invalidate_home_dashboard(self)
 
 	def after_insert(self):
 		self.send_push_notification()
@@ -13,6 +13,9 @@ from frappe.utils import add_days, cint, cstr, get_link_to_form, get_time, getda
 from hrms.hr.utils import validate_active_employee
 from hrms.utils import generate_date_range
 
+# assignments loaded beyond the dates of a shift map, covers the previous / next shifts of the timestamps
+SHIFT_MAP_MARGIN_DAYS = 3
+
 
 class OverlappingShiftError(frappe.ValidationError):
 	pass
@@ -29,14 +32,24 @@ class ShiftAssignment(Document):
 			self.validate_from_to_dates("start_date", "end_date")
 		self.validate_overlapping_shifts()
 
+	def on_submit(self):
+		self.clear_geofences()
+
 	def on_update_after_submit(self):
 		if self.end_date:
 			self.validate_from_to_dates("start_date", "end_date")
 		self.validate_overlapping_shifts()
+		self.clear_geofences()
 
 	def on_cancel(self):
 		self.validate_employee_checkin()
 		self.validate_attendance()
+		self.clear_geofences()
+
+	def clear_geofences(self):
+		from hrms.hr.doctype.employee_checkin.geofence import clear_employee_geofences
+
+		clear_employee_geofences([self.employee])
 
 	def validate_employee_checkin(self):
 		checkins = frappe.get_all(
@@ -361,12 +374,21 @@ def _adjust_overlapping_shifts(shifts: dict):
 		shifts[i + 1] = next_shift
 
 
-def get_shifts_for_date(employee: str, for_timestamp: datetime) -> list[dict[str, str]]:
+def get_shifts_for_date(
+	employee: str, for_timestamp: datetime, shift_map: dict | None = None
+) -> list[dict[str, str]]:
 	"""Returns list of shifts with details for given date"""
 	for_date = for_timestamp.date()
 	prev_day = add_days(for_date, -1)
 	next_day = add_days(for_date, 1)
 
+	if shift_map is not None:
+		return [
+			d
+			for d in shift_map[employee].assignments
+			if d.start_date <= next_day and (not d.end_date or prev_day <= d.end_date)
+		]
+
 	assignment = frappe.qb.DocType("Shift Assignment")
 	return (
 		frappe.qb.from_(assignment)
@@ -403,8 +425,8 @@ def get_shifts_for_date(employee: str, for_timestamp: datetime) -> list[dict[str
 	).run(as_dict=True)
 
 
-def get_shift_for_timestamp(employee: str, for_timestamp: datetime) -> dict:
-	shifts = get_shifts_for_date(employee, for_timestamp)
+def get_shift_for_timestamp(employee: str, for_timestamp: datetime, shift_map: dict | None = None) -> dict:
+	shifts = get_shifts_for_date(employee, for_timestamp, shift_map)
 	if shifts:
 		return get_shift_for_time(shifts, for_timestamp)
 	return {}
@@ -415,6 +437,7 @@ def get_employee_shift(
 	for_timestamp: datetime | None = None,
 	consider_default_shift: bool = False,
 	next_shift_direction: str | None = None,
+	shift_map: dict | None = None,
 ) -> dict:
 	"""Returns a Shift Type for the given employee on the given date
 
@@ -422,21 +445,25 @@ def get_employee_shift(
 	:param for_timestamp: DateTime on which shift is required
 	:param consider_default_shift: If set to true, default shift is taken when no shift assignment is found.
 	:param next_shift_direction: One of: None, 'forward', 'reverse'. Direction to look for next shift if shift not found on given date.
+	:param shift_map: (optional) Preloaded assignments and default shifts from `get_employee_shift_map`.
 	"""
 	if for_timestamp is None:
 		for_timestamp = now_datetime()
 
-	shift_details = get_shift_for_timestamp(employee, for_timestamp)
+	shift_details = get_shift_for_timestamp(employee, for_timestamp, shift_map)
 
 	# if shift assignment is not found, consider default shift
-	default_shift = frappe.db.get_value("Employee", employee, "default_shift", cache=True)
+	if shift_map is not None:
+		default_shift = shift_map[employee].default_shift
+	else:
+		default_shift = frappe.db.get_value("Employee", employee, "default_shift", cache=True)
 	if not shift_details and consider_default_shift:
 		shift_details = get_shift_details(default_shift, for_timestamp)
 
 	# if no shift is found, find next or prev shift assignment based on direction
 	if not shift_details and next_shift_direction:
 		shift_details = get_prev_or_next_shift(
-			employee, for_timestamp, consider_default_shift, default_shift, next_shift_direction
+			employee, for_timestamp, consider_default_shift, default_shift, next_shift_direction, shift_map
 		)
 
 	return shift_details or {}
@@ -448,6 +475,7 @@ def get_prev_or_next_shift(
 	consider_default_shift: bool,
 	default_shift: str,
 	next_shift_direction: str,
+	shift_map: dict | None = None,
 ) -> dict:
 	"""Returns a dict of shift details for the next or prev shift based on the next_shift_direction"""
 	MAX_DAYS = 366
@@ -457,25 +485,39 @@ def get_prev_or_next_shift(
 		direction = -1 if next_shift_direction == "reverse" else 1
 		for i in range(MAX_DAYS):
 			date = for_timestamp + timedelta(days=direction * (i + 1))
-			shift_details = get_employee_shift(employee, date, consider_default_shift, None)
+			shift_details = get_employee_shift(employee, date, consider_default_shift, None, shift_map)
 			if shift_details:
 				return shift_details
 	else:
-		direction = "<" if next_shift_direction == "reverse" else ">"
-		sort_order = "desc" if next_shift_direction == "reverse" else "asc"
-		shift_dates = frappe.get_all(
-			"Shift Assignment",
-			["start_date", "end_date"],
-			{
-				"employee": employee,
-				"start_date": (direction, for_timestamp.date()),
-				"docstatus": 1,
-				"status": "Active",
-			},
-			as_list=True,
-			limit=MAX_DAYS,
-			order_by="start_date " + sort_order,
-		)
+		if shift_map is not None:
+			reverse = next_shift_direction == "reverse"
+			for_date = for_timestamp.date()
+			assignments = sorted(
+				(
+					d
+					for d in shift_map[employee].assignments
+					if (d.start_date < for_date if reverse else d.start_date > for_date)
+				),
+				key=lambda d: d.start_date,
+				reverse=reverse,
+			)
+			shift_dates = [(d.start_date, d.end_date) for d in assignments[:MAX_DAYS]]
+		else:
+			direction = "<" if next_shift_direction == "reverse" else ">"
+			sort_order = "desc" if next_shift_direction == "reverse" else "asc"
+			shift_dates = frappe.get_all(
+				"Shift Assignment",
+				["start_date", "end_date"],
+				{
+					"employee": employee,
+					"start_date": (direction, for_timestamp.date()),
+					"docstatus": 1,
+					"status": "Active",
+				},
+				as_list=True,
+				limit=MAX_DAYS,
+				order_by="start_date " + sort_order,
+			)
 
 		for date_range in shift_dates:
 			# midnight shifts will span more than a day
@@ -488,7 +530,11 @@ def get_prev_or_next_shift(
 
 			for dt in generate_date_range(start_date, end_date, reverse=reverse):
 				shift_details = get_employee_shift(
-					employee, datetime.combine(dt, for_timestamp.time()), consider_default_shift, None
+					employee,
+					datetime.combine(dt, for_timestamp.time()),
+					consider_default_shift,
+					None,
+					shift_map,
 				)
 				if shift_details:
 					return shift_details
@@ -497,7 +543,10 @@ def get_prev_or_next_shift(
 
 
 def get_employee_shift_timings(
-	employee: str, for_timestamp: datetime | None = None, consider_default_shift: bool = False
+	employee: str,
+	for_timestamp: datetime | None = None,
+	consider_default_shift: bool = False,
+	shift_map: dict | None = None,
 ) -> list[dict]:
 	"""Returns previous shift, current/upcoming shift, next_shift for the given timestamp and employee"""
 	if for_timestamp is None:
@@ -505,19 +554,21 @@ def get_employee_shift_timings(
 
 	# write and verify a test case for midnight shift.
 	prev_shift = curr_shift = next_shift = None
-	curr_shift = get_employee_shift(employee, for_timestamp, consider_default_shift, "forward")
+	curr_shift = get_employee_shift(employee, for_timestamp, consider_default_shift, "forward", shift_map)
 	if curr_shift:
 		next_shift = get_employee_shift(
 			employee,
 			curr_shift.start_datetime + timedelta(days=1),
 			consider_default_shift,
 			"forward",
+			shift_map,
 		)
 	prev_shift = get_employee_shift(
 		employee,
 		(curr_shift.end_datetime if curr_shift else for_timestamp) + timedelta(days=-1),
 		consider_default_shift,
 		"reverse",
+		shift_map,
 	)
 
 	if curr_shift:
@@ -549,7 +600,10 @@ def get_employee_shift_timings(
 
 
 def get_actual_start_end_datetime_of_shift(
-	employee: str, for_timestamp: datetime, consider_default_shift: bool = False
+	employee: str,
+	for_timestamp: datetime,
+	consider_default_shift: bool = False,
+	shift_map: dict | None = None,
 ) -> dict:
 	"""Returns a Dict containing shift details with actual_start and actual_end datetime values
 	Here 'actual' means taking into account the "begin_check_in_before_shift_start_time" and "allow_check_out_after_shift_end_time".
@@ -559,13 +613,54 @@ def get_actual_start_end_datetime_of_shift(
 	:param for_timestamp (datetime, optional): Datetime value of checkin, if not provided considers current datetime
 	:param consider_default_shift (bool, optional): Flag (defaults to False) to specify whether to consider
 	default shift in employee master if no shift assignment is found
+	:param shift_map (dict, optional): Preloaded assignments and default shifts from `get_employee_shift_map`,
+	to resolve shifts of many timestamps without querying for each
 	"""
 	shift_timings_as_per_timestamp = get_employee_shift_timings(
-		employee, for_timestamp, consider_default_shift
+		employee, for_timestamp, consider_default_shift, shift_map
 	)
 	return get_exact_shift(shift_timings_as_per_timestamp, for_timestamp)
 
 
+def get_employee_shift_map(employees: list[str], from_date, to_date) -> dict[str, frappe._dict]:
+	"""Returns the default shift and active assignments around the dates for each employee"""
+	from_date = add_days(getdate(from_date), -SHIFT_MAP_MARGIN_DAYS)
+	to_date = add_days(getdate(to_date), SHIFT_MAP_MARGIN_DAYS)
+
+	shift_map = {
+		d.name: frappe._dict(default_shift=d.default_shift, assignments=[])
+		for d in frappe.get_all(
+			"Employee", filters={"name": ("in", employees)}, fields=["name", "default_shift"]
+		)
+	}
+
+	Assignment = frappe.qb.DocType("Shift Assignment")
+	assignments = (
+		frappe.qb.from_(Assignment)
+		.select(
+			Assignment.name,
+			Assignment.employee,
+			Assignment.shift_type,
+			Assignment.start_date,
+			Assignment.end_date,
+			Assignment.overtime_type,
+		)
+		.where(
+			(Assignment.employee.isin(employees))
+			& (Assignment.docstatus == 1)
+			& (Assignment.status == "Active")
+			& (Assignment.start_date <= to_date)
+			& (Assignment.end_date.isnull() | (Assignment.end_date >= from_date))
+		)
+		.orderby(Assignment.start_date)
+	).run(as_dict=True)
+
+	for d in assignments:
+		shift_map[d.pop("employee")].assignments.append(d)
+
+	return shift_map
+
+
 def get_exact_shift(shifts: list, for_timestamp: datetime) -> dict:
 	"""Returns the shift details (dict) for the exact shift in which the 'for_timestamp' value falls among multiple shifts"""
 
@@ -4,6 +4,7 @@
 import frappe
 from frappe.model.document import Document
 
+from hrms.hr.doctype.employee_checkin.geofence import clear_all_geofences
 from hrms.hr.utils import set_geolocation_from_coordinates
 
 
@@ -11,6 +12,12 @@ class ShiftLocation(Document):
 	def validate(self):
 		self.set_geolocation()
 
+	def on_update(self):
+		clear_all_geofences()
+
+	def on_trash(self):
+		clear_all_geofences()
+
 	@frappe.whitelist()
 	def set_geolocation(self):
 		set_geolocation_from_coordinates(self)
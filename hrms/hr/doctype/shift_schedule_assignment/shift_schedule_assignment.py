@@ -1,12 +1,33 @@
 # Copyright (c) 2024, Frappe Technologies Pvt. Ltd. and contributors
 # For license information, please see license.txt
 
+from datetime import date, timedelta
+
 import frappe
 from frappe import _
 from frappe.model.document import Document
-from frappe.utils import add_days, format_date, get_link_to_form, get_weekday, getdate, nowdate
+from frappe.utils import (
+	add_days,
+	create_batch,
+	date_diff,
+	format_date,
+	get_link_to_form,
+	get_weekday,
+	getdate,
+	nowdate,
+)
 
+from hrms.hr.doctype.employee_checkin.geofence import clear_employee_geofences
 from hrms.hr.doctype.shift_assignment_tool.shift_assignment_tool import create_shift_assignment
+from hrms.utils.bulk import bulk_insert_docs
+
+FREQUENCY_GAP = {
+	"Every Week": 0,
+	"Every 2 Weeks": 1,
+	"Every 3 Weeks": 2,
+	"Every 4 Weeks": 3,
+}
+SCHEDULE_ASSIGNMENT_CHUNK_SIZE = 500
 
 
 class ShiftScheduleAssignment(Document):
@@ -62,82 +83,288 @@ class ShiftScheduleAssignment(Document):
 		return existing_shift_assignments, last_shift_end_date
 
 	def create_shifts(self, start_date: str, end_date: str | None = None) -> None:
-		shift_schedule = frappe.get_doc("Shift Schedule", self.shift_schedule)
-		gap = {
-			"Every Week": 0,
-			"Every 2 Weeks": 1,
-			"Every 3 Weeks": 2,
-			"Every 4 Weeks": 3,
-		}[shift_schedule.frequency]
-
-		date = start_date
-		individual_assignment_start = None
-		week_end_day = get_weekday(getdate(add_days(start_date, -1)))
-		repeat_on_days = [day.day for day in shift_schedule.repeat_on_days]
-
-		if not end_date:
-			end_date = add_days(start_date, 90)
-
-		while date <= end_date:
-			weekday = get_weekday(getdate(date))
-			if weekday in repeat_on_days:
-				if not individual_assignment_start:
-					individual_assignment_start = date
-				if date == end_date:
-					self.create_individual_assignment(
-						shift_schedule.shift_type, individual_assignment_start, date
-					)
-
-			elif individual_assignment_start:
-				self.create_individual_assignment(
-					shift_schedule.shift_type, individual_assignment_start, add_days(date, -1)
+		last_shift_end = create_shifts_for_schedule_assignments([self.as_dict()], start_date, end_date)
+		if self.name in last_shift_end:
+			self.create_shifts_after = last_shift_end[self.name]
+
+
+def get_schedule_blocks(
+	start_date: str | date, end_date: str | date, repeat_on_days: list[str], frequency: str
+) -> list[tuple[date, date]]:
+	"""Returns contiguous (start, end) blocks of working days of a schedule between the given dates.
+
+	Weeks are counted from `start_date`. A schedule repeating every n weeks works for a week and skips
+	the next n - 1 weeks, so blocks are split at week boundaries unless the schedule repeats every week.
+	"""
+	start_date, end_date = getdate(start_date), getdate(end_date)
+	if start_date > end_date:
+		return []
+
+	gap = FREQUENCY_GAP[frequency]
+
+	# runs of consecutive working days in a week, as offsets from the first day of the week
+	week_runs = []
+	for offset in range(7):
+		if get_weekday(start_date + timedelta(days=offset)) not in repeat_on_days:
+			continue
+		if week_runs and week_runs[-1][1] == offset - 1:
+			week_runs[-1][1] = offset
+		else:
+			week_runs.append([offset, offset])
+
+	blocks = []
+	for week_start in range(0, date_diff(end_date, start_date) + 1, 7 * (gap + 1)):
+		for first, last in week_runs:
+			block_start = start_date + timedelta(days=week_start + first)
+			if block_start > end_date:
+				break
+
+			block_end = min(start_date + timedelta(days=week_start + last), end_date)
+			if not gap and blocks and blocks[-1][1] == block_start - timedelta(days=1):
+				blocks[-1] = (blocks[-1][0], block_end)
+			else:
+				blocks.append((block_start, block_end))
+
+	return blocks
+
+
+def create_shifts_for_schedule_assignments(
+	schedule_assignments: list[dict],
+	start_date: str | None = None,
+	end_date: str | None = None,
+	raise_exception: bool = True,
+) -> dict[str, date]:
+	"""Creates shift assignments for multiple schedule assignments at once.
+
+	Shifts are created from `start_date` (defaults to the day after `create_shifts_after`) till `end_date`
+	(defaults to 90 days after the start). Assignments that don't clash with existing shifts of active employees
+	are inserted in bulk, the rest go through the regular validations one by one.
+	Returns a map of schedule assignment to the end date of the last shift created for it.
+	"""
+	if not schedule_assignments:
+		return {}
+
+	schedules = get_shift_schedules({d.shift_schedule for d in schedule_assignments})
+	employees = get_employee_details({d.employee for d in schedule_assignments})
+
+	blocks = {}
+	for d in schedule_assignments:
+		schedule = schedules[d.shift_schedule]
+		from_date = getdate(start_date or add_days(d.create_shifts_after, 1))
+		to_date = end_date or add_days(from_date, 90)
+		blocks[d.name] = get_schedule_blocks(from_date, to_date, schedule.repeat_on_days, schedule.frequency)
+
+	all_blocks = [block for d in blocks.values() for block in d]
+	if not all_blocks:
+		return {}
+
+	existing_shifts = get_active_shifts(
+		{d.employee for d in schedule_assignments},
+		min(block[0] for block in all_blocks),
+		max(block[1] for block in all_blocks),
+	)
+
+	to_insert, individually, last_shift_end = [], [], {}
+	for d in schedule_assignments:
+		if not blocks[d.name]:
+			continue
+
+		schedule = schedules[d.shift_schedule]
+		employee = employees.get(d.employee)
+		if (
+			not employee
+			or employee.status == "Inactive"
+			or has_clashing_shifts(d, blocks[d.name], existing_shifts)
+		):
+			individually.append(d)
+			continue
+
+		for block_start, block_end in blocks[d.name]:
+			to_insert.append(
+				{
+					"employee": d.employee,
+					"employee_name": employee.employee_name,
+					"department": employee.department,
+					"company": d.company,
+					"shift_type": schedule.shift_type,
+					"overtime_type": schedule.overtime_type,
+					"start_date": block_start,
+					"end_date": block_end,
+					"status": d.shift_status,
+					"shift_location": d.shift_location,
+					"shift_schedule_assignment": d.name,
+				}
+			)
+			if d.shift_status == "Active":
+				# later assignments of the employee in the batch must not clash with the queued shifts either
+				existing_shifts.setdefault(d.employee, []).append(
+					frappe._dict(start_date=block_start, end_date=block_end)
 				)
-				individual_assignment_start = None
-
-			if weekday == week_end_day and gap:
-				if individual_assignment_start:
-					self.create_individual_assignment(
-						shift_schedule.shift_type, individual_assignment_start, date
-					)
-					individual_assignment_start = None
-				date = add_days(date, 7 * gap)
-
-			date = add_days(date, 1)
-
-	def create_individual_assignment(self, shift_type, start_date, end_date):
-		create_shift_assignment(
-			self.employee,
-			self.company,
-			shift_type,
-			start_date,
-			end_date,
-			self.shift_status,
-			self.shift_location,
-			self.name,
+		last_shift_end[d.name] = blocks[d.name][-1][1]
+
+	bulk_insert_docs("Shift Assignment", to_insert, docstatus=1)
+	clear_employee_geofences({d["employee"] for d in to_insert})
+
+	# after the bulk insert, so that the document validations report clashes with the shifts inserted above
+	for d in individually:
+		if create_shifts_individually(d, schedules[d.shift_schedule], blocks[d.name], raise_exception):
+			last_shift_end[d.name] = blocks[d.name][-1][1]
+
+	frappe.db.bulk_update(
+		"Shift Schedule Assignment",
+		{name: {"create_shifts_after": date} for name, date in last_shift_end.items()},
+		update_modified=False,
+	)
+
+	return last_shift_end
+
+
+def get_shift_schedules(shift_schedules: set[str]) -> dict[str, dict]:
+	ShiftSchedule = frappe.qb.DocType("Shift Schedule")
+	ShiftType = frappe.qb.DocType("Shift Type")
+	schedules = (
+		frappe.qb.from_(ShiftSchedule)
+		.inner_join(ShiftType)
+		.on(ShiftSchedule.shift_type == ShiftType.name)
+		.select(
+			ShiftSchedule.name, ShiftSchedule.frequency, ShiftSchedule.shift_type, ShiftType.overtime_type
 		)
-		self.db_set("create_shifts_after", end_date, update_modified=False)
+		.where(ShiftSchedule.name.isin(list(shift_schedules)))
+	).run(as_dict=True)
+	schedules = {d.name: d for d in schedules}
+
+	for d in schedules.values():
+		d.repeat_on_days = set()
+
+	for d in frappe.get_all(
+		"Assignment Rule Day",
+		filters={"parent": ["in", list(shift_schedules)], "parenttype": "Shift Schedule"},
+		fields=["parent", "day"],
+	):
+		schedules[d.parent].repeat_on_days.add(d.day)
+
+	return schedules
+
+
+def get_employee_details(employees: set[str]) -> dict[str, dict]:
+	return {
+		d.name: d
+		for d in frappe.get_all(
+			"Employee",
+			filters={"name": ["in", list(employees)]},
+			fields=["name", "employee_name", "department", "status"],
+		)
+	}
+
+
+def get_active_shifts(employees: set[str], from_date: date, to_date: date) -> dict[str, list[dict]]:
+	ShiftAssignment = frappe.qb.DocType("Shift Assignment")
+	shifts = (
+		frappe.qb.from_(ShiftAssignment)
+		.select(ShiftAssignment.employee, ShiftAssignment.start_date, ShiftAssignment.end_date)
+		.where(
+			(ShiftAssignment.employee.isin(list(employees)))
+			& (ShiftAssignment.docstatus == 1)
+			& (ShiftAssignment.status == "Active")
+			& (ShiftAssignment.start_date <= to_date)
+			& ((ShiftAssignment.end_date >= from_date) | (ShiftAssignment.end_date.isnull()))
+		)
+	).run(as_dict=True)
+
+	shifts_by_employee = {}
+	for shift in shifts:
+		shifts_by_employee.setdefault(shift.employee, []).append(shift)
+	return shifts_by_employee
+
+
+def has_clashing_shifts(schedule_assignment: dict, blocks: list[tuple], existing_shifts: dict) -> bool:
+	if schedule_assignment.shift_status == "Inactive":
+		return False
+
+	return any(
+		shift.start_date <= block_end and (not shift.end_date or shift.end_date >= block_start)
+		for shift in existing_shifts.get(schedule_assignment.employee, [])
+		for block_start, block_end in blocks
+	)
+
+
+def create_shifts_individually(
+	schedule_assignment: dict, schedule: dict, blocks: list[tuple], raise_exception: bool = True
+) -> bool:
+	savepoint = "before_schedule_assignment_shifts"
+	frappe.db.savepoint(savepoint)
+
+	try:
+		for block_start, block_end in blocks:
+			create_shift_assignment(
+				schedule_assignment.employee,
+				schedule_assignment.company,
+				schedule.shift_type,
+				block_start,
+				block_end,
+				schedule_assignment.shift_status,
+				schedule_assignment.shift_location,
+				schedule_assignment.name,
+			)
+	except Exception:
+		if raise_exception:
+			raise
+
+		frappe.db.rollback(save_point=savepoint)
+		frappe.log_error(
+			f"Shift creation failed for Shift Schedule Assignment {schedule_assignment.name}",
+			reference_doctype="Shift Schedule Assignment",
+			reference_name=schedule_assignment.name,
+		)
+		return False
+
+	return True
 
 
 def process_auto_shift_creation():
 	shift_schedule_assignments = frappe.get_all(
 		"Shift Schedule Assignment",
 		filters={"enabled": 1, "create_shifts_after": ["<=", nowdate()]},
-		pluck="name",
+		fields=[
+			"name",
+			"employee",
+			"company",
+			"shift_schedule",
+			"shift_status",
+			"shift_location",
+			"create_shifts_after",
+		],
 	)
-	for d in shift_schedule_assignments:
-		try:
-			doc = frappe.get_doc("Shift Schedule Assignment", d)
 
-			start_date = doc.create_shifts_after
+	for batch in create_batch(shift_schedule_assignments, SCHEDULE_ASSIGNMENT_CHUNK_SIZE):
+		try:
+			last_shift_end = create_shifts_for_schedule_assignments(batch, raise_exception=False)
+		except Exception as e:
+			frappe.db.rollback()
+			frappe.log_error(e)
+			continue
 
-			doc.create_shifts(add_days(doc.create_shifts_after, 1))
+		comments = []
+		for d in batch:
+			if d.name not in last_shift_end:
+				continue
 
 			text = _(
 				"Shift Assignments created for the schedule between {0} and {1} via background job"
-			).format(frappe.bold(format_date(start_date)), frappe.bold(format_date(doc.create_shifts_after)))
-
-			doc.add_comment(comment_type="Info", text=text)
-		except Exception as e:
-			frappe.log_error(e)
+			).format(
+				frappe.bold(format_date(d.create_shifts_after)),
+				frappe.bold(format_date(last_shift_end[d.name])),
+			)
+			comments.append(
+				{
+					"comment_type": "Info",
+					"reference_doctype": "Shift Schedule Assignment",
+					"reference_name": d.name,
+					"comment_email": frappe.session.user,
+					"content": text,
+				}
+			)
+		bulk_insert_docs("Comment", comments)
 
-			continue
+		# commit per batch to avoid losing progress
+		frappe.db.commit()  # nosemgrep
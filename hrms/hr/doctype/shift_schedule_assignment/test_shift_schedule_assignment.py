@@ -8,6 +8,10 @@ from frappe.utils import add_days, getdate
 from erpnext.setup.doctype.employee.test_employee import make_employee
 
 from hrms.hr.doctype.shift_schedule.shift_schedule import get_or_insert_shift_schedule
+from hrms.hr.doctype.shift_schedule_assignment.shift_schedule_assignment import (
+	create_shifts_for_schedule_assignments,
+	get_schedule_blocks,
+)
 from hrms.hr.doctype.shift_type.test_shift_type import setup_shift_type
 
 # On IntegrationTestCase, the doctype test records and all
@@ -57,3 +61,112 @@ class TestShiftScheduleAssignment(IntegrationTestCase):
 
 		shift_schedule_assignment.save()
 		self.assertEqual(shift_schedule_assignment.create_shifts_after, add_days(getdate(), 6))
+
+	def test_schedule_blocks(self):
+		# 2024-01-01 is a Monday
+		blocks = get_schedule_blocks(
+			"2024-01-01", "2024-01-14", ["Monday", "Tuesday", "Friday"], "Every Week"
+		)
+		self.assertEqual(
+			blocks,
+			[
+				(getdate("2024-01-01"), getdate("2024-01-02")),
+				(getdate("2024-01-05"), getdate("2024-01-05")),
+				(getdate("2024-01-08"), getdate("2024-01-09")),
+				(getdate("2024-01-12"), getdate("2024-01-12")),
+			],
+		)
+
+		# blocks continue across weeks for weekly schedules
+		blocks = get_schedule_blocks(
+			"2024-01-01", "2024-01-10", ["Saturday", "Sunday", "Monday"], "Every Week"
+		)
+		self.assertEqual(
+			blocks,
+			[
+				(getdate("2024-01-01"), getdate("2024-01-01")),
+				(getdate("2024-01-06"), getdate("2024-01-08")),
+			],
+		)
+
+		# alternate weeks are skipped and blocks are split at week boundaries
+		blocks = get_schedule_blocks("2024-01-03", "2024-01-31", ["Tuesday", "Wednesday"], "Every 2 Weeks")
+		self.assertEqual(
+			blocks,
+			[
+				(getdate("2024-01-03"), getdate("2024-01-03")),
+				(getdate("2024-01-09"), getdate("2024-01-09")),
+				(getdate("2024-01-17"), getdate("2024-01-17")),
+				(getdate("2024-01-23"), getdate("2024-01-23")),
+				(getdate("2024-01-31"), getdate("2024-01-31")),
+			],
+		)
+
+	def test_bulk_shift_creation(self):
+		employee2 = make_employee("test2@scheduleassignment.com", company="_Test Company")
+		schedule_assignments = []
+		for employee in [self.employee, employee2]:
+			schedule_assignments.append(
+				frappe.get_doc(
+					{
+						"doctype": "Shift Schedule Assignment",
+						"employee": employee,
+						"company": "_Test Company",
+						"shift_schedule": self.shift_schedule,
+						"shift_status": "Active",
+						"create_shifts_after": "2024-01-07",
+					}
+				).insert()
+			)
+
+		last_shift_end = create_shifts_for_schedule_assignments(
+			[d.as_dict() for d in schedule_assignments], end_date="2024-01-21"
+		)
+
+		for d in schedule_assignments:
+			self.assertEqual(last_shift_end[d.name], getdate("2024-01-17"))
+			self.assertEqual(
+				frappe.db.get_value("Shift Schedule Assignment", d.name, "create_shifts_after"),
+				getdate("2024-01-17"),
+			)
+
+			shifts = frappe.get_all(
+				"Shift Assignment",
+				filters={"shift_schedule_assignment": d.name, "docstatus": 1},
+				fields=["start_date", "end_date", "shift_type", "employee_name"],
+				order_by="start_date",
+			)
+			self.assertEqual(
+				[(shift.start_date, shift.end_date) for shift in shifts],
+				[
+					(getdate("2024-01-08"), getdate("2024-01-10")),
+					(getdate("2024-01-15"), getdate("2024-01-17")),
+				],
+			)
+			self.assertEqual(shifts[0].shift_type, self.shift_type.name)
+			self.assertEqual(
+				shifts[0].employee_name, frappe.db.get_value("Employee", d.employee, "employee_name")
+			)
+
+	def test_bulk_shift_creation_with_clashes_in_batch(self):
+		schedule_assignments = [
+			frappe.get_doc(
+				{
+					"doctype": "Shift Schedule Assignment",
+					"employee": self.employee,
+					"company": "_Test Company",
+					"shift_schedule": self.shift_schedule,
+					"shift_status": "Active",
+					"create_shifts_after": "2024-01-07",
+				}
+			).insert()
+			for _ in range(2)
+		]
+
+		# the second assignment clashes with the shifts queued for the first one
+		last_shift_end = create_shifts_for_schedule_assignments(
+			[d.as_dict() for d in schedule_assignments], end_date="2024-01-21", raise_exception=False
+		)
+
+		self.assertEqual(list(last_shift_end), [schedule_assignments[0].name])
+		self.assertEqual(frappe.db.count("Shift Assignment", {"employee": self.employee, "docstatus": 1}), 2)
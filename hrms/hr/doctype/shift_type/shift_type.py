@@ -16,6 +16,7 @@ from erpnext.setup.doctype.holiday_list.holiday_list import is_holiday
 from hrms.hr.doctype.attendance.attendance import mark_attendance
 from hrms.hr.doctype.employee_checkin.employee_checkin import (
 	calculate_working_hours,
+	enqueue_relink_checkins_for_shift_type,
 	mark_attendance_and_link_log,
 )
 from hrms.hr.doctype.shift_assignment.shift_assignment import get_employee_shift, get_shift_details
@@ -23,6 +24,12 @@ from hrms.utils import get_date_range
 from hrms.utils.holiday_list import get_holiday_dates_between
 
 EMPLOYEE_CHUNK_SIZE = 50
+SHIFT_TIMING_FIELDS = (
+	"start_time",
+	"end_time",
+	"begin_check_in_before_shift_start_time",
+	"allow_check_out_after_shift_end_time",
+)
 
 
 class ShiftType(Document):
@@ -33,6 +40,11 @@ class ShiftType(Document):
 		self.validate_circular_shift(start, end)
 		self.validate_unlinked_logs()
 
+	def on_update(self):
+		# check-ins not marked yet are re-linked to follow the new timings
+		if self.get_doc_before_save() and any(self.has_value_changed(field) for field in SHIFT_TIMING_FIELDS):
+			enqueue_relink_checkins_for_shift_type(self.name)
+
 	def validate_same_start_and_end(self, start_time: datetime.time, end_time: datetime.time):
 		if start_time == end_time:
 			frappe.throw(
@@ -3,12 +3,13 @@
 
 import frappe
 from frappe.tests import IntegrationTestCase
-from frappe.utils import getdate
+from frappe.utils import cstr, getdate
+from frappe.utils.csvutils import UnicodeWriter
 
 import erpnext
 from erpnext.setup.doctype.employee.test_employee import make_employee
 
-from hrms.hr.doctype.upload_attendance.upload_attendance import get_data
+from hrms.hr.doctype.upload_attendance.upload_attendance import add_header, get_data, import_attendances
 
 test_dependencies = ["Holiday List"]
 
@@ -41,3 +42,54 @@ class TestUploadAttendance(IntegrationTestCase):
 			self.assertTrue(
 				getdate(row[3]) >= getdate(date_of_joining) and getdate(row[3]) <= getdate(relieving_date)
 			)
+
+	def test_import_attendances(self):
+		employee = make_employee("test_import_attendance@company.com", date_of_joining="2018-01-01")
+		frappe.db.delete("Attendance", {"employee": employee})
+
+		w = add_header(UnicodeWriter())
+		w.writerow(["", employee, "", "2018-02-01", "Present", "", "", ""])
+		w.writerow(["", employee, "", "2018-02-02", "Holiday", "", "", ""])
+		w.writerow(["", "_T-Employee-Invalid", "", "2018-02-02", "Present", "", "", ""])
+		w.writerow(["", employee, "", "2018-02-03", "Present", "", "_Test Company Invalid", ""])
+		w.writerow(["", employee, "", "2018-02-04", "On Leave", "_Test Leave Type Invalid", "", ""])
+		w.writerow(["", employee, "", "2018-02-05", "Present", "", "", "INVALID-.#####"])
+		file = frappe.get_doc(
+			{"doctype": "File", "file_name": "attendance.csv", "is_private": 1, "content": cstr(w.getvalue())}
+		).insert()
+
+		frappe.db.delete("File", {"file_name": ("like", "attendance_import_errors_%")})
+		import_attendances(file.name)
+
+		self.assertEqual(
+			frappe.get_all("Attendance", {"employee": employee, "docstatus": 1}, pluck="attendance_date"),
+			[getdate("2018-02-01")],
+		)
+		# rejected rows are written to an error file instead of aborting the import
+		error_file = frappe.get_doc("File", {"file_name": ("like", "attendance_import_errors_%")})
+		errors = cstr(error_file.get_content())
+		for error in ("_Test Company Invalid", "_Test Leave Type Invalid", "INVALID-.#####"):
+			self.assertIn(error, errors)
+
+		# the uploaded sheet is not kept
+		self.assertFalse(frappe.db.exists("File", file.name))
+
+	def test_import_attendances_with_legacy_encoding(self):
+		employee = make_employee("test_import_attendance_cp1252@company.com", date_of_joining="2018-01-01")
+		frappe.db.delete("Attendance", {"employee": employee})
+
+		w = add_header(UnicodeWriter())
+		w.writerow(["", employee, "Zoë Müller", "2018-02-01", "Present", "", "", ""])
+		# sheets saved by spreadsheet apps on Windows are not always UTF-8
+		content = cstr(w.getvalue()).encode("cp1252")
+		self.assertRaises(UnicodeDecodeError, content.decode, "utf-8")
+		file = frappe.get_doc(
+			{"doctype": "File", "file_name": "attendance.csv", "is_private": 1, "content": content}
+		).insert()
+
+		import_attendances(file.name)
+
+		self.assertEqual(
+			frappe.get_all("Attendance", {"employee": employee, "docstatus": 1}, pluck="attendance_date"),
+			[getdate("2018-02-01")],
+		)
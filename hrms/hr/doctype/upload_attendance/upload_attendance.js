@@ -62,6 +62,13 @@ hrms.hr.AttendanceControlPanel = class AttendanceControlPanel extends frappe.ui.
 					)
 					.join("");
 				$log_wrapper.append('<table class="table table-bordered">' + messages);
+				if (data.error_file) {
+					$log_wrapper.append(
+						`<a href="${encodeURI(data.error_file)}" target="_blank">${__(
+							"Download rejected rows",
+						)}</a>`,
+					);
+				}
 			} else if (data.messages) {
 				this.frm.dashboard.hide();
 				let messages = [`<th>${__("Import Successful")}</th>`]
@@ -4,6 +4,8 @@
 # For license information, please see license.txt
 
 
+import csv
+
 import frappe
 from frappe import _
 from frappe.model.document import Document
@@ -12,8 +14,14 @@ from frappe.utils.csvutils import UnicodeWriter
 
 from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
 
+from hrms.hr.doctype.attendance.attendance import insert_attendance_in_bulk
 from hrms.hr.utils import get_holiday_dates_for_employee
 
+ATTENDANCE_IMPORT_CHUNK_SIZE = 1000
+ATTENDANCE_IMPORT_ERRORS_SHOWN = 100
+ATTENDANCE_IMPORT_ENCODINGS = ("utf-8-sig", "windows-1250", "windows-1252")
+TEMPLATE_NOTE_ROWS = 4
+
 
 class UploadAttendance(Document):
 	pass
@@ -154,68 +162,250 @@ def get_existing_attendance_records(args):
 
 
 def get_naming_series():
-	series = frappe.get_meta("Attendance").get_field("naming_series").options.strip().split("\n")
+	series = get_naming_series_options()
 	if not series:
 		frappe.throw(_("Please setup numbering series for Attendance via Setup > Numbering Series"))
 	return series[0]
 
 
+def get_naming_series_options() -> list[str]:
+	options = frappe.get_meta("Attendance").get_field("naming_series").options or ""
+	return [series for series in options.strip().split("\n") if series]
+
+
 @frappe.whitelist()
 def upload():
 	if not frappe.has_permission("Attendance", "create"):
 		raise frappe.PermissionError
 
-	from frappe.utils.csvutils import read_csv_content
-
-	rows = read_csv_content(frappe.local.uploaded_file)
-	if not rows:
+	content = frappe.local.uploaded_file
+	if not content:
 		frappe.throw(_("Please select a csv file"))
-	frappe.enqueue(import_attendances, rows=rows, now=True if len(rows) < 200 else False)
 
+	file = frappe.get_doc(
+		{
+			"doctype": "File",
+			"file_name": frappe.local.uploaded_filename or "attendance.csv",
+			"is_private": 1,
+			"content": content,
+		}
+	).insert()
+	frappe.enqueue(
+		import_attendances,
+		queue="long",
+		timeout=6000,
+		file=file.name,
+		now=len(content.splitlines()) < 200,
+	)
+
+
+def import_attendances(file: str) -> None:
+	"""Imports the uploaded attendance sheet a chunk at a time without loading the whole file.
+
+	Every chunk is validated with grouped queries, inserted in bulk and committed.
+	Rejected rows are written to an error file instead of aborting the import.
+	The uploaded file is deleted once the import is done.
+	"""
+	try:
+		imported, rejected, columns = read_and_import_attendances(file)
+	except Exception:
+		frappe.db.rollback()
+		raise
+	finally:
+		frappe.delete_doc("File", file, ignore_permissions=True)
+		frappe.db.commit()  # nosemgrep
+
+	messages = [_("{0} attendance records imported").format(imported)]
+	messages.extend(
+		"Error for row (#%d) %s : %s" % (row_idx, len(row) > 1 and row[1] or "", error)
+		for row_idx, row, error in rejected[:ATTENDANCE_IMPORT_ERRORS_SHOWN]
+	)
+	frappe.publish_realtime(
+		"import_attendance",
+		dict(
+			messages=messages,
+			error=bool(rejected),
+			error_file=make_error_file(columns, rejected) if rejected else None,
+		),
+	)
+
+
+def read_and_import_attendances(file: str) -> tuple[int, list[tuple], list[str]]:
+	file_path = frappe.get_doc("File", file).get_full_path()
+	encoding, total = get_file_encoding(file_path)
+
+	imported, rejected = 0, []
+	with open(file_path, newline="", encoding=encoding) as f:
+		reader = csv.reader(f)
+		columns = get_import_columns(reader)
 
-def import_attendances(rows):
-	def remove_holidays(rows):
-		rows = [row for row in rows if row[4] != "Holiday"]
-		return rows
+		for chunk in get_import_chunks(reader):
+			inserted, failed = import_attendance_chunk(columns, chunk)
+			imported += inserted
+			rejected.extend(failed)
+			frappe.db.commit()  # nosemgrep
+			# progress once per chunk instead of once per row
+			frappe.publish_realtime("import_attendance", dict(progress=reader.line_num, total=total))
 
+	return imported, rejected, columns
+
+
+def get_file_encoding(file_path: str) -> tuple[str, int]:
+	"""Returns the first encoding that decodes the whole file, tried in the same order as
+	`frappe.utils.csvutils.read_csv_content`, along with the number of lines in the file"""
+	for encoding in ATTENDANCE_IMPORT_ENCODINGS:
+		try:
+			with open(file_path, newline="", encoding=encoding) as f:
+				return encoding, sum(1 for _line in f)
+		except UnicodeDecodeError:
+			continue
+
+	frappe.throw(_("Unknown file encoding. Tried to use: {0}").format(", ".join(ATTENDANCE_IMPORT_ENCODINGS)))
+
+
+def get_import_columns(reader) -> list[str]:
+	"""Skips the notes of the template and returns the fieldnames of the header row"""
 	from frappe.modules import scrub
 
-	rows = list(filter(lambda x: x and any(x), rows))
-	columns = [scrub(f) for f in rows[4]]
+	non_empty_rows = (row for row in reader if row and any(row))
+	for _idx in range(TEMPLATE_NOTE_ROWS):
+		next(non_empty_rows, None)
+
+	header = next(non_empty_rows, None)
+	if not header:
+		frappe.throw(_("Please select a csv file"))
+
+	columns = [scrub(f) for f in header]
 	columns[0] = "name"
 	columns[3] = "attendance_date"
-	rows = rows[5:]
-	ret = []
-	error = False
-
-	rows = remove_holidays(rows)
+	return columns
 
-	from frappe.utils.csvutils import check_record, import_doc
 
-	for i, row in enumerate(rows):
-		if not row:
+def get_import_chunks(reader):
+	chunk = []
+	for row in reader:
+		if not (row and any(row)):
 			continue
-		row_idx = i + 5
+
+		chunk.append((reader.line_num, row))
+		if len(chunk) == ATTENDANCE_IMPORT_CHUNK_SIZE:
+			yield chunk
+			chunk = []
+
+	if chunk:
+		yield chunk
+
+
+def import_attendance_chunk(columns: list[str], rows: list[tuple]) -> tuple[int, list[tuple]]:
+	"""Inserts new attendance in bulk and overwrites existing attendance (rows with an ID) one document at a
+	time. Returns the number of imported rows and the rejected rows with the reason"""
+	from frappe.utils.dateutils import parse_date
+
+	records, updates, rejected = [], [], []
+	for row_idx, row in rows:
 		d = frappe._dict(zip(columns, row, strict=False))
+		if d.status == "Holiday":
+			continue
 
-		d["doctype"] = "Attendance"
+		d.row_idx, d.row = row_idx, row
 		if d.name:
-			d["docstatus"] = frappe.db.get_value("Attendance", d.name, "docstatus")
+			updates.append(d)
+			continue
 
 		try:
+			d.attendance_date = getdate(parse_date(d.attendance_date))
+		except Exception:
+			rejected.append((row_idx, row, _("Invalid date {0}").format(d.attendance_date)))
+			continue
+		records.append(d)
+
+	records, failed = validate_import_links(records)
+	rejected.extend((d.row_idx, d.row, d.error) for d in failed)
+
+	inserted, failed = insert_attendance_in_bulk(records)
+	rejected.extend((d["row_idx"], d["row"], d["error"]) for d in failed)
+
+	updated, failed = update_existing_attendance(updates)
+	rejected.extend(failed)
+
+	return len(inserted) + updated, sorted(rejected, key=lambda d: d[0])
+
+
+def validate_import_links(records: list[dict]) -> tuple[list[dict], list[dict]]:
+	"""Checks the company, leave type and naming series of new records with one query per doctype,
+	since bulk inserted attendance skips link validation. Returns the valid and the rejected records"""
+	companies = get_existing_names("Company", {d.company for d in records if d.company})
+	leave_types = get_existing_names("Leave Type", {d.leave_type for d in records if d.leave_type})
+	naming_series = get_naming_series_options()
+	default_series = naming_series[0] if naming_series else None
+
+	valid, rejected = [], []
+	for d in records:
+		d.naming_series = d.naming_series or default_series
+		if d.company and d.company not in companies:
+			d.error = _("Company {0} does not exist").format(d.company)
+		elif d.leave_type and d.leave_type not in leave_types:
+			d.error = _("Leave Type {0} does not exist").format(d.leave_type)
+		elif d.naming_series not in naming_series:
+			d.error = _("Naming Series {0} is not allowed for Attendance").format(d.naming_series)
+		else:
+			valid.append(d)
+			continue
+		rejected.append(d)
+
+	return valid, rejected
+
+
+def get_existing_names(doctype: str, names: set[str]) -> set[str]:
+	if not names:
+		return set()
+	return set(frappe.get_all(doctype, filters={"name": ("in", list(names))}, pluck="name"))
+
+
+def update_existing_attendance(rows: list[dict]) -> tuple[int, list[tuple]]:
+	from frappe.utils.csvutils import check_record, import_doc
+
+	if not rows:
+		return 0, []
+
+	docstatus = dict(
+		frappe.get_all(
+			"Attendance",
+			filters={"name": ("in", [d.name for d in rows])},
+			fields=["name", "docstatus"],
+			as_list=True,
+		)
+	)
+	updated, rejected = 0, []
+	for d in rows:
+		row_idx, row = d.pop("row_idx"), d.pop("row")
+		d.update({"doctype": "Attendance", "docstatus": docstatus.get(d.name)})
+		try:
+			frappe.db.savepoint("before_attendance_update")
 			check_record(d)
-			ret.append(import_doc(d, "Attendance", 1, row_idx, submit=True))
-			frappe.publish_realtime("import_attendance", dict(progress=i, total=len(rows)))
-		except AttributeError:
-			pass
+			import_doc(d, "Attendance", 1, row_idx, submit=True)
+			updated += 1
 		except Exception as e:
-			error = True
-			ret.append("Error for row (#%d) %s : %s" % (row_idx, len(row) > 1 and row[1] or "", cstr(e)))
-			frappe.errprint(frappe.get_traceback())
+			frappe.db.rollback(save_point="before_attendance_update")
+			rejected.append((row_idx, row, cstr(e)))
+
+	return updated, rejected
 
-	if error:
-		frappe.db.rollback()
-	else:
-		frappe.db.commit()
 
-	frappe.publish_realtime("import_attendance", dict(messages=ret, error=error))
+def make_error_file(columns: list[str], rejected: list[tuple]) -> str:
+	"""Saves the rejected rows along with the reason so they can be corrected and uploaded again"""
+	w = UnicodeWriter()
+	add_header(w)
+	# the error column is dropped on import
+	for _row_idx, row, error in rejected:
+		w.writerow([*row[: len(columns)], error])
+
+	file = frappe.get_doc(
+		{
+			"doctype": "File",
+			"file_name": f"attendance_import_errors_{frappe.generate_hash(length=6)}.csv",
+			"is_private": 1,
+			"content": cstr(w.getvalue()),
+		}
+	).insert(ignore_permissions=True)
+	return file.file_url
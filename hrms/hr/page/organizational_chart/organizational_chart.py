@@ -1,20 +1,69 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
+
 import frappe
-from frappe.query_builder.functions import Count
+
+EMPLOYEE_HIERARCHY = "employee_hierarchy"
 
 
 @frappe.whitelist()
 def get_children(parent=None, company=None, exclude_node=None):
-	filters = [["status", "=", "Active"]]
-	if company and company != "All Companies":
-		filters.append(["company", "=", company])
+	hierarchy = get_hierarchy(company)
+
+	if not (parent and company and parent != company):
+		parent = ""
+
+	return [
+		frappe._dict(hierarchy["nodes"][child])
+		for child in hierarchy["children"].get(parent, [])
+		if child != exclude_node
+	]
 
-	if parent and company and parent != company:
-		filters.append(["reports_to", "=", parent])
+
+@frappe.whitelist()
+def get_all_nodes(company, parent=None, max_depth=None):
+	"""Returns child nodes of every expandable node under `parent` (root nodes if not set)
+	in the format of `hrms.utils.hierarchy_chart.get_all_nodes`, reading the cached hierarchy.
+	Pass `max_depth` to fetch only the top levels of a subtree for very large organizations."""
+	hierarchy = get_hierarchy(company)
+	nodes, children = hierarchy["nodes"], hierarchy["children"]
+	max_depth = frappe.utils.cint(max_depth)
+
+	if parent:
+		nodes_to_expand = deque([(parent, 1)] if parent in nodes else [])
 	else:
-		filters.append(["reports_to", "=", ""])
+		nodes_to_expand = deque((root, 1) for root in children.get("", []))
+
+	result = []
+	while nodes_to_expand:
+		node, depth = nodes_to_expand.popleft()
+		data = [frappe._dict(nodes[child]) for child in children.get(node, [])]
+		result.append(dict(parent=node, parent_name=nodes[node]["name"], data=data))
+
+		if max_depth and depth >= max_depth:
+			continue
+		nodes_to_expand.extend((d.id, depth + 1) for d in data if d.expandable)
 
-	if exclude_node:
-		filters.append(["name", "!=", exclude_node])
+	return result
+
+
+def get_hierarchy(company: str | None = None) -> dict:
+	"""Returns the active employee tree of the company, built with a single query and cached until
+	an Employee is updated or deleted"""
+	key = company if company and company != "All Companies" else "All Companies"
+	hierarchy = frappe.cache().hget(EMPLOYEE_HIERARCHY, key)
+
+	if hierarchy is None:
+		hierarchy = build_hierarchy(None if key == "All Companies" else key)
+		frappe.cache().hset(EMPLOYEE_HIERARCHY, key, hierarchy)
+
+	return hierarchy
+
+
+def build_hierarchy(company: str | None = None) -> dict:
+	filters = [["status", "=", "Active"]]
+	if company:
+		filters.append(["company", "=", company])
 
 	employees = frappe.get_all(
 		"Employee",
@@ -31,19 +80,22 @@ def get_children(parent=None, company=None, exclude_node=None):
 		order_by="name",
 	)
 
+	# descendants of a node are the ones with lft between the node's lft and rgt
+	lfts = sorted(d.lft for d in employees if d.lft is not None)
+
+	nodes, children = {}, {}
 	for employee in employees:
-		employee.connections = get_connections(employee.id, employee.lft, employee.rgt)
+		employee.connections = (
+			bisect_left(lfts, employee.rgt) - bisect_right(lfts, employee.lft)
+			if employee.lft is not None and employee.rgt is not None
+			else 0
+		)
 		employee.expandable = bool(employee.connections)
+		nodes[employee.id] = employee
+		children.setdefault(employee.reports_to or "", []).append(employee.id)
 
-	return employees
-
+	return {"nodes": nodes, "children": children}
 
-def get_connections(employee: str, lft: int, rgt: int) -> int:
-	Employee = frappe.qb.DocType("Employee")
-	query = (
-		frappe.qb.from_(Employee)
-		.select(Count(Employee.name))
-		.where((Employee.lft > lft) & (Employee.rgt < rgt) & (Employee.status == "Active"))
-	).run()
 
-	return query[0][0]
+def invalidate_cache(doc, method=None):
+	frappe.cache().delete_value(EMPLOYEE_HIERARCHY)
@@ -4,8 +4,10 @@
 
 import frappe
 from frappe import _
+from frappe.query_builder import Criterion
+from frappe.query_builder.functions import Coalesce, NullIf
 
-from erpnext.setup.doctype.employee.employee import get_holiday_list_for_employee
+from erpnext.accounts.utils import build_qb_match_conditions
 
 
 def execute(filters=None):
@@ -51,40 +53,45 @@ def get_columns():
 
 
 def get_data(filters):
+	"""Returns attendance marked on holidays for all employees of the company with a single query.
+
+	The effective holiday list (employee's, else the company default) is resolved in the join.
+	"""
+	Employee = frappe.qb.DocType("Employee")
+	Company = frappe.qb.DocType("Company")
 	Attendance = frappe.qb.DocType("Attendance")
 	Holiday = frappe.qb.DocType("Holiday")
 
-	data = []
+	holiday_list = Coalesce(NullIf(Employee.holiday_list, ""), Company.default_holiday_list)
+	query = (
+		frappe.qb.from_(Employee)
+		.inner_join(Company)
+		.on(Employee.company == Company.name)
+		.inner_join(Attendance)
+		.on(Attendance.employee == Employee.name)
+		.inner_join(Holiday)
+		.on((Holiday.parent == holiday_list) & (Holiday.holiday_date == Attendance.attendance_date))
+		.select(
+			Attendance.employee,
+			Attendance.employee_name,
+			Attendance.attendance_date,
+			Attendance.status,
+			Holiday.description,
+		)
+		.where(
+			(Employee.company == filters.company)
+			& (Attendance.attendance_date[filters.from_date : filters.to_date])
+			& (Attendance.status.notin(["Absent", "On Leave"]))
+			& (Attendance.docstatus == 1)
+			& Criterion.all(build_qb_match_conditions("Employee"))
+		)
+		.orderby(Attendance.attendance_date)
+		.orderby(Attendance.employee)
+	)
 
-	employee_filters = {"company": filters.company}
 	if filters.department:
-		employee_filters["department"] = filters.department
-
-	for employee in frappe.get_list("Employee", filters=employee_filters, pluck="name"):
-		holiday_list = get_holiday_list_for_employee(employee, raise_exception=False)
-		if not holiday_list or (filters.holiday_list and filters.holiday_list != holiday_list):
-			continue
-
-		working_days = (
-			frappe.qb.from_(Attendance)
-			.inner_join(Holiday)
-			.on(Attendance.attendance_date == Holiday.holiday_date)
-			.select(
-				Attendance.employee,
-				Attendance.employee_name,
-				Attendance.attendance_date,
-				Attendance.status,
-				Holiday.description,
-			)
-			.where(
-				(Attendance.employee == employee)
-				& (Attendance.attendance_date[filters.from_date : filters.to_date])
-				& (Attendance.status.notin(["Absent", "On Leave"]))
-				& (Attendance.docstatus == 1)
-				& (Holiday.parent == holiday_list)
-			)
-			.run(as_list=True)
-		)
-		data.extend(working_days)
+		query = query.where(Employee.department == filters.department)
+	if filters.holiday_list:
+		query = query.where(holiday_list == filters.holiday_list)
 
-	return data
+	return query.run(as_list=True)
@@ -67,3 +67,6 @@ class TestEmployeesWorkingOnAHoliday(IntegrationTestCase):
 
 		for d in rows:
 			self.assertEqual(weekly_offs[d[0]], d[4])
+
+		filters.holiday_list = sunday_off
+		self.assertEqual({d[0] for d in execute(filters=filters)[1]}, {emp1})
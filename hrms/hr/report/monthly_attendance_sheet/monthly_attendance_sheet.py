@@ -13,9 +13,10 @@ import frappe
 from frappe import _
 from frappe.query_builder import Case
 from frappe.query_builder.functions import Count, Extract, Sum
-from frappe.utils import cint, cstr, formatdate, getdate
+from frappe.utils import cint, cstr, flt, formatdate, getdate
 from frappe.utils.nestedset import get_descendants_of
 
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import get_attendance_rollups
 from hrms.utils import date_diff, get_date_range
 
 Filters = frappe._dict
@@ -443,20 +444,31 @@ def get_rows(employee_details: dict, filters: Filters, holiday_map: dict, attend
 	records = []
 	default_holiday_list = frappe.get_cached_value("Company", filters.company, "default_holiday_list")
 
+	rollups = None
+	if filters.summarized_view and filters.filter_based_on == "Month":
+		rollups = get_attendance_rollups(
+			list(employee_details), filters.companies, date(cint(filters.year), cint(filters.month), 1)
+		)
+
 	for employee, details in employee_details.items():
 		emp_holiday_list = details.holiday_list or default_holiday_list
 		holidays = holiday_map.get(emp_holiday_list)
 
 		if filters.summarized_view:
+			summary, attendance_days, leave_summary, entry_exits_summary = (
+				get_attendance_details_for_summarized_view(employee, filters, rollups)
+			)
 			attendance = get_attendance_status_for_summarized_view(
-				employee, filters, holidays, details.joined_in_current_period, details.joined_date
+				summary,
+				attendance_days,
+				filters,
+				holidays,
+				details.joined_in_current_period,
+				details.joined_date,
 			)
 			if not attendance:
 				continue
 
-			leave_summary = get_leave_summary(employee, filters)
-			entry_exits_summary = get_entry_exits_summary(employee, filters)
-
 			row = {"employee": employee, "employee_name": details.employee_name}
 			set_defaults_for_summarized_view(filters, row)
 			row.update(attendance)
@@ -487,13 +499,51 @@ def set_defaults_for_summarized_view(filters, row):
 			row[entry.get("fieldname")] = 0.0
 
 
+def get_attendance_details_for_summarized_view(
+	employee: str, filters: Filters, rollups: dict | None
+) -> tuple[dict, list, dict, dict]:
+	"""Returns the attendance summary, marked days, leave summary and entry / exit summary for employee.
+	Monthly views read them from the attendance rollups fetched for all employees at once
+	"""
+	if rollups is None:
+		summary, attendance_days = get_attendance_summary_and_days(employee, filters)
+		return (
+			summary,
+			attendance_days,
+			get_leave_summary(employee, filters),
+			get_entry_exits_summary(employee, filters),
+		)
+
+	rollup = rollups.get(employee) or frappe._dict(leave_details={}, marked_days=set())
+	summary = frappe._dict(
+		total_present=flt(rollup.present_days) + flt(rollup.work_from_home_days),
+		total_absent=flt(rollup.absent_days),
+		total_leaves=flt(rollup.leave_days),
+		total_half_days=flt(rollup.half_days) * 0.5,
+	)
+	attendance_days = list(rollup.marked_days)
+	leave_summary = {
+		frappe.scrub(leave_type): leave_days for leave_type, leave_days in rollup.leave_details.items()
+	}
+	entry_exits_summary = {
+		"total_late_entries": cint(rollup.late_entries),
+		"total_early_exits": cint(rollup.early_exits),
+	}
+
+	return summary, attendance_days, leave_summary, entry_exits_summary
+
+
 def get_attendance_status_for_summarized_view(
-	employee: str, filters: Filters, holidays: list, joined_in_current_period: int, joined_date: int
+	summary: dict,
+	attendance_days: list,
+	filters: Filters,
+	holidays: list,
+	joined_in_current_period: int,
+	joined_date: int,
 ) -> dict:
 	"""Returns dict of attendance status for employee like
 	{'total_present': 1.5, 'total_leaves': 0.5, 'total_absent': 13.5, 'total_holidays': 8, 'unmarked_days': 5}
 	"""
-	summary, attendance_days = get_attendance_summary_and_days(employee, filters)
 	if not any(summary.values()):
 		return {}
 
@@ -25,6 +25,7 @@ class TestMonthlyAttendanceSheet(IntegrationTestCase):
 		self.employee = make_employee("test_employee@example.com", company=self.company)
 		self.filter_based_on = "Month"
 		frappe.db.delete("Attendance")
+		frappe.db.delete("Attendance Rollup")
 
 		if not frappe.db.exists("Shift Type", "Day Shift"):
 			setup_shift_type(shift_type="Day Shift")
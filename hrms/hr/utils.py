@@ -13,6 +13,7 @@ from frappe.query_builder.functions import Count
 from frappe.utils import (
 	add_days,
 	add_months,
+	cint,
 	comma_and,
 	cstr,
 	flt,
@@ -338,18 +339,30 @@ def generate_leave_encashment():
 			filters=[
 				["to_date", "=", add_days(getdate(), -1)],
 				["leave_type", "in", leave_type],
+				["docstatus", "=", 1],
 			],
 			fields=[
+				"name",
 				"employee",
 				"leave_period",
 				"leave_type",
+				"from_date",
 				"to_date",
 				"total_leaves_allocated",
 				"new_leaves_allocated",
+				"carry_forwarded_leaves_count",
 			],
 		)
 
-		create_leave_encashment(leave_allocation=leave_allocation)
+		summary = create_leave_encashment(leave_allocation=leave_allocation, commit=True)
+		if summary["skipped"]:
+			frappe.log_error(
+				title=_("Leave encashment skipped for {0} allocations").format(
+					sum(len(names) for names in summary["skipped"].values())
+				),
+				message=frappe.as_json(summary),
+				reference_doctype="Leave Encashment",
+			)
 
 
 def allocate_earned_leaves():
@@ -858,12 +871,7 @@ def get_ec_matching_query(
 	filters = []
 	ec = qb.DocType("Expense Claim")
 
-	mode_of_payments = [
-		x["parent"]
-		for x in frappe.db.get_all(
-			"Mode of Payment Account", filters={"default_account": bank_account}, fields=["parent"]
-		)
-	]
+	mode_of_payments = get_mode_of_payments_for_account(bank_account)
 	company_currency = get_company_currency(company)
 
 	filters.append(ec.docstatus == 1)
@@ -908,6 +916,80 @@ def get_ec_matching_query(
 	return ec_query
 
 
+def get_mode_of_payments_for_account(bank_account) -> list[str]:
+	return frappe.db.get_all(
+		"Mode of Payment Account", filters={"default_account": bank_account}, pluck="parent"
+	)
+
+
+@frappe.whitelist()
+def get_ec_matches_for_bank_transactions(
+	bank_account: str,
+	company: str,
+	bank_transactions: str | list,
+	exact_match: bool | int = False,
+	from_date: str | None = None,
+	to_date: str | None = None,
+) -> dict[str, list[dict]]:
+	"""Returns matching Expense Claims for a set of bank transactions, ranked like `get_ec_matching_query`.
+
+	Claims are matched to all transactions with one query joining the transactions on the amount bound.
+	"""
+	frappe.has_permission("Bank Transaction", "read", throw=True)
+	frappe.has_permission("Expense Claim", "read", throw=True)
+
+	transactions = frappe.get_all(
+		"Bank Transaction",
+		filters={"name": ("in", frappe.parse_json(bank_transactions)), "withdrawal": (">", 0)},
+		pluck="name",
+	)
+	if not transactions:
+		return {}
+
+	bt = qb.DocType("Bank Transaction")
+	ec = qb.DocType("Expense Claim")
+
+	if cint(exact_match):
+		amount_condition = ec.total_amount_reimbursed == bt.unallocated_amount
+	else:
+		amount_condition = ec.total_amount_reimbursed > bt.unallocated_amount
+
+	filters = [bt.name.isin(transactions), ec.is_paid == 1, ec.clearance_date.isnull(), ec.docstatus == 1]
+	if mode_of_payments := get_mode_of_payments_for_account(bank_account):
+		filters.append(ec.mode_of_payment.isin(mode_of_payments))
+	if from_date and to_date:
+		filters.append(ec.posting_date[from_date:to_date])
+
+	ref_rank = frappe.qb.terms.Case().when(ec.employee == bt.party, 1).else_(0) + 1
+	rows = (
+		qb.from_(bt)
+		.inner_join(ec)
+		.on(amount_condition)
+		.select(
+			bt.name.as_("bank_transaction"),
+			ref_rank.as_("rank"),
+			ConstantColumn("Expense Claim").as_("doctype"),
+			ec.name,
+			ec.total_sanctioned_amount.as_("paid_amount"),
+			ConstantColumn("").as_("reference_no"),
+			ConstantColumn("").as_("reference_date"),
+			ec.employee.as_("party"),
+			ConstantColumn("Employee").as_("party_type"),
+			ec.posting_date,
+			ConstantColumn(get_company_currency(company)).as_("currency"),
+		)
+		.where(Criterion.all(filters))
+		.orderby(ref_rank, order=frappe.qb.desc)
+		.orderby(ec.posting_date)
+	).run(as_dict=True)
+
+	matches = {name: [] for name in transactions}
+	for row in rows:
+		matches[row.pop("bank_transaction")].append(row)
+
+	return matches
+
+
 def validate_bulk_tool_fields(
 	self, fields: list, employees: list, from_date: str | None = None, to_date: str | None = None
 ) -> None:
@@ -28,7 +28,7 @@ class PWANotificationsMixin:
 
 			notification.reference_document_type = self.doctype
 			notification.reference_document_name = self.name
-			notification.insert(ignore_permissions=True)
+			self._insert_notification(notification)
 
 	def notify_approver(self):
 		"""Send new Leave Application, Expense Claim & Shift Request request notification - to approvers"""
@@ -47,7 +47,14 @@ class PWANotificationsMixin:
 
 		notification.reference_document_type = self.doctype
 		notification.reference_document_name = self.name
-		notification.insert(ignore_permissions=True)
+		self._insert_notification(notification)
+
+	def _insert_notification(self, notification):
+		if self.flags.pwa_notifications is not None:
+			# collected by bulk actions and inserted together, see `insert_pwa_notifications`
+			self.flags.pwa_notifications.append(notification)
+		else:
+			notification.insert(ignore_permissions=True)
 
 	def _get_doc_status_field(self) -> str:
 		APPROVAL_STATUS_FIELD = {
@@ -71,3 +78,22 @@ class PWANotificationsMixin:
 
 	def _get_user_name(self, user) -> str:
 		return frappe.db.get_value("User", user, "full_name", cache=True)
+
+
+def insert_pwa_notifications(notifications: list) -> None:
+	"""Inserts notifications collected from bulk actions in one go and sends the realtime and push updates"""
+	import hrms
+	from hrms.api import invalidate_home_dashboard
+	from hrms.utils.bulk import bulk_insert_docs
+
+	if not notifications:
+		return
+
+	bulk_insert_docs("PWA Notification", [notification.as_dict() for notification in notifications])
+
+	for user in {notification.to_user for notification in notifications}:
+		hrms.refetch_resource("hrms:notifications", user)
+		invalidate_home_dashboard(frappe._dict(doctype="PWA Notification", to_user=user))
+
+	for notification in notifications:
+		notification.send_push_notification()
@@ -45,6 +45,21 @@ def validate_onboarding_process(doc, method=None):
 		onboarding.db_set("employee", doc.name)
 
 
+def set_month_day_fields(doc, method=None):
+	"""Sets indexed month-day copies of birth and joining dates used by the daily reminders"""
+	for fieldname, date_field in (
+		("birth_month_day", "date_of_birth"),
+		("joining_month_day", "date_of_joining"),
+	):
+		date = doc.get(date_field)
+		doc.set(fieldname, get_month_day(date) if date else 0)
+
+
+def get_month_day(date) -> int:
+	date = getdate(date)
+	return date.month * 100 + date.day
+
+
 def publish_update(doc, method=None):
 	import hrms
 
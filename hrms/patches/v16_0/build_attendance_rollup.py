@@ -0,0 +1,5 @@
+from hrms.hr.doctype.attendance_rollup.attendance_rollup import rebuild_attendance_rollup
+
+
+def execute():
+	rebuild_attendance_rollup()
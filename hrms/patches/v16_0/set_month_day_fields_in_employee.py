@@ -0,0 +1,23 @@
+import frappe
+from frappe.custom.doctype.custom_field.custom_field import create_custom_fields
+from frappe.query_builder.functions import Extract
+
+from hrms.setup import get_month_day_fields
+
+
+def execute():
+	create_custom_fields({"Employee": get_month_day_fields()}, ignore_validate=True)
+
+	Employee = frappe.qb.DocType("Employee")
+	for fieldname, date_field in (
+		("birth_month_day", "date_of_birth"),
+		("joining_month_day", "date_of_joining"),
+	):
+		(
+			frappe.qb.update(Employee)
+			.set(
+				Employee[fieldname],
+				Extract("month", Employee[date_field]) * 100 + Extract("day", Employee[date_field]),
+			)
+			.where(Employee[date_field].isnotnull())
+		).run()
@@ -5,13 +5,18 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 from frappe.query_builder.functions import Sum
-from frappe.utils import getdate
+from frappe.utils import cint, getdate
 
 from hrms.payroll.doctype.employee_benefit_ledger.employee_benefit_ledger import (
 	delete_employee_benefit_ledger_entry,
 )
 from hrms.payroll.doctype.salary_structure.salary_structure import make_salary_slip
 
+BULK_ARREAR_RUN = "hrms:bulk_arrear_run"
+BULK_ARREAR_RUN_TTL = 7 * 24 * 60 * 60
+ARREAR_SHARD_SIZE = 200
+ARREAR_COMMIT_SIZE = 50
+
 
 class Arrear(Document):
 	@property
@@ -118,7 +123,10 @@ class Arrear(Document):
 	def get_existing_salary_slips(self):
 		salary_slips = []
 
-		if self.employee and self.arrear_start_date:
+		if self.flags.salary_slips is not None:
+			# preloaded by the bulk arrear run
+			salary_slips = self.flags.salary_slips
+		elif self.employee and self.arrear_start_date:
 			filters = {
 				"employee": self.employee,
 				"docstatus": 1,
@@ -294,16 +302,10 @@ class Arrear(Document):
 			)
 
 			# check if any Payroll Corrections exist for this slip and sum days_to_reverse to get actual payment days for when previewing salary slip for new structure
-			PayrollCorrection = frappe.qb.DocType("Payroll Correction")
-			total_days_to_reverse = (
-				frappe.qb.from_(PayrollCorrection)
-				.select(Sum(PayrollCorrection.days_to_reverse).as_("total_days"))
-				.where(
-					(PayrollCorrection.salary_slip_reference == slip.name)
-					& (PayrollCorrection.docstatus == 1)
-				)
-			).run(pluck=True)
-			total_days_to_reverse = total_days_to_reverse[0] or 0.0
+			if self.flags.days_to_reverse is not None:
+				total_days_to_reverse = self.flags.days_to_reverse.get(slip.name, 0.0)
+			else:
+				total_days_to_reverse = get_days_to_reverse([slip.name]).get(slip.name, 0.0)
 
 			preview_slip = make_salary_slip(
 				self.salary_structure,
@@ -453,3 +455,203 @@ class Arrear(Document):
 					"flexible_benefit": is_flexible_benefit,
 				}
 			).insert()
+
+
+def get_days_to_reverse(salary_slips: list) -> dict[str, float]:
+	"""Returns the total LWP days reversed by submitted Payroll Corrections for each salary slip"""
+	PayrollCorrection = frappe.qb.DocType("Payroll Correction")
+	days_to_reverse = (
+		frappe.qb.from_(PayrollCorrection)
+		.select(
+			PayrollCorrection.salary_slip_reference,
+			Sum(PayrollCorrection.days_to_reverse).as_("total_days"),
+		)
+		.where(
+			(PayrollCorrection.salary_slip_reference.isin(salary_slips)) & (PayrollCorrection.docstatus == 1)
+		)
+		.groupby(PayrollCorrection.salary_slip_reference)
+	).run()
+
+	return {slip: total_days or 0.0 for slip, total_days in days_to_reverse}
+
+
+@frappe.whitelist()
+def create_arrears_in_bulk(
+	employees: str | list,
+	salary_structure: str,
+	payroll_period: str,
+	arrear_start_date: str,
+	payroll_date: str,
+	submit: bool | int = 0,
+) -> dict:
+	"""Creates Arrears for a retroactive salary structure revision across employees.
+	Employees are split into shards that are processed by parallel background jobs,
+	use `get_bulk_arrear_summary` with the returned run id to track the run"""
+	frappe.has_permission("Arrear", "create", throw=True)
+	if cint(submit):
+		frappe.has_permission("Arrear", "submit", throw=True)
+
+	employees = list(dict.fromkeys(frappe.parse_json(employees) or []))
+	if not employees:
+		frappe.throw(_("Please select employees to create arrears for"), title=_("No Employees Selected"))
+
+	company, currency = frappe.db.get_value("Salary Structure", salary_structure, ["company", "currency"])
+	existing_arrears = set(
+		frappe.get_all(
+			"Arrear",
+			filters={
+				"employee": ("in", employees),
+				"salary_structure": salary_structure,
+				"payroll_period": payroll_period,
+				"docstatus": ("!=", 2),
+			},
+			pluck="employee",
+		)
+	)
+	pending_employees = [employee for employee in employees if employee not in existing_arrears]
+
+	run_id = frappe.generate_hash(length=10)
+	shards = [
+		pending_employees[idx : idx + ARREAR_SHARD_SIZE]
+		for idx in range(0, len(pending_employees), ARREAR_SHARD_SIZE)
+	]
+	frappe.cache().set_value(
+		get_run_cache_key(run_id),
+		{"total": len(employees), "shards": len(shards), "skipped": sorted(existing_arrears)},
+		expires_in_sec=BULK_ARREAR_RUN_TTL,
+	)
+
+	args = frappe._dict(
+		salary_structure=salary_structure,
+		payroll_period=payroll_period,
+		arrear_start_date=arrear_start_date,
+		payroll_date=payroll_date,
+		company=company,
+		currency=currency,
+		submit=cint(submit),
+	)
+	for shard_idx, shard in enumerate(shards):
+		frappe.enqueue(
+			create_arrears_for_shard,
+			queue="long",
+			timeout=3000,
+			run_id=run_id,
+			shard_idx=shard_idx,
+			employees=shard,
+			args=args,
+		)
+
+	if shards:
+		frappe.msgprint(
+			_("Arrear creation for {0} employee(s) is queued. It may take a few minutes.").format(
+				len(pending_employees)
+			),
+			alert=True,
+			indicator="blue",
+		)
+
+	return {"run_id": run_id, "queued": len(pending_employees), "skipped": len(existing_arrears)}
+
+
+def create_arrears_for_shard(run_id: str, shard_idx: int, employees: list, args: dict) -> None:
+	args = frappe._dict(args)
+	success, failure = [], []
+	savepoint = "before_arrear_creation"
+
+	salary_slips = frappe.get_all(
+		"Salary Slip",
+		filters={
+			"employee": ("in", employees),
+			"docstatus": 1,
+			"start_date": (">=", args.arrear_start_date),
+		},
+		fields=["name", "employee", "posting_date", "start_date", "end_date"],
+		order_by="start_date",
+	)
+	salary_slips_by_employee = {}
+	for slip in salary_slips:
+		salary_slips_by_employee.setdefault(slip.pop("employee"), []).append(slip)
+
+	days_to_reverse = get_days_to_reverse([slip.name for slip in salary_slips]) if salary_slips else {}
+
+	for idx, employee in enumerate(employees, start=1):
+		arrear = frappe.get_doc(
+			{
+				"doctype": "Arrear",
+				"employee": employee,
+				"company": args.company,
+				"currency": args.currency,
+				"salary_structure": args.salary_structure,
+				"payroll_period": args.payroll_period,
+				"arrear_start_date": args.arrear_start_date,
+				"payroll_date": args.payroll_date,
+			}
+		)
+		arrear.flags.salary_slips = salary_slips_by_employee.get(employee, [])
+		arrear.flags.days_to_reverse = days_to_reverse
+
+		try:
+			frappe.db.savepoint(savepoint)
+			arrear.insert()
+			if args.submit:
+				arrear.submit()
+		except Exception as e:
+			frappe.db.rollback(save_point=savepoint)
+			frappe.clear_last_message()
+			failure.append({"employee": employee, "error": str(e)})
+		else:
+			success.append({"doc": arrear.name, "employee": employee})
+
+		if idx % ARREAR_COMMIT_SIZE == 0 or idx == len(employees):
+			frappe.db.commit()  # nosemgrep
+			frappe.publish_progress(
+				idx * 100 / len(employees),
+				title=_("Creating Arrears..."),
+				description=_("Batch {0}: {1} of {2}").format(shard_idx + 1, idx, len(employees)),
+			)
+
+	frappe.cache().set_value(
+		get_run_cache_key(run_id, shard_idx),
+		{"success": success, "failure": failure},
+		expires_in_sec=BULK_ARREAR_RUN_TTL,
+	)
+	frappe.publish_realtime(
+		"completed_bulk_arrear_creation",
+		message=get_bulk_arrear_summary(run_id),
+		doctype="Arrear",
+		user=frappe.session.user,
+	)
+
+
+@frappe.whitelist()
+def get_bulk_arrear_summary(run_id: str) -> dict:
+	"""Summary report of a bulk arrear run, aggregated over the shards completed so far"""
+	frappe.has_permission("Arrear", "read", throw=True)
+
+	run = frappe.cache().get_value(get_run_cache_key(run_id))
+	if not run:
+		frappe.throw(_("Bulk arrear run {0} not found").format(run_id))
+
+	summary = {
+		"total": run["total"],
+		"skipped": run["skipped"],
+		"success": [],
+		"failure": [],
+		"completed_shards": 0,
+		"shards": run["shards"],
+	}
+	for shard_idx in range(run["shards"]):
+		shard = frappe.cache().get_value(get_run_cache_key(run_id, shard_idx))
+		if shard:
+			summary["completed_shards"] += 1
+			summary["success"].extend(shard["success"])
+			summary["failure"].extend(shard["failure"])
+
+	summary["status"] = "Completed" if summary["completed_shards"] == run["shards"] else "In Progress"
+	return summary
+
+
+def get_run_cache_key(run_id: str, shard_idx: int | None = None) -> str:
+	"""Summaries of a bulk arrear run and of its shards, each expiring on its own"""
+	key = f"{BULK_ARREAR_RUN}:{run_id}"
+	return key if shard_idx is None else f"{key}:{shard_idx}"
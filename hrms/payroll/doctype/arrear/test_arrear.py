@@ -1,6 +1,7 @@
 # Copyright (c) 2025, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 import calendar
+from unittest.mock import patch
 
 import frappe
 from frappe.tests import IntegrationTestCase
@@ -8,6 +9,13 @@ from frappe.utils import add_days, add_months, getdate
 
 from erpnext.setup.doctype.employee.test_employee import make_employee
 
+from hrms.payroll.doctype.arrear.arrear import (
+	BULK_ARREAR_RUN_TTL,
+	create_arrears_for_shard,
+	create_arrears_in_bulk,
+	get_bulk_arrear_summary,
+	get_run_cache_key,
+)
 from hrms.payroll.doctype.salary_slip.test_salary_slip import (
 	make_payroll_period,
 )
@@ -42,19 +50,8 @@ class TestArrear(IntegrationTestCase):
 		)
 
 		# Create new payroll period for next year
-		next_year_start = add_days(current_payroll_period.end_date, 1)
-		next_year_end = add_months(current_payroll_period.end_date, 1)
-
-		new_payroll_period = frappe.get_doc(
-			{
-				"doctype": "Payroll Period",
-				"name": f"Test Payroll Period {getdate(next_year_start).year}",
-				"company": "_Test Company",
-				"start_date": next_year_start,
-				"end_date": next_year_end,
-			}
-		)
-		new_payroll_period.insert()
+		new_payroll_period = make_next_payroll_period(current_payroll_period)
+		next_year_start = new_payroll_period.start_date
 
 		frappe.db.set_single_value("Payroll Settings", "payroll_based_on", "Leave")
 		leave_application = frappe.get_doc(
@@ -193,3 +190,127 @@ class TestArrear(IntegrationTestCase):
 			self.assertIn("Accrued Earnings", accrual_components)
 
 		frappe.db.rollback()
+
+	def test_bulk_arrear_summary(self):
+		emp = make_employee("test_bulk_arrear@salary.com", company="_Test Company")
+		make_payroll_period()
+		payroll_period = frappe.get_last_doc("Payroll Period", filters={"company": "_Test Company"})
+		salary_structure = make_salary_structure(
+			"Test Bulk Arrear Structure", "Monthly", company="_Test Company"
+		)
+
+		run_id = "_test_bulk_arrear_run"
+		frappe.cache().set_value(
+			get_run_cache_key(run_id),
+			{"total": 1, "shards": 1, "skipped": []},
+			expires_in_sec=BULK_ARREAR_RUN_TTL,
+		)
+		self.assertEqual(get_bulk_arrear_summary(run_id)["status"], "In Progress")
+
+		# employee has no salary slips in the period, arrear creation fails without stopping the run
+		create_arrears_for_shard(
+			run_id,
+			0,
+			[emp],
+			{
+				"salary_structure": salary_structure.name,
+				"payroll_period": payroll_period.name,
+				"arrear_start_date": payroll_period.start_date,
+				"payroll_date": payroll_period.end_date,
+				"company": "_Test Company",
+				"currency": salary_structure.currency,
+			},
+		)
+
+		summary = get_bulk_arrear_summary(run_id)
+		self.assertEqual(summary["status"], "Completed")
+		self.assertEqual(summary["success"], [])
+		self.assertEqual(summary["failure"][0]["employee"], emp)
+		self.assertFalse(frappe.db.exists("Arrear", {"employee": emp}))
+
+	def test_bulk_arrear_creation(self):
+		emp = make_employee(
+			"test_bulk_arrear_success@salary.com", company="_Test Company", date_of_joining="2021-01-01"
+		)
+		make_payroll_period()
+		current_payroll_period = frappe.get_last_doc("Payroll Period", filters={"company": "_Test Company"})
+		frappe.db.set_single_value("Payroll Settings", "payroll_based_on", "Leave")
+
+		old_salary_structure = make_salary_structure(
+			"Test Bulk Arrear Old Structure",
+			"Monthly",
+			company="_Test Company",
+			employee=emp,
+			payroll_period=current_payroll_period,
+			test_arrear=True,
+			base=50000,
+		)
+		payroll_period = make_next_payroll_period(current_payroll_period)
+		salary_slip = make_salary_slip(
+			old_salary_structure.name, employee=emp, posting_date=payroll_period.start_date
+		)
+		salary_slip.submit()
+
+		new_salary_structure = make_salary_structure(
+			"Test Bulk Arrear New Structure",
+			"Monthly",
+			employee=emp,
+			from_date=payroll_period.start_date,
+			company="_Test Company",
+			payroll_period=payroll_period,
+			base=75000,
+			test_arrear=True,
+		)
+
+		# shards run right away instead of in background jobs
+		def run_now(method, queue=None, timeout=None, **kwargs):
+			method(**kwargs)
+
+		with patch("hrms.payroll.doctype.arrear.arrear.frappe.enqueue", side_effect=run_now):
+			run = create_arrears_in_bulk(
+				[emp],
+				new_salary_structure.name,
+				payroll_period.name,
+				payroll_period.start_date,
+				add_months(payroll_period.start_date, 2),
+			)
+		self.assertEqual(run["queued"], 1)
+
+		summary = get_bulk_arrear_summary(run["run_id"])
+		self.assertEqual(summary["status"], "Completed")
+		self.assertEqual(summary["failure"], [])
+		self.assertEqual([d["employee"] for d in summary["success"]], [emp])
+
+		arrear = frappe.get_doc("Arrear", summary["success"][0]["doc"])
+		self.assertEqual(arrear.docstatus, 0)
+		earning_arrears = {row.salary_component: row.amount for row in arrear.earning_arrears}
+		self.assertEqual(earning_arrears["Basic Salary"], 25000)
+
+		# the next run skips employees that already have an arrear
+		with patch("hrms.payroll.doctype.arrear.arrear.frappe.enqueue", side_effect=run_now):
+			run = create_arrears_in_bulk(
+				[emp],
+				new_salary_structure.name,
+				payroll_period.name,
+				payroll_period.start_date,
+				add_months(payroll_period.start_date, 2),
+			)
+		self.assertEqual(run["skipped"], 1)
+		self.assertEqual(get_bulk_arrear_summary(run["run_id"])["skipped"], [emp])
+
+
+def make_next_payroll_period(payroll_period):
+	start_date = add_days(payroll_period.end_date, 1)
+	name = f"Test Payroll Period {getdate(start_date).year}"
+	if frappe.db.exists("Payroll Period", name):
+		return frappe.get_doc("Payroll Period", name)
+
+	return frappe.get_doc(
+		{
+			"doctype": "Payroll Period",
+			"name": name,
+			"company": "_Test Company",
+			"start_date": start_date,
+			"end_date": add_months(payroll_period.end_date, 1),
+		}
+	).insert()
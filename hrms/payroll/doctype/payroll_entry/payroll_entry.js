@@ -167,6 +167,11 @@ frappe.ui.form.on("Payroll Entry", {
 			(frm.doc.__onload && frm.doc.__onload.submitted_ss)
 		) {
 			frm.events.add_bank_entry_button(frm);
+			frm.add_custom_button(
+				__("Salary Slip Emails"),
+				() => show_salary_slip_email_status(frm),
+				__("View"),
+			);
 		} else if (frm.doc.salary_slips_created && frm.doc.status !== "Queued") {
 			frm.add_custom_button(__("Submit Salary Slip"), function () {
 				submit_salary_slip(frm);
@@ -470,3 +475,40 @@ let render_employee_attendance = function (frm, data) {
 		}),
 	);
 };
+
+const show_salary_slip_email_status = function (frm) {
+	frappe
+		.call({
+			method: "hrms.payroll.doctype.salary_slip.salary_slip_distribution.get_salary_slip_distribution_status",
+			args: { payroll_entry: frm.doc.name },
+		})
+		.then(({ message }) => {
+			const summary = Object.entries(message.summary)
+				.map(([status, count]) => `${__(status)}: ${count}`)
+				.join(", ");
+			const rows = message.salary_slips
+				.filter((slip) => slip.status !== "Sent")
+				.map(
+					(slip) => `<tr>
+						<td>${frappe.utils.get_form_link("Salary Slip", slip.name, true)}</td>
+						<td>${frappe.utils.escape_html(slip.employee_name)}</td>
+						<td>${__(slip.status)}</td>
+					</tr>`,
+				)
+				.join("");
+
+			frappe.msgprint({
+				title: __("Salary Slip Emails"),
+				message: `<p>${summary || __("No submitted Salary Slips")}</p>
+					${
+						rows
+							? `<table class="table table-bordered">
+								<tr><th>${__("Salary Slip")}</th><th>${__("Employee Name")}</th><th>${__("Status")}</th></tr>
+								${rows}
+							</table>`
+							: ""
+					}`,
+				wide: true,
+			});
+		});
+};
@@ -338,8 +338,11 @@ class PayrollEntry(Document):
 
 	def email_salary_slip(self, submitted_ss):
 		if frappe.db.get_single_value("Payroll Settings", "email_salary_slip_to_employee"):
-			for ss in submitted_ss:
-				ss.email_salary_slip()
+			from hrms.payroll.doctype.salary_slip.salary_slip_distribution import (
+				enqueue_salary_slip_distribution,
+			)
+
+			enqueue_salary_slip_distribution(self.name, [ss.name for ss in submitted_ss])
 
 	def get_salary_component_account(self, salary_component):
 		account = frappe.db.get_value(
@@ -1239,6 +1242,7 @@ class PayrollEntry(Document):
 					timeout=3000,
 					employees=employees,
 					args=args,
+					commit=True,
 				)
 				frappe.msgprint(
 					_("Overtime Slip creation is queued. It may take a few minutes"),
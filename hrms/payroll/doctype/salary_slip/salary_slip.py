@@ -9,7 +9,7 @@ import frappe
 from frappe import _, msgprint
 from frappe.model.naming import make_autoname
 from frappe.query_builder import Order
-from frappe.query_builder.functions import Count, Sum
+from frappe.query_builder.functions import Sum
 from frappe.utils import (
 	add_days,
 	ceil,
@@ -479,6 +479,8 @@ class SalarySlip(TransactionBase):
 			self.payment_days = working_days
 			return
 
+		# attendance is read afresh for every calculation
+		self._attendance = None
 		holidays = self.get_holidays_for_employee(self.start_date, self.end_date)
 		working_days_list = [add_days(getdate(self.start_date), days=day) for day in range(0, working_days)]
 
@@ -561,21 +563,14 @@ class SalarySlip(TransactionBase):
 
 	def get_half_absent_days(self, consider_marked_attendance_on_holidays, holidays):
 		"""Calculates the number of half absent days for an employee within a date range"""
-		Attendance = frappe.qb.DocType("Attendance")
-		query = (
-			frappe.qb.from_(Attendance)
-			.select(Count("*"))
-			.where(
-				(Attendance.attendance_date.between(self.actual_start_date, self.actual_end_date))
-				& (Attendance.employee == self.employee)
-				& (Attendance.docstatus == 1)
-				& (Attendance.status == "Half Day")
-				& (Attendance.half_day_status == "Absent")
-			)
+		skip_holidays = (not consider_marked_attendance_on_holidays) and holidays
+		return sum(
+			1
+			for d in self.get_attendance(self.actual_start_date, self.actual_end_date)
+			if d.status == "Half Day"
+			and d.half_day_status == "Absent"
+			and not (skip_holidays and d.attendance_date in holidays)
 		)
-		if (not consider_marked_attendance_on_holidays) and holidays:
-			query = query.where(Attendance.attendance_date.notin(holidays))
-		return query.run()[0][0]
 
 	def _get_days_outside_period(
 		self, include_holidays_in_total_working_days: bool, holidays: list | None = None
@@ -587,14 +582,7 @@ class SalarySlip(TransactionBase):
 
 			if include_holidays_in_total_working_days:
 				return no_of_days
-			else:
-				days = 0
-				end_date = getdate(end_date)
-				for day in range(no_of_days):
-					date = add_days(end_date, -day)
-					if date not in holidays:
-						days += 1
-				return days
+			return no_of_days - get_holidays_between(holidays, start_date, end_date)
 
 		days = 0
 		if self.actual_start_date != self.start_date:
@@ -606,31 +594,14 @@ class SalarySlip(TransactionBase):
 		return days
 
 	def _get_number_of_holidays(self, holidays: list | None = None) -> float:
-		no_of_holidays = 0
-		actual_end_date = getdate(self.actual_end_date)
-
-		for days in range(date_diff(self.actual_end_date, self.actual_start_date) + 1):
-			date = add_days(actual_end_date, -days)
-			if date in holidays:
-				no_of_holidays += 1
-
-		return no_of_holidays
+		return get_holidays_between(holidays, self.actual_start_date, self.actual_end_date)
 
 	def _get_marked_attendance_days(self, holidays: list | None = None) -> float:
-		Attendance = frappe.qb.DocType("Attendance")
-		query = (
-			frappe.qb.from_(Attendance)
-			.select(Count("*"))
-			.where(
-				(Attendance.attendance_date.between(self.actual_start_date, self.actual_end_date))
-				& (Attendance.employee == self.employee)
-				& (Attendance.docstatus == 1)
-			)
+		return sum(
+			1
+			for d in self.get_attendance(self.actual_start_date, self.actual_end_date)
+			if not (holidays and d.attendance_date in holidays)
 		)
-		if holidays:
-			query = query.where(Attendance.attendance_date.notin(holidays))
-
-		return query.run()[0][0]
 
 	def get_payment_days(self, include_holidays_in_total_working_days):
 		if self.joining_date and self.joining_date > getdate(self.end_date):
@@ -719,25 +690,37 @@ class SalarySlip(TransactionBase):
 		return frappe.cache().get_value(LEAVE_TYPE_MAP, _get_leave_type_map)
 
 	def get_employee_attendance(self, start_date, end_date):
-		attendance = frappe.qb.DocType("Attendance")
+		return [
+			d
+			for d in self.get_attendance(start_date, end_date)
+			if d.status in ("Absent", "Half Day", "On Leave")
+		]
 
-		attendance_details = (
-			frappe.qb.from_(attendance)
-			.select(
-				attendance.attendance_date,
-				attendance.status,
-				attendance.leave_type,
-				attendance.half_day_status,
-			)
-			.where(
-				(attendance.status.isin(["Absent", "Half Day", "On Leave"]))
-				& (attendance.employee == self.employee)
-				& (attendance.docstatus == 1)
-				& (attendance.attendance_date.between(start_date, end_date))
-			)
-		).run(as_dict=1)
+	def get_attendance(self, start_date, end_date) -> list[dict]:
+		"""Returns submitted attendance within the dates. The slip's period is fetched with one query
+		and shared by the working days calculations"""
+		key = (self.employee, getdate(self.start_date), getdate(self.end_date))
+		if not getattr(self, "_attendance", None) or self._attendance[0] != key:
+			Attendance = frappe.qb.DocType("Attendance")
+			attendance = (
+				frappe.qb.from_(Attendance)
+				.select(
+					Attendance.attendance_date,
+					Attendance.status,
+					Attendance.leave_type,
+					Attendance.half_day_status,
+				)
+				.where(
+					(Attendance.employee == self.employee)
+					& (Attendance.docstatus == 1)
+					& (Attendance.attendance_date.between(key[1], key[2]))
+				)
+				.orderby(Attendance.attendance_date)
+			).run(as_dict=True)
+			self._attendance = (key, attendance)
 
-		return attendance_details
+		start_date, end_date = getdate(start_date), getdate(end_date)
+		return [d for d in self._attendance[1] if start_date <= d.attendance_date <= end_date]
 
 	def calculate_lwp_ppl_and_absent_days_based_on_attendance(
 		self, holidays, daily_wages_fraction_for_half_day, consider_marked_attendance_on_holidays
@@ -2152,36 +2135,12 @@ class SalarySlip(TransactionBase):
 
 	def email_salary_slip(self):
 		receiver = frappe.db.get_value("Employee", self.employee, "prefered_email", cache=True)
-		payroll_settings = frappe.get_single("Payroll Settings")
-
-		subject = f"Salary Slip - from {self.start_date} to {self.end_date}"
-		message = _("Please see attachment")
-		if payroll_settings.email_template:
-			email_template = frappe.get_doc("Email Template", payroll_settings.email_template)
-			context = self.as_dict()
-			subject = frappe.render_template(email_template.subject, context)
-			message = frappe.render_template(email_template.response, context)
-
-		password = None
-		if payroll_settings.encrypt_salary_slips_in_emails:
-			password = generate_password_for_pdf(payroll_settings.password_policy, self.employee)
-			if not payroll_settings.email_template:
-				message += "<br>" + _(
-					"Note: Your salary slip is password protected, the password to unlock the PDF is of the format {0}."
-				).format(payroll_settings.password_policy)
-
 		if receiver:
-			email_args = {
-				"sender": payroll_settings.sender_email,
-				"recipients": [receiver],
-				"message": message,
-				"subject": subject,
-				"attachments": [
-					frappe.attach_print(self.doctype, self.name, file_name=self.name, password=password)
-				],
-				"reference_doctype": self.doctype,
-				"reference_name": self.name,
-			}
+			payroll_settings = frappe.get_single("Payroll Settings")
+			attachment = frappe.attach_print(
+				self.doctype, self.name, file_name=self.name, password=self.get_pdf_password(payroll_settings)
+			)
+			email_args = self.get_email_args(receiver, payroll_settings, attachment)
 			if not frappe.flags.in_test:
 				enqueue(method=frappe.sendmail, queue="short", timeout=300, is_async=True, **email_args)
 			else:
@@ -2189,6 +2148,33 @@ class SalarySlip(TransactionBase):
 		else:
 			msgprint(_("{0}: Employee email not found, hence email not sent").format(self.employee_name))
 
+	def get_pdf_password(self, payroll_settings) -> str | None:
+		if payroll_settings.encrypt_salary_slips_in_emails:
+			return generate_password_for_pdf(payroll_settings.password_policy, self.employee)
+
+	def get_email_args(self, receiver: str, payroll_settings, attachment: dict) -> dict:
+		subject = f"Salary Slip - from {self.start_date} to {self.end_date}"
+		message = _("Please see attachment")
+		if payroll_settings.email_template:
+			email_template = frappe.get_cached_doc("Email Template", payroll_settings.email_template)
+			context = self.as_dict()
+			subject = frappe.render_template(email_template.subject, context)
+			message = frappe.render_template(email_template.response, context)
+		elif payroll_settings.encrypt_salary_slips_in_emails:
+			message += "<br>" + _(
+				"Note: Your salary slip is password protected, the password to unlock the PDF is of the format {0}."
+			).format(payroll_settings.password_policy)
+
+		return {
+			"sender": payroll_settings.sender_email,
+			"recipients": [receiver],
+			"message": message,
+			"subject": subject,
+			"attachments": [attachment],
+			"reference_doctype": self.doctype,
+			"reference_name": self.name,
+		}
+
 	def update_status(self, salary_slip=None):
 		for data in self.timesheets:
 			if data.time_sheet:
@@ -2424,6 +2410,11 @@ def unlink_ref_doc_from_salary_slip(doc, method=None):
 			frappe.db.set_value("Salary Slip", ss_doc.name, "journal_entry", "")
 
 
+def get_holidays_between(holidays: list | None, start_date, end_date) -> int:
+	start_date, end_date = getdate(start_date), getdate(end_date)
+	return sum(1 for holiday in holidays or [] if start_date <= getdate(holiday) <= end_date)
+
+
 def generate_password_for_pdf(policy_template, employee):
 	employee = frappe.get_cached_doc("Employee", employee)
 	return policy_template.format(**employee.as_dict())
@@ -0,0 +1,221 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+import hashlib
+import hmac
+from functools import partial
+
+import frappe
+from frappe.utils import cstr
+from frappe.utils.password import get_encryption_key
+
+SALARY_SLIP_DISTRIBUTION = "hrms:salary_slip_distribution"
+SALARY_SLIP_PDF = "hrms:salary_slip_pdf"
+DISTRIBUTION_TTL = 7 * 24 * 60 * 60
+DISTRIBUTION_SHARD_SIZE = 200
+DISTRIBUTION_COMMIT_SIZE = 50
+EMAIL_QUEUE_STATUS = {"Not Sent": "Queued", "Sending": "Queued", "Partially Sent": "Sent"}
+
+
+def enqueue_salary_slip_distribution(payroll_entry: str, salary_slips: list[str]) -> None:
+	"""Renders and emails submitted salary slips in background jobs, one job per shard of slips.
+	Shards run in parallel across the available workers, so slip submission does not wait on PDF rendering
+	"""
+	shards = [
+		salary_slips[idx : idx + DISTRIBUTION_SHARD_SIZE]
+		for idx in range(0, len(salary_slips), DISTRIBUTION_SHARD_SIZE)
+	]
+	frappe.cache().set_value(
+		f"{SALARY_SLIP_DISTRIBUTION}:{payroll_entry}",
+		{"shards": len(shards)},
+		expires_in_sec=DISTRIBUTION_TTL,
+	)
+
+	for shard_idx, shard in enumerate(shards):
+		frappe.enqueue(
+			distribute_salary_slips,
+			queue="long",
+			timeout=3000,
+			payroll_entry=payroll_entry,
+			shard_idx=shard_idx,
+			salary_slips=shard,
+			commit=True,
+			enqueue_after_commit=True,
+		)
+
+
+def distribute_salary_slips(
+	payroll_entry: str, shard_idx: int, salary_slips: list[str], commit: bool = False
+) -> None:
+	"""Stores each slip's PDF as a private file and queues an email that attaches the file by reference"""
+	payroll_settings = frappe.get_single("Payroll Settings")
+	receivers = get_salary_slip_receivers(salary_slips)
+	status = {}
+	savepoint = "before_salary_slip_distribution"
+
+	for idx, name in enumerate(salary_slips, start=1):
+		if not receivers.get(name):
+			status[name] = "No Email"
+			continue
+
+		file = None
+		try:
+			frappe.db.savepoint(savepoint)
+			salary_slip = frappe.get_doc("Salary Slip", name)
+			file = get_salary_slip_pdf(salary_slip, payroll_settings)
+			frappe.sendmail(
+				**salary_slip.get_email_args(receivers[name], payroll_settings, {"fid": file.name})
+			)
+			if file.flags.rendered:
+				if file.flags.replaces:
+					frappe.delete_doc("File", file.flags.replaces, ignore_permissions=True)
+				# later runs reuse the file only once it is committed
+				frappe.db.after_commit.add(
+					partial(
+						frappe.cache().set_value,
+						get_pdf_cache_key(name),
+						file.flags.password_digest,
+						expires_in_sec=DISTRIBUTION_TTL,
+					)
+				)
+		except Exception:
+			frappe.db.rollback(save_point=savepoint)
+			# the rollback drops the new file's record, but not its content on disk
+			if file and file.flags.rendered and not frappe.db.exists("File", {"file_url": file.file_url}):
+				file.delete_file_data_content()
+			frappe.log_error(
+				f"Emailing Salary Slip {name} failed", reference_doctype="Salary Slip", reference_name=name
+			)
+			status[name] = "Failed"
+		else:
+			status[name] = "Queued"
+
+		if commit and idx % DISTRIBUTION_COMMIT_SIZE == 0:
+			frappe.db.commit()  # nosemgrep
+
+	frappe.cache().set_value(
+		f"{SALARY_SLIP_DISTRIBUTION}:{payroll_entry}:{shard_idx}", status, expires_in_sec=DISTRIBUTION_TTL
+	)
+	if commit:
+		frappe.db.commit()  # nosemgrep
+
+
+def get_salary_slip_receivers(salary_slips: list[str]) -> dict:
+	SalarySlip = frappe.qb.DocType("Salary Slip")
+	Employee = frappe.qb.DocType("Employee")
+
+	return dict(
+		frappe.qb.from_(SalarySlip)
+		.inner_join(Employee)
+		.on(SalarySlip.employee == Employee.name)
+		.select(SalarySlip.name, Employee.prefered_email)
+		.where(SalarySlip.name.isin(salary_slips))
+		.run()
+	)
+
+
+def get_salary_slip_pdf(salary_slip, payroll_settings):
+	"""Returns the private file holding the slip's emailed PDF. The stored file is reused only if it was
+	rendered with the same password, otherwise a new one is rendered to replace it"""
+	file_name = f"{salary_slip.name}.pdf"
+	password = salary_slip.get_pdf_password(payroll_settings)
+	password_digest = get_password_digest(password)
+
+	existing_file = frappe.db.get_value(
+		"File",
+		{
+			"attached_to_doctype": salary_slip.doctype,
+			"attached_to_name": salary_slip.name,
+			"file_name": file_name,
+		},
+		order_by="creation desc",
+	)
+	if existing_file and frappe.cache().get_value(get_pdf_cache_key(salary_slip.name)) == password_digest:
+		return frappe.get_doc("File", existing_file)
+
+	pdf = frappe.attach_print(
+		salary_slip.doctype,
+		salary_slip.name,
+		file_name=salary_slip.name,
+		password=password,
+	)
+	file = frappe.get_doc(
+		{
+			"doctype": "File",
+			"file_name": file_name,
+			"attached_to_doctype": salary_slip.doctype,
+			"attached_to_name": salary_slip.name,
+			"is_private": 1,
+			"content": pdf["fcontent"],
+		}
+	).insert(ignore_permissions=True)
+	file.flags.update(rendered=True, replaces=existing_file, password_digest=password_digest)
+
+	return file
+
+
+def get_pdf_cache_key(salary_slip: str) -> str:
+	return f"{SALARY_SLIP_PDF}:{salary_slip}"
+
+
+def get_password_digest(password: str | None) -> str:
+	"""HMAC of the PDF password keyed with the site's encryption key. Passwords are often derived from
+	dates of birth, a plain hash in the shared cache could be reversed by trying every date"""
+	return hmac.new(get_encryption_key().encode(), cstr(password).encode(), hashlib.sha256).hexdigest()
+
+
+@frappe.whitelist()
+def get_salary_slip_distribution_status(payroll_entry: str) -> dict:
+	"""Email delivery status of every submitted salary slip in the payroll entry"""
+	frappe.has_permission("Payroll Entry", "read", payroll_entry, throw=True)
+
+	SalarySlip = frappe.qb.DocType("Salary Slip")
+	EmailQueue = frappe.qb.DocType("Email Queue")
+	salary_slips = frappe.get_all(
+		"Salary Slip",
+		filters={"payroll_entry": payroll_entry, "docstatus": 1},
+		fields=["name", "employee", "employee_name"],
+		order_by="employee",
+	)
+
+	# latest email per slip wins
+	email_status = dict(
+		frappe.qb.from_(EmailQueue)
+		.inner_join(SalarySlip)
+		.on(EmailQueue.reference_name == SalarySlip.name)
+		.select(EmailQueue.reference_name, EmailQueue.status)
+		.where(
+			(EmailQueue.reference_doctype == "Salary Slip")
+			& (SalarySlip.payroll_entry == payroll_entry)
+			& (SalarySlip.docstatus == 1)
+		)
+		.orderby(EmailQueue.creation)
+		.run()
+	)
+	distribution_status = get_distribution_status(payroll_entry)
+
+	summary = {}
+	for slip in salary_slips:
+		if slip.name in email_status:
+			status = email_status[slip.name]
+			slip.status = EMAIL_QUEUE_STATUS.get(status, status)
+		else:
+			slip.status = distribution_status.get(slip.name, "Pending")
+		summary[slip.status] = summary.get(slip.status, 0) + 1
+
+	return {"summary": summary, "salary_slips": salary_slips}
+
+
+def get_distribution_status(payroll_entry: str) -> dict:
+	"""Per slip outcome of the render stage, merged over the shards completed so far"""
+	run = frappe.cache().get_value(f"{SALARY_SLIP_DISTRIBUTION}:{payroll_entry}")
+	if not run:
+		return {}
+
+	status = {}
+	for shard_idx in range(run["shards"]):
+		status.update(
+			frappe.cache().get_value(f"{SALARY_SLIP_DISTRIBUTION}:{payroll_entry}:{shard_idx}") or {}
+		)
+
+	return status
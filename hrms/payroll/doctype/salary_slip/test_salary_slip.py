@@ -2,6 +2,7 @@
 # License: GNU General Public License v3. See license.txt
 
 import calendar
+import hashlib
 import random
 
 import frappe
@@ -45,6 +46,11 @@ from hrms.payroll.doctype.salary_slip.salary_slip import (
 	_safe_eval,
 	make_salary_slip_from_timesheet,
 )
+from hrms.payroll.doctype.salary_slip.salary_slip_distribution import (
+	distribute_salary_slips,
+	get_password_digest,
+	get_pdf_cache_key,
+)
 from hrms.payroll.doctype.salary_structure.salary_structure import make_salary_slip
 from hrms.tests.test_utils import get_email_by_subject, get_first_sunday
 
@@ -902,6 +908,60 @@ class TestSalarySlip(IntegrationTestCase):
 
 		self.assertIsNotNone(get_email_by_subject("Test Salary Slip Email Template"))
 
+	def test_distribute_salary_slips(self):
+		frappe.db.delete("Email Queue")
+
+		emp_id = make_employee("test_email_salary_slip@salary.com", company="_Test Company")
+		ss = make_employee_salary_slip(emp_id, "Monthly", "Test Salary Slip Email")
+		ss.company = "_Test Company"
+		ss.save()
+		ss.submit()
+
+		distribute_salary_slips("_Test Payroll Entry", 0, [ss.name])
+
+		file = frappe.db.get_value(
+			"File",
+			{"attached_to_doctype": "Salary Slip", "attached_to_name": ss.name},
+			["name", "is_private"],
+		)
+		self.assertEqual(file[1], 1)
+		email = frappe.db.get_value(
+			"Email Queue",
+			get_email_by_subject("Salary Slip - from"),
+			["reference_name", "attachments"],
+			as_dict=True,
+		)
+		self.assertEqual(email.reference_name, ss.name)
+		# the pdf is referenced, not embedded in the queued email
+		self.assertIn(file[0], email.attachments)
+
+		def get_files():
+			return frappe.get_all(
+				"File", {"attached_to_doctype": "Salary Slip", "attached_to_name": ss.name}, pluck="name"
+			)
+
+		# committed files are reused while the password settings stay the same
+		frappe.db.after_commit.run()
+		distribute_salary_slips("_Test Payroll Entry", 0, [ss.name])
+		self.assertEqual(get_files(), [file[0]])
+
+		# and replaced by an encrypted one once encryption is enabled
+		frappe.db.set_single_value(
+			"Payroll Settings",
+			{"encrypt_salary_slips_in_emails": 1, "password_policy": "{first_name}-{date_of_birth.year}"},
+		)
+		distribute_salary_slips("_Test Payroll Entry", 0, [ss.name])
+		files = get_files()
+		self.assertEqual(len(files), 1)
+		self.assertNotEqual(files[0], file[0])
+
+		# the cached password is keyed with the site secret, not a plain hash
+		frappe.db.after_commit.run()
+		password = ss.get_pdf_password(frappe.get_single("Payroll Settings"))
+		cached_digest = frappe.cache().get_value(get_pdf_cache_key(ss.name))
+		self.assertEqual(cached_digest, get_password_digest(password))
+		self.assertNotEqual(cached_digest, hashlib.sha256(password.encode()).hexdigest())
+
 	def test_payroll_frequency(self):
 		fiscal_year = get_fiscal_year(nowdate(), company=erpnext.get_default_company())[0]
 		month = "%02d" % getdate(nowdate()).month
@@ -379,6 +379,115 @@ def make_salary_slip(
 		return doc
 
 
+SIMULATION_FIELDS = (
+	"employee",
+	"salary_structure",
+	"currency",
+	"start_date",
+	"end_date",
+	"payroll_frequency",
+	"total_working_days",
+	"payment_days",
+	"gross_pay",
+	"total_deduction",
+	"net_pay",
+	"rounded_total",
+)
+SIMULATION_COMPONENT_FIELDS = ("salary_component", "abbr", "amount", "default_amount")
+
+
+@frappe.whitelist()
+def simulate_salary_slips(scenarios: str | list) -> list[dict]:
+	"""Computes salary slips for what-if scenarios without creating any documents.
+
+	Each scenario is a dict with `employee`, `start_date` and optionally `end_date`, `posting_date`,
+	`salary_structure` (defaults to the assigned structure), `for_preview` (full payment days),
+	`lwp_days_corrected` and `overrides` for salary structure assignment fields like `base` or `variable`.
+	"""
+	frappe.has_permission("Salary Slip", "create", throw=True)
+
+	results = []
+	for scenario in frappe.parse_json(scenarios) or []:
+		try:
+			salary_slip = get_simulated_salary_slip(scenario)
+		except frappe.ValidationError as e:
+			frappe.clear_last_message()
+			results.append({"employee": scenario.get("employee"), "error": str(e)})
+			continue
+
+		result = {field: salary_slip.get(field) for field in SIMULATION_FIELDS}
+		for table in ("earnings", "deductions"):
+			result[table] = [
+				{field: row.get(field) for field in SIMULATION_COMPONENT_FIELDS}
+				for row in salary_slip.get(table)
+			]
+		results.append(result)
+
+	return results
+
+
+def get_simulated_salary_slip(scenario: dict):
+	"""Returns an unsaved Salary Slip computed for the scenario, see `simulate_salary_slips`"""
+	from hrms.payroll.doctype.salary_structure_assignment.salary_structure_assignment import (
+		get_assigned_salary_structure,
+	)
+
+	scenario = frappe._dict(scenario)
+	salary_structure = scenario.salary_structure or get_assigned_salary_structure(
+		scenario.employee, scenario.start_date
+	)
+	if not salary_structure:
+		frappe.throw(
+			_("Salary Structure not assigned for employee {0} for date {1}").format(
+				scenario.employee, scenario.start_date
+			)
+		)
+
+	salary_slip = frappe.new_doc("Salary Slip")
+	salary_slip.update(
+		{
+			"employee": scenario.employee,
+			"salary_structure": salary_structure,
+			"start_date": scenario.start_date,
+			"end_date": scenario.end_date,
+			"posting_date": scenario.posting_date or scenario.end_date or scenario.start_date,
+		}
+	)
+
+	if scenario.overrides:
+		assignment = frappe.db.get_value(
+			"Salary Structure Assignment",
+			{
+				"employee": scenario.employee,
+				"salary_structure": salary_structure,
+				"from_date": ("<=", scenario.end_date or scenario.start_date),
+				"docstatus": 1,
+			},
+			"*",
+			order_by="from_date desc",
+			as_dict=True,
+		)
+		if not assignment:
+			frappe.throw(
+				_(
+					"Please assign a Salary Structure for Employee {0} applicable from or before {1} first"
+				).format(frappe.bold(scenario.employee), frappe.bold(scenario.start_date))
+			)
+
+		# the slip uses this assignment for formulas and tax instead of fetching it again
+		assignment.update(frappe.parse_json(scenario.overrides))
+		salary_slip._salary_structure_assignment = assignment
+
+	return make_salary_slip(
+		salary_structure,
+		salary_slip,
+		scenario.employee,
+		for_preview=cint(scenario.for_preview),
+		ignore_permissions=True,
+		lwp_days_corrected=scenario.lwp_days_corrected,
+	)
+
+
 @frappe.whitelist()
 def get_employees(salary_structure):
 	employees = frappe.get_list(
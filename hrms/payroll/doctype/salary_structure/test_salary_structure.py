@@ -19,7 +19,7 @@ from hrms.payroll.doctype.salary_slip.test_salary_slip import (
 	make_employee_benefit_earning_components,
 	make_employee_salary_slip,
 )
-from hrms.payroll.doctype.salary_structure.salary_structure import make_salary_slip
+from hrms.payroll.doctype.salary_structure.salary_structure import make_salary_slip, simulate_salary_slips
 from hrms.tests.test_utils import create_employee_grade
 
 test_dependencies = ["Fiscal Year"]
@@ -76,6 +76,35 @@ class TestSalaryStructure(IntegrationTestCase):
 
 		self.assertEqual(assignment.base * 0.2, ss.deductions[0].amount)
 
+	def test_simulate_salary_slips(self):
+		emp = make_employee("test_employee_simulation@salary.com")
+
+		sal_struct = make_salary_structure("Salary Structure Simulation", "Monthly", dont_submit=True)
+		sal_struct.earnings = [sal_struct.earnings[0]]
+		sal_struct.earnings[0].amount_based_on_formula = 1
+		sal_struct.earnings[0].formula = "base"
+		sal_struct.deductions = []
+		sal_struct.submit()
+
+		assignment = create_salary_structure_assignment(emp, sal_struct.name)
+		start_date = get_first_day(nowdate())
+
+		results = simulate_salary_slips(
+			[
+				{"employee": emp, "start_date": start_date, "for_preview": 1},
+				{"employee": emp, "start_date": start_date, "for_preview": 1, "overrides": {"base": 80000}},
+				{"employee": "_Test Missing Employee", "start_date": start_date},
+			]
+		)
+
+		self.assertEqual(results[0]["salary_structure"], sal_struct.name)
+		self.assertEqual(results[0]["gross_pay"], assignment.base)
+		self.assertEqual(results[1]["gross_pay"], 80000)
+		self.assertEqual(results[1]["earnings"][0]["amount"], 80000)
+		self.assertTrue(results[2]["error"])
+		# nothing is persisted
+		self.assertFalse(frappe.db.exists("Salary Slip", {"employee": emp}))
+
 	def test_amount_totals(self):
 		frappe.db.set_single_value("Payroll Settings", "include_holidays_in_total_working_days", 0)
 		emp_id = make_employee("test_employee_2@salary.com")
@@ -49,6 +49,32 @@ def before_app_uninstall(app_name):
 	remove_lending_docperms_from_ess()
 
 
+def get_month_day_fields():
+	"""Indexed (month * 100 + day) copies of birth and joining dates for reminder lookups"""
+	return [
+		{
+			"fieldname": "birth_month_day",
+			"fieldtype": "Int",
+			"label": _("Birth Month Day"),
+			"hidden": 1,
+			"read_only": 1,
+			"no_copy": 1,
+			"search_index": 1,
+			"insert_after": "date_of_birth",
+		},
+		{
+			"fieldname": "joining_month_day",
+			"fieldtype": "Int",
+			"label": _("Joining Month Day"),
+			"hidden": 1,
+			"read_only": 1,
+			"no_copy": 1,
+			"search_index": 1,
+			"insert_after": "date_of_joining",
+		},
+	]
+
+
 def get_custom_fields():
 	"""HR specific custom fields that need to be added to the masters in ERPNext"""
 	return {
@@ -282,6 +308,7 @@ def get_custom_fields():
 				"options": "Cost Center",
 				"insert_after": "salary_cb",
 			},
+			*get_month_day_fields(),
 		],
 		"Project": [
 			{
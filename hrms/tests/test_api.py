@@ -0,0 +1,79 @@
+import frappe
+from frappe.utils import add_days, getdate
+
+from erpnext.setup.doctype.employee.test_employee import make_employee
+
+from hrms.api import EMPLOYEE_DIRECTORY, HOME_DASHBOARD, get_employee_directory, get_home_dashboard
+from hrms.hr.doctype.attendance.attendance import insert_attendance_in_bulk, mark_attendance
+from hrms.tests.utils import HRMSTestSuite
+
+
+class TestAPI(HRMSTestSuite):
+	def setUp(self):
+		frappe.cache().delete_keys(HOME_DASHBOARD)
+		self.employee = make_employee("test_api@example.com", company="_Test Company")
+
+	def test_home_dashboard_cache(self):
+		from_date, to_date = add_days(getdate(), -7), getdate()
+
+		def get_dashboard(etag=None):
+			return get_home_dashboard(self.employee, from_date, to_date, etag)
+
+		def is_cached():
+			return frappe.cache().get_value(f"{HOME_DASHBOARD}:{self.employee}") is not None
+
+		dashboard = get_dashboard()
+		self.assertTrue(dashboard["modified"])
+		self.assertEqual(dashboard["data"]["employee"]["name"], self.employee)
+		self.assertTrue(is_cached())
+		self.assertFalse(get_dashboard(dashboard["etag"])["modified"])
+
+		# cleared by the doc events
+		mark_attendance(self.employee, add_days(to_date, -1), "Present")
+		self.assertFalse(is_cached())
+		updated = get_dashboard(dashboard["etag"])
+		self.assertTrue(updated["modified"])
+
+		# and by writes that skip them
+		insert_attendance_in_bulk(
+			[{"employee": self.employee, "attendance_date": add_days(to_date, -2), "status": "Present"}]
+		)
+		self.assertFalse(is_cached())
+		self.assertTrue(get_dashboard(updated["etag"])["modified"])
+
+	def test_employee_directory(self):
+		frappe.cache().delete_value(EMPLOYEE_DIRECTORY)
+		employees = sorted(
+			[self.employee]
+			+ [make_employee(f"test_api{idx}@example.com", company="_Test Company") for idx in range(2)]
+		)
+
+		# pages follow the cursor and are projected to the requested fields
+		first_page = get_employee_directory(search="TEST_API", fields=["employee_name"], page_length=2)
+		self.assertEqual([d["name"] for d in first_page["data"]], employees[:2])
+		self.assertEqual(set(first_page["data"][0]), {"name", "employee_name"})
+		self.assertEqual(first_page["next_cursor"], employees[1])
+
+		next_page = get_employee_directory(search="test_api", cursor=first_page["next_cursor"], page_length=2)
+		self.assertEqual([d["name"] for d in next_page["data"]], employees[2:])
+		self.assertIsNone(next_page["next_cursor"])
+
+		self.assertEqual(get_employee_directory(search="test_api", company="_Test Company 1")["data"], [])
+
+		# lookups of the employees shown on a screen, by ID or user
+		lookup = get_employee_directory(employees=[employees[0]], user_ids=["test_api1@example.com"])
+		self.assertEqual(
+			{d["name"] for d in lookup["data"]},
+			{employees[0], frappe.db.get_value("Employee", {"user_id": "test_api1@example.com"})},
+		)
+
+		# snapshot is refreshed on update, incremental syncs only get the changes
+		employee = frappe.get_doc("Employee", employees[0])
+		employee.first_name = "test_api_renamed"
+		employee.save()
+
+		renamed = get_employee_directory(search="test_api_renamed")["data"]
+		self.assertEqual([d["name"] for d in renamed], [employee.name])
+		changes = get_employee_directory(search="test_api", modified_since=first_page["server_time"])
+		self.assertEqual([d["name"] for d in changes["data"]], [employee.name])
+		self.assertEqual(changes["deleted"], [])
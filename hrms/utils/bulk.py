@@ -0,0 +1,87 @@
+import frappe
+from frappe.model.naming import make_autoname
+from frappe.utils import now_datetime
+
+BULK_INSERT_CHUNK_SIZE = 1000
+NUMERIC_FIELDTYPES = ("Currency", "Int", "Long Int", "Float", "Percent", "Check")
+CHILD_TABLE_FIELDS = ("parent", "parenttype", "parentfield", "idx")
+
+
+def bulk_insert_docs(
+	doctype: str, docs: list[dict], docstatus: int = 0, chunk_size: int = BULK_INSERT_CHUNK_SIZE
+) -> list[str]:
+	"""Inserts documents with multi-row INSERTs, skipping controller methods.
+
+	Meant for high volume paths where the caller has already validated the rows with grouped queries.
+	Names are generated from the doctype's autoname / naming series, standard fields are set for every row.
+	Child table rows passed as lists of dicts under the table fieldname are inserted along with their parents.
+	Names of autoincrement doctypes are left to the database and are not returned.
+	"""
+	if not docs:
+		return []
+
+	meta = frappe.get_meta(doctype)
+	now = now_datetime()
+	user = frappe.session.user
+
+	table_fields = {df.fieldname: df.options for df in meta.get_table_fields()}
+	standard_fields = CHILD_TABLE_FIELDS if meta.istable else ()
+	fields = sorted(
+		{
+			field
+			for doc in docs
+			for field in doc
+			if field in standard_fields or (field not in table_fields and meta.has_field(field))
+		}
+	)
+	autoincrement = meta.autoname == "autoincrement"
+	columns = ["owner", "creation", "modified", "modified_by", "docstatus", *fields]
+	if not autoincrement:
+		columns.insert(0, "name")
+	# numeric columns are not nullable
+	numeric_fields = {
+		field
+		for field in fields
+		if field == "idx" or (meta.has_field(field) and meta.get_field(field).fieldtype in NUMERIC_FIELDTYPES)
+	}
+
+	names, values = [], []
+	child_rows = {}
+	for doc in docs:
+		name = None if autoincrement else doc.get("name") or get_autoname(meta, doc)
+		names.append(name)
+
+		for fieldname, child_doctype in table_fields.items():
+			for idx, row in enumerate(doc.get(fieldname) or [], start=1):
+				child_rows.setdefault(child_doctype, []).append(
+					{**row, "parent": name, "parenttype": doctype, "parentfield": fieldname, "idx": idx}
+				)
+
+		values.append(
+			(
+				*(() if autoincrement else (name,)),
+				user,
+				now,
+				now,
+				user,
+				docstatus,
+				*(doc.get(field) or (0 if field in numeric_fields else None) for field in fields),
+			)
+		)
+
+	frappe.db.bulk_insert(doctype, fields=columns, values=values, chunk_size=chunk_size)
+	for child_doctype, rows in child_rows.items():
+		bulk_insert_docs(child_doctype, rows, docstatus=docstatus, chunk_size=chunk_size)
+
+	return [] if autoincrement else names
+
+
+def get_autoname(meta, doc: dict) -> str:
+	autoname = meta.autoname or ""
+	if not autoname or autoname == "hash":
+		return frappe.generate_hash(length=10)
+
+	if autoname.startswith("naming_series:"):
+		autoname = doc.get("naming_series") or (meta.get_field("naming_series").options or "").split("\n")[0]
+
+	return make_autoname(autoname, meta.name, frappe._dict(doc))
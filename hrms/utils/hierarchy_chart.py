@@ -5,15 +5,24 @@
 import frappe
 from frappe import _
 
+# node methods whose entire tree can be loaded at once, mapped to the method loading it
+ALL_NODES_LOADERS = {
+	"hrms.hr.page.organizational_chart.organizational_chart.get_children": "hrms.hr.page.organizational_chart.organizational_chart.get_all_nodes",
+}
+
 
 @frappe.whitelist()
 def get_all_nodes(method, company):
 	"""Recursively gets all data from nodes"""
+	method_path = method
 	method = frappe.get_attr(method)
 
 	if method not in frappe.whitelisted:
 		frappe.throw(_("Not Permitted"), frappe.PermissionError)
 
+	if loader := ALL_NODES_LOADERS.get(method_path):
+		return frappe.get_attr(loader)(company)
+
 	root_nodes = method(company=company)
 	result = []
 	nodes_to_expand = []